@@ -1,10 +1,16 @@
 """The Govee Razer LED Controller integration."""
 import logging
+import time
+from typing import Optional
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.const import Platform
+from homeassistant.const import CONF_HOST, Platform
 
 from .const import DOMAIN
+from .device_cache import GoveeDeviceCache
+from .governor import GoveeLoadGovernor
+from .health import GoveeLinkMonitor
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,38 +30,57 @@ class GoveeWaveCoordinator:
         self.speed_entity = None
         self.color_flow_entity = None
 
+    @staticmethod
+    def _sync_entity(entity, value: int) -> None:
+        """Push a value into a number entity, writing state once it is added."""
+        entity._value = value
+        if entity.entity_id is not None:
+            entity.async_write_ha_state()
+
     def update_amplitude(self, value: int):
         """Update amplitude and sync entities."""
-        self.amplitude = value
-        if self.amplitude_entity:
-            self.amplitude_entity._value = value
-            self.amplitude_entity.async_write_ha_state()
-        if self.strip_entity:
-            self.strip_entity._amplitude = value
+        self.update_parameters(amplitude=value)
 
     def update_speed(self, value: int):
         """Update speed and sync entities."""
-        self.speed = value
-        if self.speed_entity:
-            self.speed_entity._value = value
-            self.speed_entity.async_write_ha_state()
-        if self.strip_entity:
-            self.strip_entity._speed = value
-            # Update wave steps
-            if value != 0:
-                import math
-                self.strip_entity._wave_steps = round((2 * math.pi / (value / 100)) + 1)
-            else:
-                self.strip_entity._wave_steps = 100
+        self.update_parameters(speed=value)
 
     def update_color_flow_speed(self, value: int):
         """Update color flow speed and sync entities."""
-        self.color_flow_speed = value
-        if self.color_flow_entity:
-            self.color_flow_entity._value = value
-            self.color_flow_entity.async_write_ha_state()
+        self.update_parameters(color_flow_speed=value)
+
+    def update_parameters(
+        self,
+        amplitude: Optional[int] = None,
+        speed: Optional[int] = None,
+        color_flow_speed: Optional[int] = None,
+        brightness: Optional[int] = None,
+    ) -> None:
+        """
+        Update several parameters at once, sync entities and apply them to the strip.
+
+        The strip recomputes its animation once for the whole change.
+        Brightness is not a coordinator value and is passed to the strip as is.
+        """
+        if amplitude is not None:
+            self.amplitude = amplitude
+            if self.amplitude_entity:
+                self._sync_entity(self.amplitude_entity, amplitude)
+        if speed is not None:
+            self.speed = speed
+            if self.speed_entity:
+                self._sync_entity(self.speed_entity, speed)
+        if color_flow_speed is not None:
+            self.color_flow_speed = color_flow_speed
+            if self.color_flow_entity:
+                self._sync_entity(self.color_flow_entity, color_flow_speed)
         if self.strip_entity:
-            self.strip_entity._color_flow_speed = value
+            self.strip_entity.apply_parameters(
+                amplitude=amplitude,
+                speed=speed,
+                color_flow_speed=color_flow_speed,
+                brightness=brightness,
+            )
 
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
@@ -64,22 +89,81 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     return True
 
 
+async def _async_get_device_cache(hass: HomeAssistant) -> GoveeDeviceCache:
+    """Return the shared device cache, loading it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if "device_cache" not in domain_data:
+        cache = GoveeDeviceCache(hass)
+        await cache.async_load()
+        domain_data["device_cache"] = cache
+    return domain_data["device_cache"]
+
+
+async def _async_get_link_monitor(hass: HomeAssistant) -> GoveeLinkMonitor:
+    """Return the shared link monitor, starting it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if "link_monitor" not in domain_data:
+        monitor = GoveeLinkMonitor(hass)
+        await monitor.async_start()
+        domain_data["link_monitor"] = monitor
+    return domain_data["link_monitor"]
+
+
+def _get_load_governor(hass: HomeAssistant) -> GoveeLoadGovernor:
+    """Return the shared load governor, starting it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if "governor" not in domain_data:
+        governor = GoveeLoadGovernor(hass)
+        governor.async_start()
+        domain_data["governor"] = governor
+    return domain_data["governor"]
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Govee Razer LED from a config entry."""
+    setup_start = time.perf_counter()
     hass.data.setdefault(DOMAIN, {})
-    
+
+    # Use the last-known address and model for instant setup
+    cache = await _async_get_device_cache(hass)
+    device = cache.update(entry.data[CONF_HOST])
+
+    # Link health is shared by all strips, and device scans share its listener
+    monitor = await _async_get_link_monitor(hass)
+    # So is load shedding
+    _get_load_governor(hass)
+
     # Create coordinator for this entry
     coordinator = GoveeWaveCoordinator()
     hass.data[DOMAIN][entry.entry_id] = {
         "config": entry.data,
         "coordinator": coordinator,
+        "device": device,
     }
 
+    # Refresh the cache in the background without holding up startup
+    if cache.needs_refresh:
+        configured_hosts = [
+            config_entry.data[CONF_HOST]
+            for config_entry in hass.config_entries.async_entries(DOMAIN)
+        ]
+        entry.async_create_background_task(
+            hass,
+            cache.async_refresh(configured_hosts, monitor),
+            f"{DOMAIN}_device_cache_refresh",
+        )
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     
     # Register update listener for options changes
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
+    _LOGGER.debug(
+        "Set up %s in %.1f ms",
+        entry.title,
+        (time.perf_counter() - setup_start) * 1000,
+    )
+
     return True
 
 
@@ -95,4 +179,19 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
 
+        # Stop shared services with the last entry
+        if not any(
+            other.entry_id in hass.data[DOMAIN]
+            for other in hass.config_entries.async_entries(DOMAIN)
+        ):
+            monitor = hass.data[DOMAIN].pop("link_monitor", None)
+            if monitor is not None:
+                monitor.async_stop()
+            governor = hass.data[DOMAIN].pop("governor", None)
+            if governor is not None:
+                governor.async_stop()
+            pool = hass.data[DOMAIN].pop("render_pool", None)
+            if pool is not None:
+                pool.shutdown()
+
     return unload_ok
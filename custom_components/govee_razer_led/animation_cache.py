@@ -0,0 +1,125 @@
+"""Cache of encoded packets for periodic animations.
+
+With a static effect, the brightness wave and the color flow repeat after a
+fixed number of frames. Each strip fills a cycle buffer with the encoded
+packets of one full cycle, then replays it. Cycles for all strips share one
+memory cap and are evicted least recently used first.
+"""
+import collections
+import logging
+from typing import Hashable, Optional
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class GoveeAnimationCycle:
+    """Encoded packets for one animation cycle, stored back to back."""
+
+    __slots__ = ("signature", "frame_count", "_slots", "_data", "_stride")
+
+    def __init__(self, signature: Hashable, frame_count: int):
+        """Initialize an empty cycle."""
+        self.signature = signature
+        self.frame_count = frame_count
+        self._slots: dict = {}
+        self._data = bytearray()
+        self._stride = 0
+
+    @property
+    def nbytes(self) -> int:
+        """Return the memory used by the packet buffer."""
+        return len(self._data)
+
+    @property
+    def complete(self) -> bool:
+        """Return true once every frame of the cycle is cached."""
+        return len(self._slots) >= self.frame_count
+
+    def get(self, state: Hashable) -> Optional[bytes]:
+        """Return the cached packet for an animation state."""
+        index = self._slots.get(state)
+        if index is None:
+            return None
+        offset = index * self._stride
+        return bytes(self._data[offset:offset + self._stride])
+
+    def put(self, state: Hashable, packet: bytes) -> int:
+        """Store a packet; returns the number of bytes added."""
+        if state in self._slots:
+            return 0
+        if not self._stride:
+            self._stride = len(packet)
+        elif len(packet) != self._stride:
+            # Packets of one cycle all have the same length
+            return 0
+        self._slots[state] = len(self._slots)
+        self._data += packet
+        return len(packet)
+
+
+class GoveeAnimationCache:
+    """Per-strip animation cycles under a shared memory cap."""
+
+    def __init__(self, max_bytes: int, max_frames: int):
+        """Initialize the cache."""
+        self._max_bytes = max_bytes
+        self._max_frames = max_frames
+        self._cycles: collections.OrderedDict = collections.OrderedDict()
+        self._nbytes = 0
+
+    @property
+    def nbytes(self) -> int:
+        """Return the memory used by all cached cycles."""
+        return self._nbytes
+
+    def cycle(
+        self, strip_id: str, signature: Hashable, frame_count: int
+    ) -> Optional[GoveeAnimationCycle]:
+        """
+        Return the cycle for a strip, replacing it if the signature changed.
+
+        Args:
+            strip_id: Unique strip identifier
+            signature: All parameters the animation depends on
+            frame_count: Number of distinct frames in one cycle
+
+        Returns:
+            The strip's cycle, or None if the cycle is too long to cache
+        """
+        if frame_count > self._max_frames:
+            self.invalidate(strip_id)
+            return None
+
+        cycle = self._cycles.get(strip_id)
+        if cycle is not None and cycle.signature == signature:
+            self._cycles.move_to_end(strip_id)
+            return cycle
+
+        self.invalidate(strip_id)
+        cycle = self._cycles[strip_id] = GoveeAnimationCycle(signature, frame_count)
+        return cycle
+
+    def put(self, strip_id: str, state: Hashable, packet: bytes) -> None:
+        """Store a packet in a strip's cycle, evicting other strips if needed."""
+        cycle = self._cycles.get(strip_id)
+        if cycle is None:
+            return
+        self._nbytes += cycle.put(state, packet)
+
+        while self._nbytes > self._max_bytes and len(self._cycles) > 1:
+            evict_id = next(iter(self._cycles))
+            if evict_id == strip_id:
+                self._cycles.move_to_end(strip_id)
+                continue
+            _LOGGER.debug("Evicting animation cycle of %s", evict_id)
+            self.invalidate(evict_id)
+
+        if self._nbytes > self._max_bytes:
+            # A single cycle larger than the cap is not worth keeping
+            self.invalidate(strip_id)
+
+    def invalidate(self, strip_id: str) -> None:
+        """Drop the cycle of a strip."""
+        cycle = self._cycles.pop(strip_id, None)
+        if cycle is not None:
+            self._nbytes -= cycle.nbytes
@@ -0,0 +1,119 @@
+"""Color blending between section colors.
+
+Blend modes:
+
+- ``srgb``: straight interpolation of the sRGB byte values (the classic
+  behavior; dark and muddy through the middle of saturated pairs)
+- ``linear``: interpolation in linear light, which keeps the perceived
+  brightness of a blend between its endpoints
+- ``oklab``: interpolation in the OKLab perceptual color space, which also
+  keeps hue and saturation even
+
+Blends are produced as ramps of packed RGB bytes and cached by endpoint
+colors, so a ramp is only computed again when the palette changes and the
+per-frame cost is the same for every mode.
+"""
+import functools
+import math
+
+from .const import BLEND_LINEAR, BLEND_OKLAB
+
+# sRGB byte value -> linear light
+_TO_LINEAR = tuple(
+    c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4
+    for c in (value / 255.0 for value in range(256))
+)
+
+
+def _to_srgb(value: float) -> int:
+    """Encode a linear light value as an sRGB byte."""
+    if value <= 0.0:
+        return 0
+    if value >= 1.0:
+        return 255
+    if value <= 0.0031308:
+        encoded = value * 12.92
+    else:
+        encoded = 1.055 * value ** (1 / 2.4) - 0.055
+    return int(encoded * 255 + 0.5)
+
+
+def _cbrt(value: float) -> float:
+    """Return the real cube root."""
+    return math.copysign(abs(value) ** (1 / 3), value)
+
+
+def _to_oklab(rgb: bytes) -> tuple:
+    """Convert an sRGB color to OKLab."""
+    r, g, b = (_TO_LINEAR[c] for c in rgb)
+    l_ = _cbrt(0.4122214708 * r + 0.5363325363 * g + 0.0514459929 * b)
+    m_ = _cbrt(0.2119034982 * r + 0.6806995451 * g + 0.1073969566 * b)
+    s_ = _cbrt(0.0883024619 * r + 0.2817188376 * g + 0.6299787005 * b)
+    return (
+        0.2104542553 * l_ + 0.7936177850 * m_ - 0.0040720468 * s_,
+        1.9779984951 * l_ - 2.4285922050 * m_ + 0.4505937099 * s_,
+        0.0259040371 * l_ + 0.7827717662 * m_ - 0.8086757660 * s_,
+    )
+
+
+def _from_oklab(lab: tuple) -> tuple:
+    """Convert an OKLab color to sRGB bytes, clipping to the gamut."""
+    lightness, a, b = lab
+    l = (lightness + 0.3963377774 * a + 0.2158037573 * b) ** 3
+    m = (lightness - 0.1055613458 * a - 0.0638541728 * b) ** 3
+    s = (lightness - 0.0894841775 * a - 1.2914855480 * b) ** 3
+    return (
+        _to_srgb(4.0767416621 * l - 3.3077115913 * m + 0.2309699292 * s),
+        _to_srgb(-1.2684380046 * l + 2.6097574011 * m - 0.3413193965 * s),
+        _to_srgb(-0.0041960863 * l - 0.7034186147 * m + 1.7076147010 * s),
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def blend_ramp(mode: str, start: bytes, end: bytes, steps: int) -> bytes:
+    """
+    Return a ramp of steps colors from start towards end.
+
+    Color j of the ramp is the blend at fraction j / steps, so the ramp
+    starts at start and stops one step short of end, ready to be followed
+    by the next ramp.
+
+    Args:
+        mode: BLEND_SRGB, BLEND_LINEAR or BLEND_OKLAB
+        start: Start color, 3 bytes (R, G, B)
+        end: End color, 3 bytes (R, G, B)
+        steps: Number of colors
+
+    Returns:
+        steps * 3 bytes
+    """
+    ramp = bytearray(steps * 3)
+    if steps <= 0:
+        return bytes(ramp)
+    ramp[0:3] = start
+    r0, g0, b0 = start
+    r1, g1, b1 = end
+
+    if mode == BLEND_LINEAR:
+        lin0 = [_TO_LINEAR[c] for c in start]
+        lin1 = [_TO_LINEAR[c] for c in end]
+        for j in range(1, steps):
+            f = j / steps
+            ramp[j * 3:j * 3 + 3] = bytes(
+                _to_srgb(c0 + (c1 - c0) * f) for c0, c1 in zip(lin0, lin1)
+            )
+    elif mode == BLEND_OKLAB:
+        lab0 = _to_oklab(start)
+        lab1 = _to_oklab(end)
+        for j in range(1, steps):
+            f = j / steps
+            ramp[j * 3:j * 3 + 3] = bytes(
+                _from_oklab(tuple(c0 + (c1 - c0) * f for c0, c1 in zip(lab0, lab1)))
+            )
+    else:
+        for j in range(1, steps):
+            base = j * 3
+            ramp[base] = int(r0 + (r1 - r0) * j / steps)
+            ramp[base + 1] = int(g0 + (g1 - g0) * j / steps)
+            ramp[base + 2] = int(b0 + (b1 - b0) * j / steps)
+    return bytes(ramp)
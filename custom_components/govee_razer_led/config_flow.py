@@ -12,19 +12,79 @@ from .const import (
     CONF_NUM_LEDS,
     CONF_NUM_SECTIONS,
     CONF_UPDATE_INTERVAL,
+    CONF_KEEPALIVE_INTERVAL,
+    CONF_RENDER_BACKEND,
+    CONF_INGEST_PORT,
+    CONF_RECEIVER,
+    CONF_RECEIVER_UNIVERSE,
+    CONF_RECEIVER_START,
+    CONF_LAYOUT,
+    CONF_MATRIX_WIDTH,
+    CONF_MATRIX_SERPENTINE,
+    CONF_SEGMENTS,
+    CONF_BLEND_MODE,
+    CONF_PRIORITY,
+    CONF_EFFECT_TRANSITION,
     DEFAULT_PORT,
     DEFAULT_NUM_LEDS,
     DEFAULT_NUM_SECTIONS,
     DEFAULT_UPDATE_INTERVAL,
+    DEFAULT_KEEPALIVE_INTERVAL,
+    DEFAULT_RENDER_BACKEND,
+    DEFAULT_INGEST_PORT,
+    DEFAULT_RECEIVER,
+    DEFAULT_RECEIVER_UNIVERSE,
+    DEFAULT_RECEIVER_START,
+    DEFAULT_LAYOUT,
+    DEFAULT_MATRIX_WIDTH,
+    DEFAULT_MATRIX_SERPENTINE,
+    DEFAULT_SEGMENTS,
+    DEFAULT_BLEND_MODE,
+    BLEND_MODES,
+    DEFAULT_PRIORITY,
+    PRIORITIES,
+    DEFAULT_EFFECT_TRANSITION,
+    MAX_EFFECT_TRANSITION,
+    LAYOUT_SEGMENTS,
+    LAYOUTS,
+    RENDER_BACKENDS,
+    RECEIVERS,
+    MAX_RECEIVER_UNIVERSE,
+    MAX_RECEIVER_START,
+    RECEIVER_CHANNELS,
     MIN_SECTIONS,
     MAX_SECTIONS,
     MIN_UPDATE_INTERVAL,
     MAX_UPDATE_INTERVAL,
+    MIN_KEEPALIVE_INTERVAL,
+    MAX_KEEPALIVE_INTERVAL,
 )
+from .geometry import parse_segments
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _segments_valid(user_input: dict) -> bool:
+    """Return false if the segments layout is selected with an invalid segment list."""
+    if user_input.get(CONF_LAYOUT) != LAYOUT_SEGMENTS:
+        return True
+    try:
+        parse_segments(user_input.get(CONF_SEGMENTS, DEFAULT_SEGMENTS))
+    except ValueError:
+        return False
+    return True
+
+
+def _receiver_valid(user_input: dict) -> bool:
+    """Return false if the strip's channels run past the receiver protocol's limit."""
+    channels = RECEIVER_CHANNELS.get(user_input.get(CONF_RECEIVER, DEFAULT_RECEIVER))
+    if channels is None:
+        return True
+    start = user_input.get(CONF_RECEIVER_START, DEFAULT_RECEIVER_START)
+    num_leds = user_input.get(CONF_NUM_LEDS, DEFAULT_NUM_LEDS)
+    return start - 1 + num_leds * 3 <= channels
+
+
 class GoveeRazerLEDConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Govee Razer LED."""
 
@@ -41,6 +101,10 @@ class GoveeRazerLEDConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 host = user_input[CONF_HOST]
                 if not host:
                     errors["base"] = "invalid_host"
+                elif not _segments_valid(user_input):
+                    errors[CONF_SEGMENTS] = "invalid_segments"
+                elif not _receiver_valid(user_input):
+                    errors[CONF_RECEIVER_START] = "invalid_receiver_range"
                 else:
                     # Create a unique ID based on host
                     await self.async_set_unique_id(host)
@@ -73,6 +137,44 @@ class GoveeRazerLEDConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     cv.positive_float,
                     vol.Range(min=MIN_UPDATE_INTERVAL, max=MAX_UPDATE_INTERVAL),
                 ),
+                vol.Optional(
+                    CONF_KEEPALIVE_INTERVAL, default=DEFAULT_KEEPALIVE_INTERVAL
+                ): vol.All(
+                    cv.positive_int,
+                    vol.Range(min=MIN_KEEPALIVE_INTERVAL, max=MAX_KEEPALIVE_INTERVAL),
+                ),
+                vol.Optional(
+                    CONF_RENDER_BACKEND, default=DEFAULT_RENDER_BACKEND
+                ): vol.In(RENDER_BACKENDS),
+                vol.Optional(CONF_INGEST_PORT, default=DEFAULT_INGEST_PORT): vol.Any(
+                    0, cv.port
+                ),
+                vol.Optional(CONF_RECEIVER, default=DEFAULT_RECEIVER): vol.In(RECEIVERS),
+                vol.Optional(
+                    CONF_RECEIVER_UNIVERSE, default=DEFAULT_RECEIVER_UNIVERSE
+                ): vol.All(cv.positive_int, vol.Range(min=1, max=MAX_RECEIVER_UNIVERSE)),
+                vol.Optional(
+                    CONF_RECEIVER_START, default=DEFAULT_RECEIVER_START
+                ): vol.All(cv.positive_int, vol.Range(min=1, max=MAX_RECEIVER_START)),
+                vol.Optional(CONF_LAYOUT, default=DEFAULT_LAYOUT): vol.In(LAYOUTS),
+                vol.Optional(
+                    CONF_MATRIX_WIDTH, default=DEFAULT_MATRIX_WIDTH
+                ): vol.All(cv.positive_int, vol.Range(min=1, max=100)),
+                vol.Optional(
+                    CONF_MATRIX_SERPENTINE, default=DEFAULT_MATRIX_SERPENTINE
+                ): cv.boolean,
+                vol.Optional(CONF_SEGMENTS, default=DEFAULT_SEGMENTS): cv.string,
+                vol.Optional(CONF_BLEND_MODE, default=DEFAULT_BLEND_MODE): vol.In(
+                    BLEND_MODES
+                ),
+                vol.Optional(CONF_PRIORITY, default=DEFAULT_PRIORITY): vol.In(
+                    PRIORITIES
+                ),
+                vol.Optional(
+                    CONF_EFFECT_TRANSITION, default=DEFAULT_EFFECT_TRANSITION
+                ): vol.All(
+                    vol.Coerce(float), vol.Range(min=0, max=MAX_EFFECT_TRANSITION)
+                ),
             }
         )
 
@@ -96,7 +198,12 @@ class GoveeRazerLEDOptionsFlowHandler(config_entries.OptionsFlow):
 
     async def async_step_init(self, user_input=None):
         """Manage the options."""
-        if user_input is not None:
+        errors = {}
+        if user_input is not None and not _segments_valid(user_input):
+            errors[CONF_SEGMENTS] = "invalid_segments"
+        elif user_input is not None and not _receiver_valid(user_input):
+            errors[CONF_RECEIVER_START] = "invalid_receiver_range"
+        elif user_input is not None:
             # Update the config entry with new values
             self.hass.config_entries.async_update_entry(
                 self._config_entry,
@@ -117,6 +224,58 @@ class GoveeRazerLEDOptionsFlowHandler(config_entries.OptionsFlow):
             CONF_UPDATE_INTERVAL,
             self._config_entry.data.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
         )
+        current_keepalive_interval = self._config_entry.options.get(
+            CONF_KEEPALIVE_INTERVAL,
+            self._config_entry.data.get(CONF_KEEPALIVE_INTERVAL, DEFAULT_KEEPALIVE_INTERVAL)
+        )
+        current_render_backend = self._config_entry.options.get(
+            CONF_RENDER_BACKEND,
+            self._config_entry.data.get(CONF_RENDER_BACKEND, DEFAULT_RENDER_BACKEND)
+        )
+        current_ingest_port = self._config_entry.options.get(
+            CONF_INGEST_PORT,
+            self._config_entry.data.get(CONF_INGEST_PORT, DEFAULT_INGEST_PORT)
+        )
+        current_receiver = self._config_entry.options.get(
+            CONF_RECEIVER,
+            self._config_entry.data.get(CONF_RECEIVER, DEFAULT_RECEIVER)
+        )
+        current_receiver_universe = self._config_entry.options.get(
+            CONF_RECEIVER_UNIVERSE,
+            self._config_entry.data.get(CONF_RECEIVER_UNIVERSE, DEFAULT_RECEIVER_UNIVERSE)
+        )
+        current_receiver_start = self._config_entry.options.get(
+            CONF_RECEIVER_START,
+            self._config_entry.data.get(CONF_RECEIVER_START, DEFAULT_RECEIVER_START)
+        )
+        current_layout = self._config_entry.options.get(
+            CONF_LAYOUT,
+            self._config_entry.data.get(CONF_LAYOUT, DEFAULT_LAYOUT)
+        )
+        current_matrix_width = self._config_entry.options.get(
+            CONF_MATRIX_WIDTH,
+            self._config_entry.data.get(CONF_MATRIX_WIDTH, DEFAULT_MATRIX_WIDTH)
+        )
+        current_matrix_serpentine = self._config_entry.options.get(
+            CONF_MATRIX_SERPENTINE,
+            self._config_entry.data.get(CONF_MATRIX_SERPENTINE, DEFAULT_MATRIX_SERPENTINE)
+        )
+        current_segments = self._config_entry.options.get(
+            CONF_SEGMENTS,
+            self._config_entry.data.get(CONF_SEGMENTS, DEFAULT_SEGMENTS)
+        )
+        current_blend_mode = self._config_entry.options.get(
+            CONF_BLEND_MODE,
+            self._config_entry.data.get(CONF_BLEND_MODE, DEFAULT_BLEND_MODE)
+        )
+        current_priority = self._config_entry.options.get(
+            CONF_PRIORITY,
+            self._config_entry.data.get(CONF_PRIORITY, DEFAULT_PRIORITY)
+        )
+        current_effect_transition = self._config_entry.options.get(
+            CONF_EFFECT_TRANSITION,
+            self._config_entry.data.get(CONF_EFFECT_TRANSITION, DEFAULT_EFFECT_TRANSITION)
+        )
 
         data_schema = vol.Schema(
             {
@@ -135,7 +294,66 @@ class GoveeRazerLEDOptionsFlowHandler(config_entries.OptionsFlow):
                     cv.positive_float,
                     vol.Range(min=MIN_UPDATE_INTERVAL, max=MAX_UPDATE_INTERVAL),
                 ),
+                vol.Optional(
+                    CONF_KEEPALIVE_INTERVAL,
+                    default=current_keepalive_interval,
+                ): vol.All(
+                    cv.positive_int,
+                    vol.Range(min=MIN_KEEPALIVE_INTERVAL, max=MAX_KEEPALIVE_INTERVAL),
+                ),
+                vol.Optional(
+                    CONF_RENDER_BACKEND,
+                    default=current_render_backend,
+                ): vol.In(RENDER_BACKENDS),
+                vol.Optional(
+                    CONF_INGEST_PORT,
+                    default=current_ingest_port,
+                ): vol.Any(0, cv.port),
+                vol.Optional(
+                    CONF_RECEIVER,
+                    default=current_receiver,
+                ): vol.In(RECEIVERS),
+                vol.Optional(
+                    CONF_RECEIVER_UNIVERSE,
+                    default=current_receiver_universe,
+                ): vol.All(cv.positive_int, vol.Range(min=1, max=MAX_RECEIVER_UNIVERSE)),
+                vol.Optional(
+                    CONF_RECEIVER_START,
+                    default=current_receiver_start,
+                ): vol.All(cv.positive_int, vol.Range(min=1, max=MAX_RECEIVER_START)),
+                vol.Optional(
+                    CONF_LAYOUT,
+                    default=current_layout,
+                ): vol.In(LAYOUTS),
+                vol.Optional(
+                    CONF_MATRIX_WIDTH,
+                    default=current_matrix_width,
+                ): vol.All(cv.positive_int, vol.Range(min=1, max=100)),
+                vol.Optional(
+                    CONF_MATRIX_SERPENTINE,
+                    default=current_matrix_serpentine,
+                ): cv.boolean,
+                vol.Optional(
+                    CONF_SEGMENTS,
+                    default=current_segments,
+                ): cv.string,
+                vol.Optional(
+                    CONF_BLEND_MODE,
+                    default=current_blend_mode,
+                ): vol.In(BLEND_MODES),
+                vol.Optional(
+                    CONF_PRIORITY,
+                    default=current_priority,
+                ): vol.In(PRIORITIES),
+                vol.Optional(
+                    CONF_EFFECT_TRANSITION,
+                    default=current_effect_transition,
+                ): vol.All(
+                    vol.Coerce(float), vol.Range(min=0, max=MAX_EFFECT_TRANSITION)
+                ),
             }
         )
 
-        return self.async_show_form(step_id="init", data_schema=data_schema)
+        return self.async_show_form(
+            step_id="init", data_schema=data_schema, errors=errors
+        )
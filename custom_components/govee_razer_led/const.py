@@ -6,12 +6,38 @@ DOMAIN = "govee_razer_led"
 CONF_NUM_LEDS = "num_leds"
 CONF_NUM_SECTIONS = "num_sections"
 CONF_UPDATE_INTERVAL = "update_interval"
+CONF_KEEPALIVE_INTERVAL = "keepalive_interval"
+CONF_RENDER_BACKEND = "render_backend"
+CONF_INGEST_PORT = "ingest_port"
+CONF_RECEIVER = "receiver"
+CONF_RECEIVER_UNIVERSE = "receiver_universe"
+CONF_RECEIVER_START = "receiver_start"
+CONF_LAYOUT = "layout"
+CONF_MATRIX_WIDTH = "matrix_width"
+CONF_MATRIX_SERPENTINE = "matrix_serpentine"
+CONF_SEGMENTS = "segments"
+CONF_BLEND_MODE = "blend_mode"
+CONF_PRIORITY = "priority"
+CONF_EFFECT_TRANSITION = "effect_transition"
 
 # Default values
 DEFAULT_PORT = 4003
 DEFAULT_NUM_LEDS = 10
 DEFAULT_NUM_SECTIONS = 5
 DEFAULT_UPDATE_INTERVAL = 0.05
+DEFAULT_KEEPALIVE_INTERVAL = 30
+DEFAULT_RENDER_BACKEND = "inline"
+DEFAULT_INGEST_PORT = 0  # 0 = disabled
+DEFAULT_RECEIVER = "none"
+DEFAULT_RECEIVER_UNIVERSE = 1
+DEFAULT_RECEIVER_START = 1
+DEFAULT_LAYOUT = "strip"
+DEFAULT_MATRIX_WIDTH = 10
+DEFAULT_MATRIX_SERPENTINE = False
+DEFAULT_SEGMENTS = ""
+DEFAULT_BLEND_MODE = "srgb"
+DEFAULT_PRIORITY = "normal"
+DEFAULT_EFFECT_TRANSITION = 0.5  # Seconds, 0 = hard cut
 DEFAULT_BRIGHTNESS = 128
 DEFAULT_AMPLITUDE = 50
 DEFAULT_SPEED = 30
@@ -22,18 +48,146 @@ MIN_SECTIONS = 2
 MAX_SECTIONS = 10
 MIN_UPDATE_INTERVAL = 0.01
 MAX_UPDATE_INTERVAL = 1.0
+MIN_KEEPALIVE_INTERVAL = 5
+MAX_KEEPALIVE_INTERVAL = 50  # Device times out after 60 s
+MAX_EFFECT_TRANSITION = 10.0
+
+# Device cache
+DEVICE_CACHE_STORAGE_KEY = f"{DOMAIN}.devices"
+DEVICE_CACHE_STORAGE_VERSION = 1
+DEVICE_CACHE_TTL = 7 * 24 * 3600  # Evict devices not seen for a week
+DEVICE_CACHE_REFRESH_INTERVAL = 3600  # Rescan the LAN at most hourly
+DEVICE_CACHE_SAVE_DELAY = 10
+
+# Link health
+HEALTH_POLL_INTERVAL = 10  # Seconds between devStatus queries
+HEALTH_RTT_ALPHA = 0.3  # Smoothing factor for round-trip time
+HEALTH_LOSS_ALPHA = 0.2  # Smoothing factor for loss estimate
+
+# Render backends
+RENDER_BACKEND_INLINE = "inline"
+RENDER_BACKEND_PROCESS = "process"
+RENDER_BACKENDS = [RENDER_BACKEND_INLINE, RENDER_BACKEND_PROCESS]
+RENDER_POOL_WORKERS = 2
+RENDER_QUEUE_DEPTH = 4  # Pre-rendered frames buffered per strip
+
+# Animation cache
+ANIMATION_CACHE_MAX_BYTES = 8 * 1024 * 1024  # Shared by all strips
+ANIMATION_CACHE_MAX_FRAMES = 2000  # Longer cycles are rendered live
+
+# Frame streaming
+STREAM_HOLD = 1.0  # Seconds after the last streamed frame before effects resume
+STREAM_MIN_INTERVAL = 1 / 60  # Streamed frames are sent at most 60 times per second
+STREAM_LATENCY_ALPHA = 0.1  # Smoothing factor for ingest-to-send latency
+
+# Lighting protocol receivers (E1.31/sACN, DDP)
+RECEIVER_NONE = "none"
+RECEIVER_E131 = "e131"
+RECEIVER_DDP = "ddp"
+RECEIVERS = [RECEIVER_NONE, RECEIVER_E131, RECEIVER_DDP]
+RECEIVER_TICK = 1 / 60  # Coalescing window in seconds
+MAX_RECEIVER_UNIVERSE = 63999
+# Channels a strip can be mapped into: one DMX universe for E1.31; DDP
+# offsets are 32-bit, capped to bound the shared frame buffer
+RECEIVER_CHANNELS = {RECEIVER_E131: 512, RECEIVER_DDP: 1 << 20}
+MAX_RECEIVER_START = max(RECEIVER_CHANNELS.values())
+
+# LED geometry
+LAYOUT_STRIP = "strip"
+LAYOUT_MATRIX = "matrix"
+LAYOUT_SEGMENTS = "segments"
+LAYOUTS = [LAYOUT_STRIP, LAYOUT_MATRIX, LAYOUT_SEGMENTS]
+# Unit step per LED of a segment run; y grows downwards
+SEGMENT_DIRECTIONS = {
+    "right": (1, 0),
+    "down": (0, 1),
+    "left": (-1, 0),
+    "up": (0, -1),
+}
+
+# Color blending
+BLEND_SRGB = "srgb"
+BLEND_LINEAR = "linear"
+BLEND_OKLAB = "oklab"
+BLEND_MODES = [BLEND_SRGB, BLEND_LINEAR, BLEND_OKLAB]
+
+# Load shedding; priorities from first to last degraded
+PRIORITIES = ["low", "normal", "high"]
+# Degradation levels of a strip, applied one step at a time
+LOAD_NORMAL = 0
+LOAD_REDUCED_FPS = 1  # Frame interval multiplied by GOVERNOR_FPS_DIVISOR
+LOAD_WAVE_FROZEN = 2  # Also holds the wave phase
+LOAD_STATIC = 3  # Also holds the last frame instead of rendering
+LOAD_LEVELS = ["normal", "reduced_fps", "wave_frozen", "static"]
+GOVERNOR_SAMPLE_INTERVAL = 0.1  # Seconds between event loop lag samples
+GOVERNOR_EVAL_SAMPLES = 10  # Lag samples per evaluation
+GOVERNOR_LAG_HIGH = 0.02  # Mean loop lag in seconds that counts as overload
+GOVERNOR_LAG_LOW = 0.005  # Mean loop lag in seconds that counts as headroom
+GOVERNOR_LOAD_HIGH = 0.5  # Share of loop time spent rendering: overload
+GOVERNOR_LOAD_LOW = 0.25  # Share of loop time spent rendering: headroom
+GOVERNOR_SEND_HIGH = 0.05  # Mean send time in seconds (executor queue backed up)
+GOVERNOR_SEND_LOW = 0.01
+GOVERNOR_RESTORE_EVALS = 5  # Evaluations with headroom before restoring a step
+GOVERNOR_FPS_DIVISOR = 2
+GOVERNOR_HISTORY = 20  # Actions kept for diagnostics
+
+# Frame recording
+RECORDINGS_DIR = "govee_razer_led_recordings"  # Under the config directory
+RECORDING_EXTENSION = ".gvrec"
+RECORDING_MAX_BYTES = 64 * 1024 * 1024  # Recording stops at this size
+RECORDING_FLUSH_BYTES = 64 * 1024  # Buffered bytes before a write
+
+# Profiling
+PROFILES_DIR = "govee_razer_led_profiles"  # Under the config directory
+DEFAULT_PROFILE_DURATION = 10  # Seconds
+MAX_PROFILE_DURATION = 120
+
+# Scene presets
+PRESET_STORAGE_KEY = f"{DOMAIN}.presets"
+PRESET_STORAGE_VERSION = 1
+PRESET_SAVE_DELAY = 1
+
+# Restore
+RESTORE_STAGGER = 0.1  # Seconds between restored strip start-ups
 
 # Effects
 EFFECT_DOUBLE = "double"
 EFFECT_MIRROR = "mirror"
 EFFECT_STRETCHED = "stretched"
+EFFECT_RAINBOW = "rainbow"
+EFFECT_CHASE = "chase"
+EFFECT_TWINKLE = "twinkle"
+EFFECT_FIRE = "fire"
+EFFECT_RIPPLE = "ripple"
 
-EFFECTS = [EFFECT_DOUBLE, EFFECT_MIRROR, EFFECT_STRETCHED]
+EFFECTS = [
+    EFFECT_DOUBLE,
+    EFFECT_MIRROR,
+    EFFECT_STRETCHED,
+    EFFECT_RAINBOW,
+    EFFECT_CHASE,
+    EFFECT_TWINKLE,
+    EFFECT_FIRE,
+    EFFECT_RIPPLE,
+]
 
 # Services
 SERVICE_SET_WAVE = "set_wave"
+SERVICE_PUSH_FRAME = "push_frame"
+SERVICE_SET_PARAMETERS = "set_parameters"
+SERVICE_START_RECORDING = "start_recording"
+SERVICE_STOP_RECORDING = "stop_recording"
+SERVICE_PROFILE = "profile"
+SERVICE_SAVE_PRESET = "save_preset"
+SERVICE_ACTIVATE_PRESET = "activate_preset"
+SERVICE_DELETE_PRESET = "delete_preset"
 
 # Service parameters
 ATTR_AMPLITUDE = "amplitude"
 ATTR_SPEED = "speed"
 ATTR_COLOR_FLOW_SPEED = "color_flow_speed"
+ATTR_FRAME = "frame"
+ATTR_FILENAME = "filename"
+ATTR_DURATION = "duration"
+ATTR_MEMORY = "memory"
+ATTR_PRESET = "preset"
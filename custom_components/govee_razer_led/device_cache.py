@@ -0,0 +1,123 @@
+"""Persistent cache of Govee device addresses and models.
+
+Records hold what the LAN scan response reports: the device id, used to
+follow a device across address changes, the model (sku) and the hardware
+and firmware versions.
+"""
+import logging
+import time
+from typing import Iterable, Optional
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DEVICE_CACHE_REFRESH_INTERVAL,
+    DEVICE_CACHE_SAVE_DELAY,
+    DEVICE_CACHE_STORAGE_KEY,
+    DEVICE_CACHE_STORAGE_VERSION,
+    DEVICE_CACHE_TTL,
+)
+from .health import GoveeLinkMonitor
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class GoveeDeviceCache:
+    """Cache discovered devices across restarts in an HA Store."""
+
+    def __init__(self, hass: HomeAssistant):
+        """Initialize the cache."""
+        self.hass = hass
+        self._store = Store(hass, DEVICE_CACHE_STORAGE_VERSION, DEVICE_CACHE_STORAGE_KEY)
+        self._devices: dict = {}
+        self._last_refresh = 0.0
+        self._refreshing = False
+
+    async def async_load(self) -> None:
+        """Load cached devices from storage."""
+        data = await self._store.async_load()
+        if data:
+            self._devices = data.get("devices", {})
+            self._last_refresh = data.get("last_refresh", 0.0)
+        _LOGGER.debug("Loaded %d cached devices", len(self._devices))
+
+    def get(self, host: str) -> Optional[dict]:
+        """Return the cached record for a configured host."""
+        return self._devices.get(host)
+
+    def update(self, host: str, **fields) -> dict:
+        """Merge fields into the record for a host and schedule a save."""
+        record = self._devices.setdefault(host, {"address": host})
+        if any(record.get(key) != value for key, value in fields.items()):
+            record.update(fields)
+            self._async_schedule_save()
+        return record
+
+    @property
+    def needs_refresh(self) -> bool:
+        """Return true if the background refresh is due."""
+        return (
+            not self._refreshing
+            and time.time() - self._last_refresh > DEVICE_CACHE_REFRESH_INTERVAL
+        )
+
+    async def async_refresh(
+        self, configured_hosts: Iterable[str], monitor: GoveeLinkMonitor
+    ) -> None:
+        """Rescan the LAN, update known devices and evict stale ones."""
+        if self._refreshing:
+            return
+        self._refreshing = True
+        try:
+            found = await monitor.async_scan()
+        finally:
+            self._refreshing = False
+        if found is None:
+            # The scan did not run; keep the last-known records and retry
+            # with the next setup
+            return
+
+        now = time.time()
+        self._last_refresh = now
+        by_device_id = {
+            record["device"]: host
+            for host, record in self._devices.items()
+            if record.get("device")
+        }
+
+        for ip, data in found.items():
+            device_id = data.get("device")
+            # Match by device id first so DHCP address changes are followed
+            host = by_device_id.get(device_id, ip)
+            if host not in self._devices and host not in configured_hosts:
+                continue
+            self.update(
+                host,
+                address=ip,
+                device=device_id,
+                sku=data.get("sku"),
+                hardware_version=data.get("wifiVersionHard"),
+                firmware_version=data.get("wifiVersionSoft"),
+                last_seen=now,
+            )
+
+        configured = set(configured_hosts)
+        for host in list(self._devices):
+            record = self._devices[host]
+            if host in configured and "last_seen" not in record:
+                continue
+            if now - record.get("last_seen", 0) > DEVICE_CACHE_TTL:
+                _LOGGER.debug("Evicting stale cached device %s", host)
+                del self._devices[host]
+
+        self._async_schedule_save()
+        _LOGGER.debug("Device cache refreshed: %d devices found", len(found))
+
+    def _async_schedule_save(self) -> None:
+        """Schedule a delayed write of the cache."""
+        self._store.async_delay_save(self._data_to_save, DEVICE_CACHE_SAVE_DELAY)
+
+    def _data_to_save(self) -> dict:
+        """Return the data to persist."""
+        return {"devices": self._devices, "last_refresh": self._last_refresh}
@@ -0,0 +1,51 @@
+"""Diagnostics support for Govee Razer LED."""
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    domain_data = hass.data[DOMAIN]
+    entry_data = domain_data.get(entry.entry_id, {})
+    device = entry_data.get("device") or {}
+
+    link = None
+    monitor = domain_data.get("link_monitor")
+    if monitor is not None:
+        health = monitor.get(device.get("address", entry.data[CONF_HOST]))
+        if health is not None:
+            link = health.as_dict()
+
+    stream = None
+    recording = None
+    presets = None
+    coordinator = entry_data.get("coordinator")
+    if coordinator is not None and coordinator.strip_entity is not None:
+        stream = coordinator.strip_entity.stream_stats
+        recording = coordinator.strip_entity.recording_stats
+        presets = coordinator.strip_entity.preset_stats
+
+    governor = domain_data.get("governor")
+
+    receivers = {
+        protocol: receiver.as_dict()
+        for protocol, receiver in domain_data.get("receivers", {}).items()
+    }
+
+    return {
+        "config": dict(entry.data),
+        "device": device,
+        "link": link,
+        "stream": stream,
+        "receivers": receivers,
+        "recording": recording,
+        "presets": presets,
+        "governor": None if governor is None else governor.as_dict(),
+    }
@@ -0,0 +1,391 @@
+"""Effect engine for Govee Razer LED strips.
+
+Effects render RGB triplets straight into a preallocated frame buffer
+(``bytearray`` of ``num_leds * 3``) for a given time ``t`` in seconds. The
+palette is a contiguous buffer too, 3 bytes per section.
+Static effects depend only on the palette, so callers may reuse their last
+frame until the palette changes.
+
+Spatial effects (rainbow, ripple) place colors by the physical LED positions
+of the effect's geometry instead of the LED index, so they follow a matrix or
+a strip bent around corners. The other effects lay the palette out along a
+line: the wiring order of a strip, or the columns of a matrix.
+"""
+import colorsys
+import math
+import random
+
+from .blend import blend_ramp
+from .const import (
+    BLEND_SRGB,
+    EFFECT_CHASE,
+    EFFECT_DOUBLE,
+    EFFECT_FIRE,
+    EFFECT_MIRROR,
+    EFFECT_RAINBOW,
+    EFFECT_RIPPLE,
+    EFFECT_STRETCHED,
+    EFFECT_TWINKLE,
+    LAYOUT_MATRIX,
+    LAYOUT_STRIP,
+)
+from .geometry import GoveeGeometry, get_geometry, get_numpy
+
+EFFECT_REGISTRY: dict = {}
+
+
+def register_effect(cls):
+    """Class decorator adding an effect to the registry."""
+    if not cls.name:
+        raise ValueError(f"{cls.__name__} has no effect name")
+    if "frame_budget_us" not in cls.__dict__:
+        raise ValueError(f"{cls.__name__} must declare a frame_budget_us benchmark entry")
+    EFFECT_REGISTRY[cls.name] = cls
+    return cls
+
+
+def create_effect(name: str) -> "GoveeEffect":
+    """Create an effect instance by name, falling back to stretched."""
+    return EFFECT_REGISTRY.get(name, EFFECT_REGISTRY[EFFECT_STRETCHED])()
+
+
+def _fill(frame: bytearray, start: int, count: int, color: bytes) -> None:
+    """Fill count LEDs starting at LED index start with one 3-byte color."""
+    frame[start * 3:(start + count) * 3] = color * count
+
+
+class GoveeEffect:
+    """Base class for effects."""
+
+    name = ""
+    # Animated effects change with t; static ones only with the palette
+    animated = False
+    # Send with the device's gradient mode enabled
+    gradient = False
+    # Benchmark entry: max render time in microseconds for 100 LEDs, 10
+    # sections; about twice the time measured by scripts/bench_effects.py
+    frame_budget_us = 0.0
+    # LED positions, set by the color manager; None means a straight strip
+    geometry = None
+    # Blend mode for effects that blend section colors, set by the color manager
+    blend = BLEND_SRGB
+    # Spatial effects place colors by LED position themselves
+    spatial = False
+    # One line of column colors, for non-spatial effects on a matrix
+    _line = None
+
+    def geometry_for(self, num_leds: int) -> GoveeGeometry:
+        """Return the geometry to render num_leds LEDs with."""
+        geometry = self.geometry
+        if geometry is None or geometry.num_leds != num_leds:
+            geometry = get_geometry(LAYOUT_STRIP, num_leds)
+        return geometry
+
+    def render(self, frame: bytearray, palette: bytes, num_leds: int, t: float) -> None:
+        """
+        Render one frame.
+
+        Args:
+            frame: Buffer of at least num_leds * 3 bytes to write into
+            palette: Section colors, 3 bytes (R, G, B) per section
+            num_leds: Number of LEDs to render
+            t: Time in seconds since the effect started
+        """
+        raise NotImplementedError
+
+    def render_layout(self, frame: bytearray, palette: bytes, num_leds: int, t: float) -> None:
+        """
+        Render one frame on the effect's geometry.
+
+        On a matrix, non-spatial effects render one color per column and
+        each LED takes the color of its column, so the palette runs across
+        the physical width instead of zig-zagging along a serpentine wiring.
+        Strips and bent strips are rendered along the wiring.
+        """
+        geometry = self.geometry
+        if (
+            self.spatial
+            or geometry is None
+            or geometry.layout != LAYOUT_MATRIX
+            or geometry.num_leds != num_leds
+        ):
+            self.render(frame, palette, num_leds, t)
+            return
+
+        line = self._line
+        if line is None or len(line) != geometry.width * 3:
+            line = self._line = bytearray(geometry.width * 3)
+        self.render(line, palette, geometry.width, t)
+        arrays = geometry.arrays
+        if arrays is not None:
+            np = get_numpy()
+            colors = np.frombuffer(line, dtype=np.uint8).reshape(-1, 3)
+            frame[:num_leds * 3] = colors[arrays["columns"]].tobytes()
+            return
+        for i, column in enumerate(geometry.columns):
+            frame[i * 3:i * 3 + 3] = line[column * 3:column * 3 + 3]
+
+
+@register_effect
+class DoubleEffect(GoveeEffect):
+    """Repeat the section colors twice across the strip."""
+
+    name = EFFECT_DOUBLE
+    frame_budget_us = 40.0
+
+    def render(self, frame, palette, num_leds, t):
+        """Render the doubled palette."""
+        leds_per_section = (num_leds // 2) // (len(palette) // 3)
+        pos = 0
+        for _ in range(2):
+            for i in range(0, len(palette), 3):
+                _fill(frame, pos, leds_per_section, palette[i:i + 3])
+                pos += leds_per_section
+        _fill(frame, pos, num_leds - pos, palette[:3])
+
+
+@register_effect
+class MirrorEffect(GoveeEffect):
+    """Mirror the section colors around the middle of the strip."""
+
+    name = EFFECT_MIRROR
+    frame_budget_us = 40.0
+
+    def render(self, frame, palette, num_leds, t):
+        """Render the mirrored palette."""
+        num_sections = len(palette) // 3
+        leds_per_section = num_leds // (2 * num_sections)
+        pos = 0
+        order = list(range(num_sections))
+        for i in order + order[::-1]:
+            _fill(frame, pos, leds_per_section, palette[i * 3:i * 3 + 3])
+            pos += leds_per_section
+        _fill(frame, pos, num_leds - pos, palette[:3])
+
+
+@register_effect
+class StretchedEffect(GoveeEffect):
+    """Interpolate smoothly between section colors."""
+
+    name = EFFECT_STRETCHED
+    gradient = True
+    frame_budget_us = 60.0
+
+    def render(self, frame, palette, num_leds, t):
+        """Render the interpolated palette."""
+        num_sections = len(palette) // 3
+        steps = num_leds // num_sections - 1
+        pos = 0
+        for i in range(num_sections):
+            if steps <= 0:
+                break
+            j1 = (i + 1) % num_sections * 3
+            # Ramps are cached per color pair until the palette changes
+            ramp = blend_ramp(
+                self.blend, bytes(palette[i * 3:i * 3 + 3]), bytes(palette[j1:j1 + 3]), steps
+            )
+            count = min(steps, num_leds - pos)
+            frame[pos * 3:(pos + count) * 3] = ramp[:count * 3]
+            pos += count
+        if pos < num_leds:
+            _fill(frame, pos, 1, palette[-3:])
+            pos += 1
+        _fill(frame, pos, num_leds - pos, palette[:3])
+
+
+@register_effect
+class RainbowEffect(GoveeEffect):
+    """Scroll a full hue cycle across the layout, ignoring the palette."""
+
+    name = EFFECT_RAINBOW
+    animated = True
+    spatial = True
+    frame_budget_us = 330.0
+
+    # Hue cycles per second
+    SPEED = 0.1
+
+    def render(self, frame, palette, num_leds, t):
+        """Render the rainbow for time t."""
+        offset = t * self.SPEED
+        geometry = self.geometry_for(num_leds)
+        arrays = geometry.arrays
+        if arrays is not None:
+            self._render_vectorized(frame, arrays, num_leds, offset)
+            return
+
+        # Hue runs along x, and diagonally on a matrix
+        xs = geometry.x
+        ys = geometry.y
+        for i in range(num_leds):
+            r, g, b = colorsys.hsv_to_rgb((offset + xs[i] + ys[i]) % 1.0, 1.0, 1.0)
+            base = i * 3
+            frame[base] = int(r * 255)
+            frame[base + 1] = int(g * 255)
+            frame[base + 2] = int(b * 255)
+
+    @staticmethod
+    def _render_vectorized(frame, arrays: dict, num_leds: int, offset: float) -> None:
+        """Render the rainbow with numpy (same formula as colorsys)."""
+        np = get_numpy()
+        hue = (offset + arrays["x"] + arrays["y"]) % 1.0
+        sector = (hue * 6.0).astype(np.intp)
+        f = hue * 6.0 - sector
+        rise = f
+        fall = 1.0 - f
+        one = np.ones_like(hue)
+        zero = np.zeros_like(hue)
+        sector %= 6
+        conditions = [sector == k for k in range(6)]
+        rgb = np.empty((num_leds, 3))
+        rgb[:, 0] = np.select(conditions, [one, fall, zero, zero, rise, one])
+        rgb[:, 1] = np.select(conditions, [rise, one, one, fall, zero, zero])
+        rgb[:, 2] = np.select(conditions, [zero, zero, rise, one, one, fall])
+        frame[:num_leds * 3] = (rgb * 255).astype(np.uint8).tobytes()
+
+
+@register_effect
+class ChaseEffect(GoveeEffect):
+    """Move blocks of section colors along the strip."""
+
+    name = EFFECT_CHASE
+    animated = True
+    frame_budget_us = 160.0
+
+    # LEDs moved per second
+    SPEED = 8.0
+
+    def render(self, frame, palette, num_leds, t):
+        """Render the chase for time t."""
+        num_sections = len(palette) // 3
+        block = max(1, num_leds // num_sections)
+        shift = int(t * self.SPEED)
+        for i in range(num_leds):
+            section = ((i - shift) // block) % num_sections * 3
+            base = i * 3
+            frame[base:base + 3] = palette[section:section + 3]
+
+
+@register_effect
+class TwinkleEffect(GoveeEffect):
+    """Let each LED fade in and out in its section color at its own phase."""
+
+    name = EFFECT_TWINKLE
+    animated = True
+    frame_budget_us = 410.0
+
+    # Twinkles per LED per second
+    RATE = 0.5
+
+    def __init__(self):
+        """Initialize per-LED phases (deterministic, so frames depend only on t)."""
+        self._phases: list = []
+
+    def render(self, frame, palette, num_leds, t):
+        """Render the twinkle for time t."""
+        if len(self._phases) != num_leds:
+            rng = random.Random(num_leds)
+            self._phases = [rng.random() for _ in range(num_leds)]
+        num_sections = len(palette) // 3
+        leds_per_section = max(1, num_leds // num_sections)
+        for i in range(num_leds):
+            level = math.sin(2 * math.pi * (t * self.RATE + self._phases[i]))
+            scale = level * level if level > 0 else 0.0
+            section = min(i // leds_per_section, num_sections - 1) * 3
+            r, g, b = palette[section:section + 3]
+            base = i * 3
+            frame[base] = int(r * scale)
+            frame[base + 1] = int(g * scale)
+            frame[base + 2] = int(b * scale)
+
+
+@register_effect
+class FireEffect(GoveeEffect):
+    """Flickering fire simulation rising from the start of the strip."""
+
+    name = EFFECT_FIRE
+    animated = True
+    frame_budget_us = 630.0
+
+    COOLING = 55
+    SPARKING = 120
+    # Simulation steps per second
+    RATE = 30.0
+
+    def __init__(self):
+        """Initialize the heat map."""
+        self._heat: list = []
+        self._rng = random.Random(0)
+        self._step = 0
+
+    def _simulate(self, num_leds: int) -> None:
+        """Advance the heat simulation by one step."""
+        heat = self._heat
+        rng = self._rng
+        max_cooling = (self.COOLING * 10) // num_leds + 2
+        for i in range(num_leds):
+            heat[i] = max(0, heat[i] - rng.randint(0, max_cooling))
+        for i in range(num_leds - 1, 1, -1):
+            heat[i] = (heat[i - 1] + 2 * heat[i - 2]) // 3
+        if rng.randint(0, 255) < self.SPARKING:
+            spark = rng.randint(0, min(6, num_leds - 1))
+            heat[spark] = min(255, heat[spark] + rng.randint(160, 255))
+
+    def render(self, frame, palette, num_leds, t):
+        """Render the fire for time t."""
+        if len(self._heat) != num_leds:
+            self._heat = [0] * num_leds
+            self._step = 0
+        target = int(t * self.RATE)
+        # Catch up at most a few steps so a long pause does not stall the frame
+        if target - self._step > 4:
+            self._step = target - 4
+        while self._step < target:
+            self._simulate(num_leds)
+            self._step += 1
+        for i, value in enumerate(self._heat):
+            # Black -> red -> yellow -> white heat ramp
+            third = (value * 191) // 255
+            ramp = (third & 0x3F) << 2
+            base = i * 3
+            if third > 0x80:
+                frame[base:base + 3] = bytes((255, 255, ramp))
+            elif third > 0x40:
+                frame[base:base + 3] = bytes((255, ramp, 0))
+            else:
+                frame[base:base + 3] = bytes((ramp, 0, 0))
+
+
+@register_effect
+class RippleEffect(GoveeEffect):
+    """Rings of section colors spreading out from the center of the layout."""
+
+    name = EFFECT_RIPPLE
+    animated = True
+    spatial = True
+    frame_budget_us = 170.0
+
+    # Palette repeats from the center to the farthest LED
+    REPEATS = 1.0
+    # Rings moved outwards per second
+    SPEED = 4.0
+
+    def render(self, frame, palette, num_leds, t):
+        """Render the ripple for time t."""
+        num_sections = len(palette) // 3
+        geometry = self.geometry_for(num_leds)
+        scale = self.REPEATS * num_sections
+        shift = t * self.SPEED
+        arrays = geometry.arrays
+        if arrays is not None:
+            np = get_numpy()
+            rings = np.floor(arrays["distance"] * scale - shift).astype(np.intp)
+            colors = np.frombuffer(palette, dtype=np.uint8).reshape(-1, 3)
+            frame[:num_leds * 3] = colors[rings % num_sections].tobytes()
+            return
+
+        distance = geometry.distance
+        for i in range(num_leds):
+            section = math.floor(distance[i] * scale - shift) % num_sections * 3
+            base = i * 3
+            frame[base:base + 3] = palette[section:section + 3]
@@ -0,0 +1,45 @@
+"""Fleet-wide parameter changes landing on a shared frame boundary.
+
+A change sent to many strips at once (e.g. one service call targeting 30
+strips) is staged on every strip with the same apply time. Each strip
+applies it on its first frame at or after that time, so all strips switch
+within one frame of each other and restart the wave and color flow in phase.
+"""
+from typing import Optional
+
+
+class GoveeFleetCoordinator:
+    """Hand out shared frame boundaries for parameter broadcasts."""
+
+    def __init__(self):
+        """Initialize the coordinator."""
+        self._intervals: dict = {}
+        self._boundary: Optional[float] = None
+
+    def register(self, strip_id: str, update_interval: float) -> None:
+        """Track a strip's frame interval."""
+        self._intervals[strip_id] = update_interval
+
+    def unregister(self, strip_id: str) -> None:
+        """Stop tracking a strip."""
+        self._intervals.pop(strip_id, None)
+
+    @property
+    def window(self) -> float:
+        """Return the longest frame interval of the fleet."""
+        return max(self._intervals.values(), default=0.0)
+
+    def boundary(self, now: float) -> float:
+        """
+        Return the apply time for a change staged at now.
+
+        Changes staged before the open boundary passes share it; the boundary
+        lies one fleet frame ahead, so every running strip still has its
+        frame for it ahead of it.
+
+        Args:
+            now: Current time.monotonic() value
+        """
+        if self._boundary is None or now >= self._boundary:
+            self._boundary = now + self.window
+        return self._boundary
@@ -0,0 +1,198 @@
+"""Physical LED geometry for strips, matrices and bent strips.
+
+A geometry maps each LED index to a position in LED units: a straight strip
+runs along x, a matrix (curtain, panel) is laid out row by row, optionally
+wired serpentine, and a segmented strip follows a list of runs bending
+around corners. Coordinate tables are computed once per geometry and shared
+by every strip using it; effects and the brightness wave read them instead
+of the LED index.
+
+numpy is optional. When it is installed, non-strip geometries also provide
+arrays for vectorized rendering; it is imported on first use.
+"""
+import functools
+import math
+from typing import Optional
+
+from .const import LAYOUT_MATRIX, LAYOUT_SEGMENTS, LAYOUT_STRIP, SEGMENT_DIRECTIONS
+
+_numpy = None
+
+
+def get_numpy():
+    """Return the numpy module, or None when it is not installed."""
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+        except ImportError:
+            _numpy = False
+        else:
+            _numpy = numpy
+    return _numpy or None
+
+
+def parse_segments(text: str) -> tuple:
+    """
+    Parse a segment list such as ``"30:right,20:down,30:left"``.
+
+    Returns:
+        Tuple of (length, direction) pairs
+
+    Raises:
+        ValueError: If the text is not a valid segment list
+    """
+    segments = []
+    for part in text.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        length, _, direction = part.partition(":")
+        direction = direction.strip().lower()
+        if direction not in SEGMENT_DIRECTIONS:
+            raise ValueError(f"Unknown segment direction: {direction!r}")
+        try:
+            count = int(length)
+        except ValueError:
+            raise ValueError(f"Invalid segment length: {length!r}") from None
+        if count < 1:
+            raise ValueError(f"Invalid segment length: {length!r}")
+        segments.append((count, direction))
+    if not segments:
+        raise ValueError("No segments given")
+    return tuple(segments)
+
+
+def _matrix_positions(num_leds: int, width: int, serpentine: bool) -> list:
+    """Return LED positions of a matrix wired row by row."""
+    positions = []
+    for i in range(num_leds):
+        row, col = divmod(i, width)
+        if serpentine and row % 2:
+            col = width - 1 - col
+        positions.append((col, row))
+    return positions
+
+
+def _segment_positions(num_leds: int, segments: tuple) -> list:
+    """Return LED positions along a strip bent into segments."""
+    positions = []
+    x = y = 0
+    dx, dy = SEGMENT_DIRECTIONS[segments[0][1]]
+    for length, direction in segments:
+        if len(positions) == num_leds:
+            break
+        dx, dy = SEGMENT_DIRECTIONS[direction]
+        for _ in range(min(length, num_leds - len(positions))):
+            positions.append((x, y))
+            x += dx
+            y += dy
+    # LEDs beyond the listed segments continue the last run
+    while len(positions) < num_leds:
+        positions.append((x, y))
+        x += dx
+        y += dy
+    min_x = min(px for px, _ in positions)
+    min_y = min(py for _, py in positions)
+    return [(px - min_x, py - min_y) for px, py in positions]
+
+
+class GoveeGeometry:
+    """Precomputed LED coordinates of one layout.
+
+    Attributes:
+        x, y: Position of each LED, normalized to [0, 1) by the number of
+            columns and rows; a straight strip has x = i / num_leds, y = 0
+        columns: Column of each LED in LED units (x * width)
+        distance: Distance of each LED from the center, normalized to [0, 1]
+        wave_phases: Brightness wave phase of each LED, one full period
+            across the physical width
+    """
+
+    __slots__ = (
+        "layout",
+        "num_leds",
+        "width",
+        "height",
+        "x",
+        "y",
+        "columns",
+        "distance",
+        "wave_phases",
+        "_arrays",
+    )
+
+    def __init__(self, layout: str, num_leds: int, positions: list):
+        """Initialize the coordinate tables from LED positions in LED units."""
+        self.layout = layout
+        self.num_leds = num_leds
+        self.width = max(px for px, _ in positions) + 1
+        self.height = max(py for _, py in positions) + 1
+        self.x = tuple(px / self.width for px, _ in positions)
+        self.y = tuple(py / self.height for _, py in positions)
+        self.columns = tuple(px for px, _ in positions)
+
+        center_x = (self.width - 1) / 2
+        center_y = (self.height - 1) / 2
+        radius = math.hypot(center_x, center_y) or 1.0
+        self.distance = tuple(
+            math.hypot(px - center_x, py - center_y) / radius for px, py in positions
+        )
+
+        # Same expression as the index-based wave, so strips render unchanged
+        extent = max(self.width - 1, 1)
+        self.wave_phases = tuple((2 * math.pi * px) / extent for px, _ in positions)
+        self._arrays: Optional[dict] = None
+
+    @property
+    def is_strip(self) -> bool:
+        """Return true for a straight strip."""
+        return self.layout == LAYOUT_STRIP
+
+    @property
+    def arrays(self) -> Optional[dict]:
+        """
+        Return the coordinate tables as numpy arrays for vectorized rendering.
+
+        Returns None for straight strips, which keep the exact scalar path,
+        and when numpy is not installed.
+        """
+        if self._arrays is None and not self.is_strip:
+            np = get_numpy()
+            if np is not None:
+                self._arrays = {
+                    "x": np.array(self.x),
+                    "y": np.array(self.y),
+                    "columns": np.array(self.columns, dtype=np.intp),
+                    "distance": np.array(self.distance),
+                    "wave_phases": np.array(self.wave_phases),
+                }
+        return self._arrays
+
+
+@functools.lru_cache(maxsize=32)
+def get_geometry(
+    layout: str = LAYOUT_STRIP,
+    num_leds: int = 1,
+    width: int = 0,
+    serpentine: bool = False,
+    segments: tuple = (),
+) -> GoveeGeometry:
+    """
+    Return the shared geometry for a layout.
+
+    Args:
+        layout: LAYOUT_STRIP, LAYOUT_MATRIX or LAYOUT_SEGMENTS
+        num_leds: Number of LEDs
+        width: Matrix columns (matrix layout)
+        serpentine: Matrix rows alternate direction (matrix layout)
+        segments: (length, direction) runs (segments layout)
+    """
+    if layout == LAYOUT_MATRIX and width > 0:
+        positions = _matrix_positions(num_leds, width, serpentine)
+    elif layout == LAYOUT_SEGMENTS and segments:
+        positions = _segment_positions(num_leds, segments)
+    else:
+        layout = LAYOUT_STRIP
+        positions = [(i, 0) for i in range(num_leds)]
+    return GoveeGeometry(layout, num_leds, positions)
@@ -6,39 +6,137 @@ import socket
 import time
 from typing import Optional
 
+from .blend import blend_ramp
+from .const import BLEND_SRGB, LAYOUT_STRIP
+from .effects import GoveeEffect, create_effect
+from .geometry import GoveeGeometry, get_geometry
+
 _LOGGER = logging.getLogger(__name__)
 
+# Govee LAN API discovery
+SCAN_MULTICAST_ADDR = "239.255.255.250"
+SCAN_PORT = 4001
+SCAN_RESPONSE_PORT = 4002
+SCAN_MULTICAST_TTL = 2
+SCAN_REQUEST = json.dumps(
+    {"msg": {"cmd": "scan", "data": {"account_topic": "reserve"}}}
+).encode("utf-8")
+
+
+def scan_devices(timeout: float = 2.0) -> Optional[dict]:
+    """
+    Discover Govee devices on the LAN using the multicast scan request.
+
+    Binds its own listener on the response port, so this is only used when
+    the link monitor, which normally owns that port, is not listening.
+
+    Args:
+        timeout: Seconds to wait for scan responses
+
+    Returns:
+        Dict mapping device IP to the scan response data, or None if the
+        scan could not run (e.g. the response port is taken)
+    """
+    devices = {}
+    listener = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        listener.bind(("", SCAN_RESPONSE_PORT))
+        listener.settimeout(0.2)
+        sender.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, SCAN_MULTICAST_TTL)
+        sender.sendto(SCAN_REQUEST, (SCAN_MULTICAST_ADDR, SCAN_PORT))
+
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                payload, _addr = listener.recvfrom(1024)
+            except socket.timeout:
+                continue
+            try:
+                data = json.loads(payload)["msg"]["data"]
+            except (ValueError, KeyError, TypeError):
+                continue
+            if "ip" in data:
+                devices[data["ip"]] = data
+    except OSError as err:
+        _LOGGER.warning("Device scan failed: %s", err)
+        return None
+    finally:
+        listener.close()
+        sender.close()
+
+    return devices
+
 
 class GoveeProtocol:
     """Handle Govee Razer UDP protocol communication."""
 
     # Protocol constants
     MAGIC_BYTE = 0xBB
-    EXTENDED_SIZE = 0x00
     CMD_ENABLE = 0xB1
     CMD_LED_DATA = 0xB0
 
-    def __init__(self, host: str, port: int = 4003):
+    # JSON wrapper around the base64 packet, as produced by json.dumps
+    JSON_PREFIX = b'{"msg": {"cmd": "razer", "data": {"pt": "'
+    JSON_SUFFIX = b'"}}}'
+
+    # Keep-alive defaults (device reverts to app control after 60 s)
+    DEFAULT_KEEPALIVE_INTERVAL = 30
+
+    __slots__ = (
+        "host",
+        "port",
+        "keepalive_interval",
+        "last_enable_time",
+        "next_enable_time",
+        "_socket",
+        "_frame_packet",
+    )
+
+    def __init__(
+        self,
+        host: str,
+        port: int = 4003,
+        keepalive_interval: float = DEFAULT_KEEPALIVE_INTERVAL,
+    ):
         """Initialize the Govee protocol handler."""
         self.host = host
         self.port = port
-        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        self.last_enable_time = 0
+        self._socket: Optional[socket.socket] = None
+        self._frame_packet: Optional[bytearray] = None
+        self.keepalive_interval = keepalive_interval
+        # Monotonic timestamps, immune to wall-clock adjustments
+        self.last_enable_time = 0.0
+        self.next_enable_time = 0.0
+
+    @property
+    def socket(self) -> socket.socket:
+        """Return the UDP socket, creating it on first use."""
+        if self._socket is None:
+            self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        return self._socket
 
     def _checksum(self, data: bytes) -> int:
         """Calculate XOR checksum for the data."""
-        chksum = 0
-        for byte in data:
-            chksum ^= byte
-        return chksum
+        # Fold the bytes as one integer: XOR the upper half onto the lower
+        # half until a single byte is left
+        value = int.from_bytes(data, "little")
+        size = len(data)
+        while size > 1:
+            half = (size + 1) // 2
+            value = (value >> (half * 8)) ^ (value & ((1 << (half * 8)) - 1))
+            size = half
+        return value
 
     def _create_packet(self, command: int, data: bytes) -> bytes:
         """Create a protocol packet with checksum."""
+        # Byte 1 extends the size for payloads over 255 bytes
         packet = bytes(
             [
                 self.MAGIC_BYTE,
-                self.EXTENDED_SIZE,
-                len(data),
+                len(data) >> 8,
+                len(data) & 0xFF,
                 command,
             ]
         ) + data
@@ -48,9 +146,7 @@ class GoveeProtocol:
 
     def _wrap_json(self, payload: bytes) -> bytes:
         """Wrap binary payload in JSON format."""
-        base64_payload = base64.b64encode(payload).decode("ascii")
-        msg = {"msg": {"cmd": "razer", "data": {"pt": base64_payload}}}
-        return json.dumps(msg).encode("utf-8")
+        return self.JSON_PREFIX + base64.b64encode(payload) + self.JSON_SUFFIX
 
     def send_enable(self, enable: bool = True) -> None:
         """Send protocol enable command."""
@@ -60,7 +156,8 @@ class GoveeProtocol:
         
         try:
             self.socket.sendto(json_packet, (self.host, self.port))
-            self.last_enable_time = time.time()
+            self.last_enable_time = time.monotonic()
+            self.next_enable_time = self.last_enable_time + self.keepalive_interval
             _LOGGER.debug("Sent enable command to %s:%s", self.host, self.port)
         except Exception as err:
             _LOGGER.error("Failed to send enable command: %s", err)
@@ -70,6 +167,8 @@ class GoveeProtocol:
         colors: list,
         num_leds: int = 10,
         gradient_mode: bool = True,
+        keepalive: bool = True,
+        repeat: int = 1,
     ) -> None:
         """
         Send LED color data.
@@ -78,140 +177,347 @@ class GoveeProtocol:
             colors: List of RGB tuples [(r,g,b), ...]
             num_leds: Total number of LEDs
             gradient_mode: If True, interpolate between colors
+            keepalive: If True, send an enable first when the keep-alive is due.
+                Pass False when a GoveeKeepAliveScheduler handles keep-alives.
+            repeat: Number of times to send the packet (redundancy on lossy links)
         """
-        # Keep-alive check (send enable every 30 seconds)
-        if time.time() - self.last_enable_time > 30:
+        if keepalive and time.monotonic() >= self.next_enable_time:
             self.send_enable(True)
 
-        # Prepare color data
-        color_count = len(colors)
-        gradient_flag = 0x01 if gradient_mode else 0x00
-        
-        # Build data: [gradient_flag, color_count, r, g, b, r, g, b, ...]
-        data = bytes([gradient_flag, color_count])
-        
-        for r, g, b in colors:
-            data += bytes([r, g, b])
-
-        packet = self._create_packet(self.CMD_LED_DATA, data)
-        json_packet = self._wrap_json(packet)
-
-        try:
-            self.socket.sendto(json_packet, (self.host, self.port))
+        rgb = bytes(channel for color in colors for channel in color[:3])
+        self.send_packet(self.encode_colors(rgb, gradient_mode), repeat)
+        # Called per frame; skip building the log record unless debugging
+        if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug(
                 "Sent %d colors to %s:%s (gradient=%s)",
-                color_count,
+                len(colors),
                 self.host,
                 self.port,
                 gradient_mode,
             )
+
+    def encode_colors(self, rgb: bytes, gradient_mode: bool = True) -> bytes:
+        """
+        Encode LED color data into a ready-to-send JSON packet.
+
+        Args:
+            rgb: Color buffer or memoryview, 3 bytes (R, G, B) per LED
+            gradient_mode: If True, interpolate between colors
+
+        Returns:
+            JSON packet bytes
+        """
+        gradient_flag = 0x01 if gradient_mode else 0x00
+
+        # Build data: [gradient_flag, color_count, r, g, b, r, g, b, ...]
+        data = bytes((gradient_flag, len(rgb) // 3)) + rgb
+
+        packet = self._create_packet(self.CMD_LED_DATA, data)
+        return self._wrap_json(packet)
+
+    def frame_buffer(self, num_leds: int) -> memoryview:
+        """
+        Return the RGB area of this device's LED data packet.
+
+        Renderers write a frame (3 bytes per LED) straight into the returned
+        view and encode_frame() builds the packet around it, so the colors
+        are not copied on the way to the encoder.
+
+        Args:
+            num_leds: Number of LEDs in a frame
+
+        Returns:
+            Writable view of num_leds * 3 bytes
+        """
+        size = 2 + num_leds * 3
+        packet = self._frame_packet
+        if packet is None or len(packet) != size + 5:
+            # [magic, size_hi, size_lo, command, gradient, count, rgb..., checksum]
+            packet = self._frame_packet = bytearray(size + 5)
+            packet[0:4] = bytes((self.MAGIC_BYTE, size >> 8, size & 0xFF, self.CMD_LED_DATA))
+            packet[5] = num_leds
+        return memoryview(packet)[6:-1]
+
+    def encode_frame(self, gradient_mode: bool = True) -> bytes:
+        """
+        Encode the frame held in frame_buffer() into a ready-to-send JSON packet.
+
+        Args:
+            gradient_mode: If True, interpolate between colors
+
+        Returns:
+            JSON packet bytes
+        """
+        packet = self._frame_packet
+        packet[4] = 0x01 if gradient_mode else 0x00
+        packet[-1] = self._checksum(memoryview(packet)[:-1])
+        return self._wrap_json(packet)
+
+    def send_packet(self, json_packet: bytes, repeat: int = 1) -> None:
+        """
+        Send an encoded packet.
+
+        Args:
+            json_packet: Packet from encode_colors()
+            repeat: Number of times to send the packet (redundancy on lossy links)
+        """
+        try:
+            for _ in range(repeat):
+                self.socket.sendto(json_packet, (self.host, self.port))
         except Exception as err:
             _LOGGER.error("Failed to send color data: %s", err)
 
     def close(self) -> None:
         """Close the socket."""
+        if self._socket is None:
+            return
         try:
-            self.socket.close()
+            self._socket.close()
         except Exception as err:
             _LOGGER.error("Error closing socket: %s", err)
+        self._socket = None
+
+
+class GoveeKeepAliveScheduler:
+    """
+    Spread keep-alive enable packets across a fleet of devices.
+
+    Each device gets a phase offset after its first enable, so strips turned
+    on together drift apart instead of sending enables on the same frame.
+    At most one device sends an early or on-time enable per spacing window;
+    a device only bypasses the window once its grace period has run out.
+    """
+
+    # Fractional part of the golden ratio gives well spread phases for any N
+    PHASE_STEP = 0.6180339887
+    # Devices may piggyback an enable on an idle tick this early (fraction of interval)
+    EARLY_WINDOW = 0.25
+
+    def __init__(self, min_spacing: float = 0.05, grace: float = 5.0):
+        """Initialize the scheduler."""
+        self._min_spacing = min_spacing
+        self._grace = grace
+        self._slots = 0
+        self._last_fleet_enable = float("-inf")
+
+    def start(self, protocol: GoveeProtocol) -> None:
+        """Assign a phase to a device that has just sent its initial enable."""
+        phase = (self._slots * self.PHASE_STEP) % 1.0
+        self._slots += 1
+        interval = protocol.keepalive_interval
+        protocol.next_enable_time = protocol.last_enable_time + interval * (
+            0.5 + 0.5 * phase
+        )
+
+    def poll(self, protocol: GoveeProtocol, now: float, idle: bool) -> bool:
+        """
+        Return True if the device should send its keep-alive on this tick.
+
+        Args:
+            protocol: Device protocol handler
+            now: Current time.monotonic() value
+            idle: True if this tick would only repeat the previous frame
+        """
+        due = protocol.next_enable_time
+        if now >= due + self._grace:
+            return self._claim(now)
+
+        if now - self._last_fleet_enable < self._min_spacing:
+            return False
+
+        if now >= due:
+            return self._claim(now)
+
+        early = due - protocol.keepalive_interval * self.EARLY_WINDOW
+        if idle and now >= early:
+            return self._claim(now)
+
+        return False
+
+    def _claim(self, now: float) -> bool:
+        """Record a fleet enable at the given time."""
+        self._last_fleet_enable = now
+        return True
 
 
 class GoveeColorManager:
-    """Manage color interpolation and effects."""
+    """
+    Manage the section palette and render effects.
+
+    Color state lives in contiguous buffers with 3 bytes (R, G, B) per
+    entry: the section palette, the effect frame and the output frame after
+    brightness scaling. The output buffer is what GoveeProtocol encodes.
+    During a crossfade the outgoing effect is rendered into a second frame
+    buffer.
+    The geometry gives the physical LED positions used by spatial effects
+    and the brightness wave; the blend mode is used wherever section colors
+    are blended.
+    """
+
+    __slots__ = (
+        "num_leds",
+        "num_sections",
+        "geometry",
+        "blend_mode",
+        "palette",
+        "frame",
+        "fade_frame",
+        "output",
+        "frame_version",
+        "_effects",
+        "_static_key",
+        "_fade_key",
+    )
 
-    def __init__(self, num_leds: int, num_sections: int):
-        """Initialize the color manager."""
+    def __init__(
+        self,
+        num_leds: int,
+        num_sections: int,
+        geometry: Optional[GoveeGeometry] = None,
+        blend_mode: str = BLEND_SRGB,
+    ):
+        """Initialize the color manager; without a geometry LEDs form a straight strip."""
         self.num_leds = num_leds
         self.num_sections = num_sections
-        self.section_colors = [[0, 0, 0] for _ in range(num_sections)]
+        self.geometry = geometry or get_geometry(LAYOUT_STRIP, num_leds)
+        self.blend_mode = blend_mode
+        self.palette = bytearray(num_sections * 3)
+
+        # Preallocated frame buffers and per-effect instances
+        self.frame = bytearray(num_leds * 3)
+        self.fade_frame = bytearray(num_leds * 3)
+        self.output = bytearray(num_leds * 3)
+        self.frame_version = 0
+        self._effects: dict = {}
+        self._static_key = None
+        self._fade_key = None
+
+    @property
+    def section_colors(self) -> list:
+        """Return a copy of the section colors as [r, g, b] lists."""
+        palette = self.palette
+        return [list(palette[i:i + 3]) for i in range(0, len(palette), 3)]
+
+    @section_colors.setter
+    def section_colors(self, colors: list) -> None:
+        """Set all section colors from a list of RGB triplets."""
+        for section, rgb in enumerate(colors[:self.num_sections]):
+            self.set_section_color(section, rgb)
 
     def set_section_color(self, section: int, rgb: tuple) -> None:
         """Set color for a specific section."""
         if 0 <= section < self.num_sections:
-            self.section_colors[section] = list(rgb)
+            self.palette[section * 3:section * 3 + 3] = bytes(rgb[:3])
 
     def get_section_color(self, section: int) -> Optional[list]:
         """Get color for a specific section."""
         if 0 <= section < self.num_sections:
-            return self.section_colors[section]
+            return list(self.palette[section * 3:section * 3 + 3])
         return None
 
     def interpolate(self, start_color: list, end_color: list, steps: int) -> list:
-        """Interpolate between two colors."""
+        """Interpolate between two colors in the manager's blend mode."""
         if steps == 0:
             return [start_color]
-        
-        result = []
-        for i in range(steps + 1):
-            r = int(start_color[0] + (end_color[0] - start_color[0]) * i / steps)
-            g = int(start_color[1] + (end_color[1] - start_color[1]) * i / steps)
-            b = int(start_color[2] + (end_color[2] - start_color[2]) * i / steps)
-            result.append([r, g, b])
+
+        ramp = blend_ramp(self.blend_mode, bytes(start_color[:3]), bytes(end_color[:3]), steps)
+        result = [list(ramp[i:i + 3]) for i in range(0, len(ramp), 3)]
+        result.append(list(end_color[:3]))
         return result
 
-    def generate_effect_colors(self, effect: str = "stretched") -> list:
+    def load_frame(self, effect: str, frame: bytes) -> None:
+        """
+        Install a frame rendered ahead of time for a static effect.
+
+        The frame must match the current palette; it is reused like a frame
+        rendered by render() until the effect or palette changes.
+        """
+        self.frame[:] = frame
+        self._static_key = (effect, bytes(self.palette))
+        self.frame_version += 1
+
+    def get_effect(self, effect: str) -> GoveeEffect:
+        """Return the effect instance for a name, creating it on first use."""
+        instance = self._effects.get(effect)
+        if instance is None:
+            instance = self._effects[effect] = create_effect(effect)
+            instance.geometry = self.geometry
+            instance.blend = self.blend_mode
+        return instance
+
+    def render(
+        self, effect: str = "stretched", t: float = 0.0, palette: Optional[bytes] = None
+    ) -> bytearray:
+        """
+        Render the effect into the frame buffer.
+
+        Static effects are only re-rendered when the effect or palette changes;
+        frame_version is bumped whenever the buffer contents are rewritten.
+
+        Args:
+            effect: Effect name from the effect registry
+            t: Time in seconds, used by animated effects
+            palette: Palette to render instead of the section palette
+                (e.g. rotated by the color flow)
+
+        Returns:
+            Frame buffer with num_leds RGB triplets
+        """
+        if palette is None:
+            palette = self.palette
+        instance = self.get_effect(effect)
+        if instance.animated:
+            self._static_key = None
+        else:
+            key = (effect, bytes(palette))
+            if key == self._static_key:
+                return self.frame
+            self._static_key = key
+
+        instance.render_layout(self.frame, palette, self.num_leds, t)
+        self.frame_version += 1
+        return self.frame
+
+    def render_outgoing(
+        self, effect: str, t: float = 0.0, palette: Optional[bytes] = None
+    ) -> bytearray:
+        """
+        Render the outgoing effect of a crossfade into the fade buffer.
+
+        Call before render() of the incoming effect: a static outgoing frame
+        still held in the frame buffer is copied instead of rendered again,
+        and then reused until the effect or palette changes.
+
+        Returns:
+            Fade buffer with num_leds RGB triplets
+        """
+        if palette is None:
+            palette = self.palette
+        instance = self.get_effect(effect)
+        if instance.animated:
+            self._fade_key = None
+        else:
+            key = (effect, bytes(palette))
+            if key == self._fade_key:
+                return self.fade_frame
+            self._fade_key = key
+            if key == self._static_key:
+                self.fade_frame[:] = self.frame
+                return self.fade_frame
+
+        instance.render_layout(self.fade_frame, palette, self.num_leds, t)
+        return self.fade_frame
+
+    def generate_effect_colors(self, effect: str = "stretched", t: float = 0.0) -> list:
         """
         Generate LED colors based on effect type.
         
         Args:
-            effect: Effect name (double, mirror, stretched)
+            effect: Effect name from the effect registry
+            t: Time in seconds, used by animated effects
             
         Returns:
             List of RGB tuples for each LED
         """
-        if effect == "double":
-            # Repeat section colors twice
-            colors = []
-            leds_per_repeat = self.num_leds // 2
-            leds_per_section = leds_per_repeat // self.num_sections
-            
-            for _ in range(2):
-                for section in range(self.num_sections):
-                    color = self.section_colors[section]
-                    for _ in range(leds_per_section):
-                        colors.append(tuple(color))
-            
-            # Fill remaining LEDs
-            while len(colors) < self.num_leds:
-                colors.append(tuple(self.section_colors[0]))
-                
-        elif effect == "mirror":
-            # Mirror section colors
-            colors = []
-            leds_per_section = self.num_leds // (2 * self.num_sections)
-            
-            # First half
-            for section in range(self.num_sections):
-                color = self.section_colors[section]
-                for _ in range(leds_per_section):
-                    colors.append(tuple(color))
-            
-            # Second half (mirrored)
-            for section in range(self.num_sections - 1, -1, -1):
-                color = self.section_colors[section]
-                for _ in range(leds_per_section):
-                    colors.append(tuple(color))
-            
-            # Fill remaining LEDs
-            while len(colors) < self.num_leds:
-                colors.append(tuple(self.section_colors[0]))
-                
-        else:  # stretched (default)
-            # Interpolate between section colors
-            colors = []
-            leds_per_section = self.num_leds // self.num_sections
-            
-            for i in range(self.num_sections):
-                start_color = self.section_colors[i]
-                end_color = self.section_colors[(i + 1) % self.num_sections]
-                
-                interpolated = self.interpolate(start_color, end_color, leds_per_section - 1)
-                for color in interpolated[:-1]:  # Avoid duplicate at boundaries
-                    colors.append(tuple(color))
-            
-            # Add final color and fill to num_leds
-            colors.append(tuple(self.section_colors[-1]))
-            while len(colors) < self.num_leds:
-                colors.append(tuple(self.section_colors[0]))
-
-        return colors[:self.num_leds]  # Ensure exact number of LEDs
+        frame = self.render(effect, t)
+        return [tuple(frame[i:i + 3]) for i in range(0, self.num_leds * 3, 3)]
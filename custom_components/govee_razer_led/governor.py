@@ -0,0 +1,225 @@
+"""Load shedding across all strips when the event loop is overloaded.
+
+The governor samples the scheduling lag of the event loop and collects the
+time strips spend rendering on the loop and sending. Under overload it
+degrades one strip by one step per evaluation, lowest priority first: a
+reduced frame rate, then a frozen wave, then holding the last frame. Once
+the loop has had headroom for several evaluations in a row, strips are
+restored one step at a time in the reverse order.
+"""
+import collections
+import logging
+import time
+from typing import Optional
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    DEFAULT_PRIORITY,
+    GOVERNOR_EVAL_SAMPLES,
+    GOVERNOR_HISTORY,
+    GOVERNOR_LAG_HIGH,
+    GOVERNOR_LAG_LOW,
+    GOVERNOR_LOAD_HIGH,
+    GOVERNOR_LOAD_LOW,
+    GOVERNOR_RESTORE_EVALS,
+    GOVERNOR_SAMPLE_INTERVAL,
+    GOVERNOR_SEND_HIGH,
+    GOVERNOR_SEND_LOW,
+    LOAD_LEVELS,
+    LOAD_NORMAL,
+    LOAD_STATIC,
+    PRIORITIES,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class GoveeLoadGovernor:
+    """Degrade and restore strips by priority as the event loop load changes."""
+
+    def __init__(self, hass: HomeAssistant):
+        """Initialize the governor."""
+        self.hass = hass
+        # strip -> priority rank (index in PRIORITIES)
+        self._strips: dict = {}
+        self._handle: Optional[object] = None
+        self._due = 0.0
+        self._calm = 0
+
+        # Current evaluation window
+        self._window_start = 0.0
+        self._samples = 0
+        self._lag_total = 0.0
+        self._lag_max = 0.0
+        self._render = 0.0
+        self._send = 0.0
+        self._frames = 0
+
+        # Last evaluation
+        self.lag = 0.0
+        self.lag_max = 0.0
+        self.load = 0.0
+        self.send = 0.0
+        self.overloaded = False
+        self.actions: collections.deque = collections.deque(maxlen=GOVERNOR_HISTORY)
+
+    @callback
+    def async_start(self) -> None:
+        """Start sampling the event loop."""
+        self._window_start = time.monotonic()
+        self._schedule()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop sampling and restore all strips."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        for strip in self._strips:
+            strip.set_load_level(LOAD_NORMAL)
+
+    def register(self, strip, priority: str) -> None:
+        """Start governing a strip."""
+        if priority not in PRIORITIES:
+            priority = DEFAULT_PRIORITY
+        self._strips[strip] = PRIORITIES.index(priority)
+
+    def unregister(self, strip) -> None:
+        """Stop governing a strip."""
+        if self._strips.pop(strip, None) is not None:
+            strip.set_load_level(LOAD_NORMAL)
+
+    def record(self, render: float, send: float) -> None:
+        """
+        Record the cost of one frame of a strip.
+
+        Args:
+            render: Seconds spent rendering and encoding on the event loop
+            send: Seconds spent sending, including the executor queue
+        """
+        self._render += render
+        self._send += send
+        self._frames += 1
+
+    def _schedule(self) -> None:
+        """Schedule the next lag sample."""
+        loop = self.hass.loop
+        self._due = loop.time() + GOVERNOR_SAMPLE_INTERVAL
+        self._handle = loop.call_at(self._due, self._sample)
+
+    @callback
+    def _sample(self) -> None:
+        """Measure how late this callback ran and evaluate every few samples."""
+        lag = max(self.hass.loop.time() - self._due, 0.0)
+        self._lag_total += lag
+        if lag > self._lag_max:
+            self._lag_max = lag
+        self._samples += 1
+        if self._samples >= GOVERNOR_EVAL_SAMPLES:
+            self._evaluate()
+        self._schedule()
+
+    def _evaluate(self) -> None:
+        """Close the window and shed or restore one step."""
+        now = time.monotonic()
+        elapsed = now - self._window_start
+        self.lag = self._lag_total / self._samples
+        self.lag_max = self._lag_max
+        self.load = self._render / elapsed if elapsed > 0 else 0.0
+        self.send = self._send / self._frames if self._frames else 0.0
+        self._window_start = now
+        self._samples = 0
+        self._lag_total = self._lag_max = 0.0
+        self._render = self._send = 0.0
+        self._frames = 0
+
+        self.overloaded = (
+            self.lag > GOVERNOR_LAG_HIGH
+            or self.load > GOVERNOR_LOAD_HIGH
+            or self.send > GOVERNOR_SEND_HIGH
+        )
+        if self.overloaded:
+            self._calm = 0
+            self._shed()
+        elif (
+            self.lag < GOVERNOR_LAG_LOW
+            and self.load < GOVERNOR_LOAD_LOW
+            and self.send < GOVERNOR_SEND_LOW
+        ):
+            self._calm += 1
+            if self._calm >= GOVERNOR_RESTORE_EVALS:
+                self._calm = 0
+                self._restore()
+        else:
+            self._calm = 0
+
+    def _shed(self) -> None:
+        """Degrade the least important running strip by one step.
+
+        All strips of a priority reach a level before any of them goes
+        further, and higher priorities are only touched once every lower
+        priority strip holds its last frame.
+        """
+        candidates = [
+            strip
+            for strip in self._strips
+            if strip.is_on and strip.load_level < LOAD_STATIC
+        ]
+        if candidates:
+            strip = min(
+                candidates, key=lambda s: (self._strips[s], s.load_level)
+            )
+            self._set_level(strip, strip.load_level + 1)
+
+    def _restore(self) -> None:
+        """Restore the most important degraded strip by one step."""
+        candidates = [strip for strip in self._strips if strip.load_level > LOAD_NORMAL]
+        if candidates:
+            strip = max(
+                candidates, key=lambda s: (self._strips[s], s.load_level)
+            )
+            self._set_level(strip, strip.load_level - 1)
+
+    def _set_level(self, strip, level: int) -> None:
+        """Change a strip's level and record the action."""
+        previous = strip.load_level
+        strip.set_load_level(level)
+        action = {
+            "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "strip": strip.name,
+            "from": LOAD_LEVELS[previous],
+            "to": LOAD_LEVELS[level],
+            "lag_ms": round(self.lag * 1000, 1),
+            "render_load": round(self.load, 3),
+            "send_ms": round(self.send * 1000, 1),
+        }
+        self.actions.append(action)
+        _LOGGER.info(
+            "%s %s from %s to %s (loop lag %.1f ms, render load %.2f, send %.1f ms)",
+            "Degrading" if level > previous else "Restoring",
+            strip.name,
+            action["from"],
+            action["to"],
+            action["lag_ms"],
+            self.load,
+            action["send_ms"],
+        )
+
+    def as_dict(self) -> dict:
+        """Return diagnostics for the governor."""
+        return {
+            "overloaded": self.overloaded,
+            "lag_ms": round(self.lag * 1000, 1),
+            "lag_max_ms": round(self.lag_max * 1000, 1),
+            "render_load": round(self.load, 3),
+            "send_ms": round(self.send * 1000, 1),
+            "strips": {
+                strip.name: {
+                    "priority": PRIORITIES[rank],
+                    "level": LOAD_LEVELS[strip.load_level],
+                }
+                for strip, rank in self._strips.items()
+            },
+            "actions": list(self.actions),
+        }
@@ -0,0 +1,219 @@
+"""Link health monitoring for Govee strips using LAN API status queries.
+
+The monitor owns the LAN API response port. Device scans run through it as
+well, since a second listener on the same port would fail to bind.
+"""
+import asyncio
+import json
+import logging
+import socket
+import time
+from datetime import timedelta
+from typing import Optional
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import (
+    DEFAULT_PORT,
+    HEALTH_LOSS_ALPHA,
+    HEALTH_POLL_INTERVAL,
+    HEALTH_RTT_ALPHA,
+)
+from .govee_protocol import (
+    SCAN_MULTICAST_ADDR,
+    SCAN_MULTICAST_TTL,
+    SCAN_PORT,
+    SCAN_REQUEST,
+    SCAN_RESPONSE_PORT,
+    scan_devices,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+STATUS_QUERY = json.dumps({"msg": {"cmd": "devStatus", "data": {}}}).encode("utf-8")
+
+
+class GoveeLinkHealth:
+    """Reachability, round-trip time and loss estimate for one strip."""
+
+    __slots__ = ("host", "queries", "responses", "rtt", "loss", "last_seen", "_pending")
+
+    def __init__(self, host: str):
+        """Initialize the link state."""
+        self.host = host
+        self.queries = 0
+        self.responses = 0
+        self.rtt: Optional[float] = None
+        self.loss = 0.0
+        self.last_seen: Optional[float] = None
+        self._pending: Optional[float] = None
+
+    @property
+    def reachable(self) -> bool:
+        """Return true if the device answered within the last three polls."""
+        return (
+            self.last_seen is not None
+            and time.monotonic() - self.last_seen < 3 * HEALTH_POLL_INTERVAL
+        )
+
+    @property
+    def redundancy(self) -> int:
+        """Return how many times key frames should be sent on this link."""
+        if self.loss >= 0.3:
+            return 3
+        if self.loss >= 0.1:
+            return 2
+        return 1
+
+    def query_sent(self, now: float) -> None:
+        """Record a status query, counting an unanswered previous one as lost."""
+        if self._pending is not None:
+            self.loss += HEALTH_LOSS_ALPHA * (1.0 - self.loss)
+        self._pending = now
+        self.queries += 1
+
+    def response_received(self, now: float) -> None:
+        """Record a status response."""
+        if self._pending is None:
+            return
+        rtt = now - self._pending
+        self._pending = None
+        self.responses += 1
+        self.last_seen = now
+        self.loss -= HEALTH_LOSS_ALPHA * self.loss
+        if self.rtt is None:
+            self.rtt = rtt
+        else:
+            self.rtt += HEALTH_RTT_ALPHA * (rtt - self.rtt)
+
+    def as_dict(self) -> dict:
+        """Return diagnostics for this link."""
+        return {
+            "reachable": self.reachable,
+            "rtt_ms": None if self.rtt is None else round(self.rtt * 1000, 1),
+            "loss": round(self.loss, 3),
+            "redundancy": self.redundancy,
+            "queries": self.queries,
+            "responses": self.responses,
+        }
+
+
+class _StatusResponseProtocol(asyncio.DatagramProtocol):
+    """Receive devStatus and scan responses on the LAN API response port."""
+
+    def __init__(self, monitor: "GoveeLinkMonitor"):
+        """Initialize the protocol."""
+        self._monitor = monitor
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        """Dispatch a response to the matching link."""
+        self._monitor.handle_response(data, addr[0])
+
+
+class GoveeLinkMonitor:
+    """Periodically query all registered strips and track their link health."""
+
+    def __init__(self, hass: HomeAssistant):
+        """Initialize the monitor."""
+        self.hass = hass
+        self._links: dict = {}
+        self._transport: Optional[asyncio.DatagramTransport] = None
+        self._unsub_poll = None
+        # Responses collected by the scan in progress, keyed by device IP
+        self._scan_results: Optional[dict] = None
+
+    async def async_start(self) -> None:
+        """Bind the response listener and start polling."""
+        try:
+            self._transport, _ = await self.hass.loop.create_datagram_endpoint(
+                lambda: _StatusResponseProtocol(self),
+                local_addr=("0.0.0.0", SCAN_RESPONSE_PORT),
+            )
+        except OSError as err:
+            # Another LAN API client may own the response port
+            _LOGGER.warning("Link health monitoring unavailable: %s", err)
+            return
+        sock = self._transport.get_extra_info("socket")
+        sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, SCAN_MULTICAST_TTL)
+
+        self._unsub_poll = async_track_time_interval(
+            self.hass, self._async_poll, timedelta(seconds=HEALTH_POLL_INTERVAL)
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop polling and close the listener."""
+        if self._unsub_poll is not None:
+            self._unsub_poll()
+            self._unsub_poll = None
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+
+    def register(self, host: str) -> GoveeLinkHealth:
+        """Start tracking a strip."""
+        return self._links.setdefault(host, GoveeLinkHealth(host))
+
+    def unregister(self, host: str) -> None:
+        """Stop tracking a strip."""
+        self._links.pop(host, None)
+
+    def get(self, host: str) -> Optional[GoveeLinkHealth]:
+        """Return the link state for a host."""
+        return self._links.get(host)
+
+    async def async_scan(self, timeout: float = 2.0) -> Optional[dict]:
+        """
+        Discover Govee devices on the LAN through the shared listener.
+
+        Args:
+            timeout: Seconds to wait for scan responses
+
+        Returns:
+            Dict mapping device IP to the scan response data, or None if the
+            scan could not run
+        """
+        if self._transport is None:
+            # Nothing listens on the response port here; scan on our own
+            return await self.hass.async_add_executor_job(scan_devices, timeout)
+        if self._scan_results is not None:
+            _LOGGER.debug("Device scan already in progress")
+            return None
+
+        self._scan_results = results = {}
+        try:
+            self._transport.sendto(SCAN_REQUEST, (SCAN_MULTICAST_ADDR, SCAN_PORT))
+            await asyncio.sleep(timeout)
+        except OSError as err:
+            _LOGGER.warning("Device scan failed: %s", err)
+            return None
+        finally:
+            self._scan_results = None
+        return results
+
+    @callback
+    def _async_poll(self, _now=None) -> None:
+        """Send a status query to every registered strip."""
+        if self._transport is None:
+            return
+        now = time.monotonic()
+        for host, link in self._links.items():
+            link.query_sent(now)
+            self._transport.sendto(STATUS_QUERY, (host, DEFAULT_PORT))
+
+    def handle_response(self, data: bytes, host: str) -> None:
+        """Handle a datagram received from a device."""
+        try:
+            msg = json.loads(data)["msg"]
+            cmd = msg["cmd"]
+        except (ValueError, KeyError, TypeError):
+            return
+        if cmd == "devStatus":
+            link = self._links.get(host)
+            if link is not None:
+                link.response_received(time.monotonic())
+        elif cmd == "scan" and self._scan_results is not None:
+            scan = msg.get("data")
+            if isinstance(scan, dict) and "ip" in scan:
+                self._scan_results[scan["ip"]] = scan
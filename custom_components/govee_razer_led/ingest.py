@@ -0,0 +1,100 @@
+"""Low-latency frame ingest for streaming per-LED frames to a strip.
+
+External producers (e.g. an audio analyser on the same host) push raw RGB
+frames over UDP or through the ``push_frame`` service. Only the newest frame
+is kept: a frame that arrives before the previous one was sent replaces it,
+and the strip sends at most ``STREAM_MIN_INTERVAL`` apart.
+"""
+import asyncio
+import logging
+import time
+from typing import Callable, Optional
+
+from .const import STREAM_LATENCY_ALPHA
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class GoveeFrameSlot:
+    """Latest-frame-wins hand-off between ingest and the sender."""
+
+    def __init__(self):
+        """Initialize the slot."""
+        self._frame: Optional[bytes] = None
+        self._received_at = 0.0
+        self._event = asyncio.Event()
+        self.last_push = float("-inf")
+        self.frames_received = 0
+        self.frames_dropped = 0
+        self.frames_sent = 0
+        self.latency: Optional[float] = None
+        self.max_latency = 0.0
+
+    def push(self, frame: bytes) -> None:
+        """Store a frame, replacing any frame not yet sent."""
+        now = time.monotonic()
+        if self._frame is not None:
+            self.frames_dropped += 1
+        self._frame = frame
+        self._received_at = now
+        self.last_push = now
+        self.frames_received += 1
+        self._event.set()
+
+    async def wait(self) -> tuple:
+        """Wait for the next frame; returns (frame, received_at)."""
+        await self._event.wait()
+        self._event.clear()
+        frame, self._frame = self._frame, None
+        return frame, self._received_at
+
+    def record_sent(self, received_at: float) -> None:
+        """Record ingest-to-send latency for a sent frame."""
+        latency = time.monotonic() - received_at
+        self.frames_sent += 1
+        self.max_latency = max(self.max_latency, latency)
+        if self.latency is None:
+            self.latency = latency
+        else:
+            self.latency += STREAM_LATENCY_ALPHA * (latency - self.latency)
+
+    def as_dict(self) -> dict:
+        """Return stream statistics for diagnostics."""
+        return {
+            "frames_received": self.frames_received,
+            "frames_sent": self.frames_sent,
+            "frames_dropped": self.frames_dropped,
+            "latency_ms": None if self.latency is None else round(self.latency * 1000, 2),
+            "max_latency_ms": round(self.max_latency * 1000, 2),
+        }
+
+
+class GoveeIngestProtocol(asyncio.DatagramProtocol):
+    """UDP listener accepting raw RGB frames (3 bytes per LED)."""
+
+    def __init__(self, on_frame: Callable[[bytes], None]):
+        """Initialize the listener."""
+        self._on_frame = on_frame
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        """Forward a frame."""
+        if not data or len(data) % 3:
+            _LOGGER.debug("Ignoring %d byte frame from %s", len(data), addr)
+            return
+        self._on_frame(data)
+
+
+async def async_start_ingest_listener(
+    loop: asyncio.AbstractEventLoop, port: int, on_frame: Callable[[bytes], None]
+) -> Optional[asyncio.DatagramTransport]:
+    """Start a UDP frame listener on localhost; returns its transport."""
+    try:
+        transport, _ = await loop.create_datagram_endpoint(
+            lambda: GoveeIngestProtocol(on_frame),
+            local_addr=("127.0.0.1", port),
+        )
+    except OSError as err:
+        _LOGGER.error("Could not start frame ingest on port %s: %s", port, err)
+        return None
+    _LOGGER.debug("Frame ingest listening on 127.0.0.1:%s", port)
+    return transport
@@ -1,8 +1,12 @@
 """Light platform for Govee Razer LED."""
 import asyncio
+import base64
+import binascii
 import logging
 import math
-from typing import Any, Optional
+import os
+import time
+from typing import TYPE_CHECKING, Any, Optional
 
 from homeassistant.components.light import (
     ATTR_BRIGHTNESS,
@@ -13,9 +17,12 @@ from homeassistant.components.light import (
     LightEntityFeature,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT
+from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT, STATE_ON
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.restore_state import RestoreEntity, RestoredExtraData
 import voluptuous as vol
 from homeassistant.helpers import config_validation as cv, entity_platform
 
@@ -24,20 +31,104 @@ from .const import (
     CONF_NUM_LEDS,
     CONF_NUM_SECTIONS,
     CONF_UPDATE_INTERVAL,
+    CONF_KEEPALIVE_INTERVAL,
+    CONF_RENDER_BACKEND,
     DEFAULT_PORT,
     DEFAULT_NUM_LEDS,
     DEFAULT_NUM_SECTIONS,
     DEFAULT_UPDATE_INTERVAL,
+    DEFAULT_KEEPALIVE_INTERVAL,
+    DEFAULT_RENDER_BACKEND,
     DEFAULT_BRIGHTNESS,
     DEFAULT_AMPLITUDE,
     DEFAULT_SPEED,
+    DEFAULT_COLOR_FLOW_SPEED,
+    RESTORE_STAGGER,
+    ANIMATION_CACHE_MAX_BYTES,
+    ANIMATION_CACHE_MAX_FRAMES,
+    RENDER_BACKEND_INLINE,
+    RENDER_BACKEND_PROCESS,
+    RENDER_POOL_WORKERS,
+    RENDER_QUEUE_DEPTH,
     EFFECTS,
     EFFECT_STRETCHED,
     SERVICE_SET_WAVE,
+    SERVICE_PUSH_FRAME,
+    SERVICE_SET_PARAMETERS,
     ATTR_AMPLITUDE,
     ATTR_SPEED,
+    ATTR_COLOR_FLOW_SPEED,
+    ATTR_FRAME,
+    CONF_INGEST_PORT,
+    DEFAULT_INGEST_PORT,
+    STREAM_HOLD,
+    STREAM_MIN_INTERVAL,
+    CONF_RECEIVER,
+    CONF_RECEIVER_UNIVERSE,
+    CONF_RECEIVER_START,
+    CONF_LAYOUT,
+    CONF_MATRIX_WIDTH,
+    CONF_MATRIX_SERPENTINE,
+    CONF_SEGMENTS,
+    DEFAULT_LAYOUT,
+    DEFAULT_MATRIX_WIDTH,
+    DEFAULT_MATRIX_SERPENTINE,
+    DEFAULT_SEGMENTS,
+    LAYOUT_SEGMENTS,
+    LAYOUT_STRIP,
+    CONF_BLEND_MODE,
+    DEFAULT_BLEND_MODE,
+    CONF_PRIORITY,
+    DEFAULT_PRIORITY,
+    CONF_EFFECT_TRANSITION,
+    DEFAULT_EFFECT_TRANSITION,
+    GOVERNOR_FPS_DIVISOR,
+    LOAD_NORMAL,
+    LOAD_REDUCED_FPS,
+    LOAD_WAVE_FROZEN,
+    LOAD_STATIC,
+    DEFAULT_RECEIVER,
+    DEFAULT_RECEIVER_UNIVERSE,
+    DEFAULT_RECEIVER_START,
+    RECEIVER_NONE,
+    RECEIVER_TICK,
+    RECORDINGS_DIR,
+    RECORDING_EXTENSION,
+    RECORDING_MAX_BYTES,
+    RECORDING_FLUSH_BYTES,
+    SERVICE_START_RECORDING,
+    SERVICE_STOP_RECORDING,
+    ATTR_FILENAME,
+    PROFILES_DIR,
+    DEFAULT_PROFILE_DURATION,
+    MAX_PROFILE_DURATION,
+    SERVICE_PROFILE,
+    ATTR_DURATION,
+    ATTR_MEMORY,
+    SERVICE_SAVE_PRESET,
+    SERVICE_ACTIVATE_PRESET,
+    SERVICE_DELETE_PRESET,
+    ATTR_PRESET,
 )
-from .govee_protocol import GoveeColorManager, GoveeProtocol
+from .animation_cache import GoveeAnimationCache, GoveeAnimationCycle
+from .fleet import GoveeFleetCoordinator
+from .geometry import get_geometry, parse_segments
+from .ingest import GoveeFrameSlot, async_start_ingest_listener
+from .presets import (
+    GoveeCompiledPreset,
+    GoveePresetStore,
+    compile_preset,
+    section_color,
+)
+from .receiver import GoveeLightingReceiver
+from .recorder import GoveeFrameRecorder
+from .govee_protocol import GoveeColorManager, GoveeKeepAliveScheduler, GoveeProtocol
+from .renderer import render_frame
+
+if TYPE_CHECKING:
+    # Imported on first use: most strips never profile or render in processes
+    from .profiler import GoveeProfileSession
+    from .render_pool import GoveeRenderStream
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -60,25 +151,67 @@ async def async_setup_entry(
     update_interval = config.get(
         CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL
     )
+    keepalive_interval = config.get(
+        CONF_KEEPALIVE_INTERVAL, DEFAULT_KEEPALIVE_INTERVAL
+    )
+    render_backend = config.get(CONF_RENDER_BACKEND, DEFAULT_RENDER_BACKEND)
+    device = entry_data.get("device") or {}
+
+    # One keep-alive scheduler spreads enable packets across all strips
+    keepalive = hass.data[DOMAIN].setdefault(
+        "keepalive_scheduler", GoveeKeepAliveScheduler()
+    )
 
     # Create the main strip controller
     strip = GoveeRazerStrip(
         hass, name, host, port, num_leds, num_sections, update_interval, coordinator
     )
+    strip.set_device_record(device)
+    strip.set_keepalive(keepalive, keepalive_interval)
+    strip.set_render_backend(render_backend)
+    layout = config.get(CONF_LAYOUT, DEFAULT_LAYOUT)
+    segments = ()
+    if layout == LAYOUT_SEGMENTS:
+        try:
+            segments = parse_segments(config.get(CONF_SEGMENTS, DEFAULT_SEGMENTS))
+        except ValueError as err:
+            _LOGGER.warning("Invalid segments for %s, using a straight strip: %s", name, err)
+            layout = LAYOUT_STRIP
+    strip.set_geometry(
+        layout,
+        config.get(CONF_MATRIX_WIDTH, DEFAULT_MATRIX_WIDTH),
+        config.get(CONF_MATRIX_SERPENTINE, DEFAULT_MATRIX_SERPENTINE),
+        segments,
+    )
+    strip.set_blend_mode(config.get(CONF_BLEND_MODE, DEFAULT_BLEND_MODE))
+    strip.set_priority(config.get(CONF_PRIORITY, DEFAULT_PRIORITY))
+    strip.set_effect_transition(
+        config.get(CONF_EFFECT_TRANSITION, DEFAULT_EFFECT_TRANSITION)
+    )
+    strip.set_ingest_port(config.get(CONF_INGEST_PORT, DEFAULT_INGEST_PORT))
+    strip.set_receiver(
+        config.get(CONF_RECEIVER, DEFAULT_RECEIVER),
+        config.get(CONF_RECEIVER_UNIVERSE, DEFAULT_RECEIVER_UNIVERSE),
+        config.get(CONF_RECEIVER_START, DEFAULT_RECEIVER_START),
+    )
+    strip.set_animation_cache(
+        hass.data[DOMAIN].setdefault(
+            "animation_cache",
+            GoveeAnimationCache(ANIMATION_CACHE_MAX_BYTES, ANIMATION_CACHE_MAX_FRAMES),
+        )
+    )
     
     # Register strip with coordinator
     coordinator.strip_entity = strip
 
     # Create section entities
-    entities = [strip]
-    for i in range(num_sections):
-        entities.append(
-            GoveeRazerSection(
-                hass, f"{name} Section {i+1}", strip, i, config_entry.entry_id
-            )
-        )
+    sections = [
+        GoveeRazerSection(hass, f"{name} Section {i+1}", strip, i, config_entry.entry_id)
+        for i in range(num_sections)
+    ]
+    strip.set_sections(sections)
 
-    async_add_entities(entities)
+    async_add_entities([strip, *sections])
 
     # Register services
     platform = entity_platform.async_get_current_platform()
@@ -94,8 +227,149 @@ async def async_setup_entry(
         "async_set_wave",
     )
 
+    platform.async_register_entity_service(
+        SERVICE_SET_PARAMETERS,
+        {
+            vol.Optional(ATTR_AMPLITUDE): vol.All(
+                cv.positive_int, vol.Range(min=0, max=100)
+            ),
+            vol.Optional(ATTR_SPEED): vol.All(vol.Coerce(int), vol.Range(min=-100, max=100)),
+            vol.Optional(ATTR_COLOR_FLOW_SPEED): vol.All(
+                vol.Coerce(int), vol.Range(min=-100, max=100)
+            ),
+            vol.Optional(ATTR_BRIGHTNESS): vol.All(
+                vol.Coerce(int), vol.Range(min=0, max=255)
+            ),
+        },
+        "async_set_parameters",
+    )
+
+    platform.async_register_entity_service(
+        SERVICE_PUSH_FRAME,
+        {vol.Required(ATTR_FRAME): cv.string},
+        "async_push_frame",
+    )
+
+    platform.async_register_entity_service(
+        SERVICE_START_RECORDING,
+        {vol.Optional(ATTR_FILENAME): cv.string},
+        "async_start_recording",
+    )
+
+    platform.async_register_entity_service(
+        SERVICE_STOP_RECORDING,
+        {},
+        "async_stop_recording",
+    )
+
+    for service, method in (
+        (SERVICE_SAVE_PRESET, "async_save_preset"),
+        (SERVICE_ACTIVATE_PRESET, "async_activate_preset"),
+        (SERVICE_DELETE_PRESET, "async_delete_preset"),
+    ):
+        platform.async_register_entity_service(
+            service, {vol.Required(ATTR_PRESET): cv.string}, method
+        )
+
+    platform.async_register_entity_service(
+        SERVICE_PROFILE,
+        {
+            vol.Optional(ATTR_DURATION, default=DEFAULT_PROFILE_DURATION): vol.All(
+                vol.Coerce(float), vol.Range(min=1, max=MAX_PROFILE_DURATION)
+            ),
+            vol.Optional(ATTR_MEMORY, default=True): cv.boolean,
+            vol.Optional(ATTR_FILENAME): cv.string,
+        },
+        "async_profile",
+    )
+
+
+async def _async_get_receiver(
+    hass: HomeAssistant, protocol: str
+) -> Optional[GoveeLightingReceiver]:
+    """Return the shared receiver for a protocol, starting it on first use."""
+    receivers = hass.data[DOMAIN].setdefault("receivers", {})
+    receiver = receivers.get(protocol)
+    if receiver is None:
+        # Stored before starting, so strips set up meanwhile share it
+        receiver = receivers[protocol] = GoveeLightingReceiver(protocol, RECEIVER_TICK)
+    if not await receiver.async_start():
+        if receivers.get(protocol) is receiver:
+            receivers.pop(protocol)
+        return None
+    return receiver
+
+
+async def _async_get_preset_store(hass: HomeAssistant) -> GoveePresetStore:
+    """Return the shared preset store, loading it on first use."""
+    store = hass.data[DOMAIN].get("presets")
+    if store is None:
+        store = GoveePresetStore(hass)
+        await store.async_load()
+        # Another strip may have loaded it meanwhile
+        store = hass.data[DOMAIN].setdefault("presets", store)
+    return store
+
+
+@callback
+def _async_get_profile(
+    hass: HomeAssistant, duration: float, memory: bool, filename: Optional[str]
+) -> tuple:
+    """
+    Return the running profile session and its completion future.
+
+    Strips profiled by one service call join the same session; the first one
+    starts it and schedules the report.
+    """
+    running = hass.data[DOMAIN].get("profile")
+    if running is not None:
+        return running
+
+    if not filename:
+        filename = f"profile_{time.strftime('%Y%m%d_%H%M%S')}"
+    # Reports always go to the profiles directory
+    filename = os.path.splitext(os.path.basename(filename))[0]
+    from .profiler import GoveeProfileSession
+
+    session = GoveeProfileSession(
+        os.path.join(hass.config.path(PROFILES_DIR), filename), duration, memory
+    )
+    try:
+        session.start()
+    except ValueError as err:
+        raise HomeAssistantError(f"Could not start profiling: {err}") from err
+    done = hass.loop.create_future()
+    running = hass.data[DOMAIN]["profile"] = (session, done)
+
+    async def _async_finish(_now) -> None:
+        hass.data[DOMAIN].pop("profile", None)
+        for strip in session.strips:
+            strip._profile = None
+        try:
+            await hass.async_add_executor_job(session.finish)
+        except Exception as err:
+            # Any failure must resolve done, or the service calls wait forever
+            done.set_exception(
+                HomeAssistantError(f"Could not write profile: {err}")
+            )
+            return
+        _LOGGER.info("Wrote profile of %d strips to %s.txt", len(session.strips), session.path)
+        done.set_result(session.path)
+
+    async_call_later(hass, duration, _async_finish)
+    return running
 
-class GoveeRazerStrip(LightEntity):
+
+def _next_restore_delay(hass: HomeAssistant) -> float:
+    """Reserve a start-up slot so restored strips do not all start on one tick."""
+    domain_data = hass.data[DOMAIN]
+    now = time.monotonic()
+    slot = max(now, domain_data.get("next_restore_time", 0.0)) + RESTORE_STAGGER
+    domain_data["next_restore_time"] = slot
+    return slot - now
+
+
+class GoveeRazerStrip(LightEntity, RestoreEntity):
     """Representation of a Govee Razer LED strip."""
 
     def __init__(
@@ -135,14 +409,283 @@ class GoveeRazerStrip(LightEntity):
         self._color_flow_step = 0
         self._color_flow_steps = 100
 
-        # Protocol and color management
-        self._protocol = GoveeProtocol(host, port)
-        self._color_manager = GoveeColorManager(num_leds, num_sections)
+        # Crossfade between effects; _fade_from is the outgoing effect
+        self._effect_transition = DEFAULT_EFFECT_TRANSITION
+        self._fade_from: Optional[str] = None
+        self._fade_start = 0.0
+
+        # Protocol and color management, created on first use
+        self._address = host
+        self._protocol: Optional[GoveeProtocol] = None
+        self._color_manager: Optional[GoveeColorManager] = None
+        # Restored section colors, applied when the color manager is created
+        self._restored_colors: dict = {}
+        # get_geometry() arguments of the LED layout
+        self._geometry_args: tuple = (LAYOUT_STRIP, num_leds)
+        self._blend_mode = DEFAULT_BLEND_MODE
 
         # Update task
         self._update_task: Optional[asyncio.Task] = None
         self._running = False
 
+        # Keep-alive scheduling
+        self._keepalive: Optional[GoveeKeepAliveScheduler] = None
+        self._keepalive_interval = DEFAULT_KEEPALIVE_INTERVAL
+        self._last_packet: Optional[bytes] = None
+        # Packet of the static frame identified by _static_frame_key
+        self._static_frame_key = None
+        self._static_packet: Optional[bytes] = None
+        self._rotation_offset = 0
+        self._frame_index = 0
+
+        # Shared cache of periodic animation cycles
+        self._animation_cache: Optional[GoveeAnimationCache] = None
+
+        # Render backend; the process stream exists while the loop runs
+        self._render_backend = RENDER_BACKEND_INLINE
+        self._render_stream: Optional["GoveeRenderStream"] = None
+
+        # Streamed frames from the ingest listener or push_frame service
+        self._stream_slot = GoveeFrameSlot()
+        self._stream_task: Optional[asyncio.Task] = None
+        self._ingest_port = DEFAULT_INGEST_PORT
+        self._ingest_transport = None
+        self._receiver_protocol = RECEIVER_NONE
+        self._receiver_universe = DEFAULT_RECEIVER_UNIVERSE
+        self._receiver_start = DEFAULT_RECEIVER_START
+        self._receiver_target = None
+
+        # Frame recording, active between start and stop_recording
+        self._recorder: Optional[GoveeFrameRecorder] = None
+
+        # Profile session this strip reports to, while one is running
+        self._profile: Optional["GoveeProfileSession"] = None
+
+        # Load shedding priority and the level set by the load governor
+        self._priority = DEFAULT_PRIORITY
+        self._load_level = LOAD_NORMAL
+        self._governor = None
+        # The held frame is stale after a change and is rendered once more
+        self._hold_stale = False
+
+        # Link health, registered when added to hass
+        self._link = None
+        # The next frame follows a change and is repeated on lossy links
+        self._key_frame = False
+
+        # Model reported by LAN discovery, if known
+        self._model = "Razer LED Strip"
+
+        # Pending staggered start after a restore
+        self._unsub_restore_start = None
+
+        # Fleet parameter changes and presets waiting for their frame boundary
+        self._staged_parameters: dict = {}
+        self._staged_preset: Optional[GoveeCompiledPreset] = None
+        self._staged_boundary = 0.0
+
+        # Section entities and compiled scene presets
+        self._sections: list = []
+        self._presets: dict = {}
+
+        # Section changes batched per frame window
+        self._pending_sections: dict = {}
+        self._pending_turn_on = False
+        self._section_batch: Optional[asyncio.Future] = None
+        self._unsub_section_batch = None
+
+    def set_device_record(self, device: dict) -> None:
+        """Apply cached discovery data for this strip."""
+        address = device.get("address")
+        if address and address != self._host:
+            # Follow the device to its last-known address (e.g. after a DHCP change)
+            _LOGGER.info(
+                "Using last-known address %s for %s (configured %s)",
+                address,
+                self._name,
+                self._host,
+            )
+            self._address = address
+        if device.get("sku"):
+            self._model = device["sku"]
+
+    def set_keepalive(
+        self, scheduler: GoveeKeepAliveScheduler, interval: float
+    ) -> None:
+        """Attach the fleet keep-alive scheduler and this strip's period."""
+        self._keepalive = scheduler
+        self._keepalive_interval = interval
+
+    def set_animation_cache(self, cache: GoveeAnimationCache) -> None:
+        """Attach the shared animation cycle cache."""
+        self._animation_cache = cache
+
+    def set_render_backend(self, backend: str) -> None:
+        """Select inline or process pool rendering."""
+        self._render_backend = backend
+
+    def set_geometry(
+        self, layout: str, width: int, serpentine: bool, segments: tuple
+    ) -> None:
+        """Set the physical LED layout used by spatial effects and the wave.
+
+        Args:
+            layout: LAYOUT_STRIP, LAYOUT_MATRIX or LAYOUT_SEGMENTS
+            width: Matrix columns
+            serpentine: Matrix rows alternate direction
+            segments: (length, direction) runs of a bent strip
+        """
+        self._geometry_args = (layout, self._num_leds, width, serpentine, segments)
+
+    def set_blend_mode(self, mode: str) -> None:
+        """Set how section colors are blended (srgb, linear or oklab)."""
+        self._blend_mode = mode
+
+    def set_priority(self, priority: str) -> None:
+        """Set the load shedding priority (low strips are degraded first)."""
+        self._priority = priority
+
+    def set_effect_transition(self, seconds: float) -> None:
+        """Set the crossfade time between effects (0 switches instantly)."""
+        self._effect_transition = seconds
+
+    def set_sections(self, sections: list) -> None:
+        """Attach the section entities, in palette order."""
+        self._sections = sections
+
+    def set_ingest_port(self, port: int) -> None:
+        """Set the localhost UDP port for streamed frames (0 disables it)."""
+        self._ingest_port = port
+
+    def set_receiver(self, protocol: str, universe: int, start: int) -> None:
+        """Map this strip onto an E1.31 universe or DDP channel range.
+
+        Args:
+            protocol: Receiver protocol, or "none"
+            universe: E1.31 universe (ignored for DDP)
+            start: 1-based first channel of the strip's RGB data
+        """
+        self._receiver_protocol = protocol
+        self._receiver_universe = universe
+        self._receiver_start = start
+
+    @property
+    def protocol(self) -> GoveeProtocol:
+        """Return the protocol handler, creating it on first use."""
+        if self._protocol is None:
+            self._protocol = GoveeProtocol(
+                self._address, self._port, self._keepalive_interval
+            )
+        return self._protocol
+
+    @property
+    def color_manager(self) -> GoveeColorManager:
+        """Return the color manager, creating it on first use."""
+        if self._color_manager is None:
+            manager = self._color_manager = self._create_color_manager()
+            for index, color in self._restored_colors.items():
+                manager.set_section_color(index, color)
+            self._restored_colors = {}
+        return self._color_manager
+
+    def _create_color_manager(self) -> GoveeColorManager:
+        """Create a color manager for this strip's layout and blend mode."""
+        return GoveeColorManager(
+            self._num_leds,
+            self._num_sections,
+            get_geometry(*self._geometry_args),
+            self._blend_mode,
+        )
+
+    def restore_section_color(self, index: int, color: tuple) -> None:
+        """Set a restored section color without creating the color manager."""
+        if self._color_manager is None:
+            self._restored_colors[index] = color
+            return
+        self._color_manager.set_section_color(index, color)
+        self.invalidate_frames()
+
+    async def async_added_to_hass(self) -> None:
+        """Restore the last state when added to Home Assistant."""
+        await super().async_added_to_hass()
+        self.attach()
+
+        store = await _async_get_preset_store(self.hass)
+        self._compile_presets(store.for_strip(self.unique_id))
+
+        if self._ingest_port:
+            self._ingest_transport = await async_start_ingest_listener(
+                self.hass.loop, self._ingest_port, self.push_stream_frame
+            )
+
+        if self._receiver_protocol != RECEIVER_NONE:
+            receiver = await _async_get_receiver(self.hass, self._receiver_protocol)
+            if receiver is not None:
+                self._receiver_target = receiver.register(
+                    self._receiver_universe,
+                    self._receiver_start - 1,
+                    self._num_leds * 3,
+                    self.push_stream_frame,
+                )
+
+        last_extra = await self.async_get_last_extra_data()
+        if last_extra is not None:
+            data = last_extra.as_dict()
+            self._brightness = data.get("brightness", DEFAULT_BRIGHTNESS)
+            if data.get("effect") in EFFECTS:
+                self._effect = data["effect"]
+            self._coordinator.update_parameters(
+                amplitude=data.get("amplitude", DEFAULT_AMPLITUDE),
+                speed=data.get("speed", DEFAULT_SPEED),
+                color_flow_speed=data.get("color_flow_speed", DEFAULT_COLOR_FLOW_SPEED),
+            )
+
+        last_state = await self.async_get_last_state()
+        if last_state is not None and last_state.state == STATE_ON:
+            # Sections restore their palette in the meantime, so the first
+            # frame is rendered from the complete restored state
+            self._is_on = True
+            self._unsub_restore_start = async_call_later(
+                self.hass, _next_restore_delay(self.hass), self._async_restore_start
+            )
+
+    @callback
+    def attach(self) -> None:
+        """Register with the shared link monitor, fleet and load governor.
+
+        Part of async_added_to_hass; the fleet harness calls it directly.
+        """
+        monitor = self.hass.data[DOMAIN].get("link_monitor")
+        if monitor is not None:
+            self._link = monitor.register(self._address)
+
+        self.hass.data[DOMAIN].setdefault("fleet", GoveeFleetCoordinator()).register(
+            self.unique_id, self._update_interval
+        )
+
+        self._governor = self.hass.data[DOMAIN].get("governor")
+        if self._governor is not None:
+            self._governor.register(self, self._priority)
+
+    async def _async_restore_start(self, _now) -> None:
+        """Start the update loop for a strip restored as on."""
+        self._unsub_restore_start = None
+        if self._is_on and not self._running:
+            await self._start_update_loop()
+
+    @property
+    def extra_restore_state_data(self) -> RestoredExtraData:
+        """Return strip state to persist across restarts."""
+        return RestoredExtraData(
+            {
+                "brightness": self._brightness,
+                "effect": self._effect,
+                "amplitude": self._amplitude,
+                "speed": self._speed,
+                "color_flow_speed": self._color_flow_speed,
+            }
+        )
+
     @property
     def name(self) -> str:
         """Return the name of the light."""
@@ -194,10 +737,21 @@ class GoveeRazerStrip(LightEntity):
             self._brightness = kwargs[ATTR_BRIGHTNESS]
 
         if ATTR_EFFECT in kwargs:
-            self._effect = kwargs[ATTR_EFFECT]
+            effect = kwargs[ATTR_EFFECT]
+            if (
+                effect != self._effect
+                and self._is_on
+                and self._running
+                and self._effect_transition > 0
+            ):
+                # Fade from what is on the strip now
+                self._fade_from = self._effect
+                self._fade_start = time.monotonic()
+            self._effect = effect
 
         self._is_on = True
-        
+        self.invalidate_frames()
+
         if not self._running:
             await self._start_update_loop()
 
@@ -208,146 +762,714 @@ class GoveeRazerStrip(LightEntity):
         self._is_on = False
         await self._stop_update_loop()
         
-        # Send all black
+        # Send all black, even if this session never drove the strip
         await self.hass.async_add_executor_job(
-            self._protocol.send_colors, [(0, 0, 0)] * self._num_sections, self._num_leds, True
+            self.protocol.send_colors,
+            [(0, 0, 0)] * self._num_sections,
+            self._num_leds,
+            True,
         )
         
         self.async_write_ha_state()
 
     async def async_set_wave(self, amplitude: Optional[int] = None, speed: Optional[int] = None) -> None:
         """Set wave parameters."""
+        self._coordinator.update_parameters(amplitude=amplitude, speed=speed)
+        _LOGGER.debug("Set wave: amplitude=%s, speed=%s", self._amplitude, self._speed)
+
+    async def async_set_color_flow(self, speed: int) -> None:
+        """Set color flow speed."""
+        self._coordinator.update_color_flow_speed(speed)
+        _LOGGER.debug("Set color flow speed: %s", speed)
+
+    async def async_set_parameters(self, **params: Any) -> None:
+        """
+        Stage parameters for the fleet-wide frame boundary.
+
+        All strips targeted by one service call share the boundary, so the
+        change lands on the same frame for each of them.
+        """
+        fleet = self.hass.data[DOMAIN]["fleet"]
+        self._staged_parameters.update(params)
+        self._staged_boundary = fleet.boundary(time.monotonic())
+        if not self._running:
+            # No frame to wait for
+            self._apply_staged()
+
+    def _apply_staged(self) -> None:
+        """Apply the staged preset and parameters, restarting the animation in phase."""
+        preset, self._staged_preset = self._staged_preset, None
+        params, self._staged_parameters = self._staged_parameters, {}
+        # Discard frames rendered ahead before restarting the phase
+        self.invalidate_frames()
+        self._wave_step = 0
+        self._color_flow_step = 0
+        self._rotation_offset = 0
+        if preset is not None:
+            self._apply_preset(preset)
+        if params:
+            self._coordinator.update_parameters(**params)
+
+    def _apply_preset(self, preset: GoveeCompiledPreset) -> None:
+        """Switch to a compiled preset without rendering."""
+        # Presets switch on the boundary frame, without a crossfade
+        self._fade_from = None
+        manager = self.color_manager
+        manager.palette[:] = preset.palette
+        for section, state in zip(self._sections, preset.sections):
+            section.load_preset_state(state)
+        self._effect = preset.effect
+        self._coordinator.update_parameters(
+            amplitude=preset.amplitude,
+            speed=preset.speed,
+            color_flow_speed=preset.color_flow_speed,
+            brightness=preset.brightness,
+        )
+        if preset.frame is not None:
+            # Static scene: the next frame is the compiled packet
+            manager.load_frame(preset.effect, preset.frame)
+            self._static_frame_key = (preset.effect, manager.frame_version, preset.brightness)
+            self._static_packet = preset.packet
+        for section in self._sections:
+            if section.entity_id is not None:
+                section.async_write_ha_state()
+
+    def _preset_state(self) -> dict:
+        """Return the strip's current state as a preset."""
+        return {
+            "sections": [section.preset_state for section in self._sections],
+            "effect": self._effect,
+            "brightness": self._brightness,
+            "amplitude": self._amplitude,
+            "speed": self._speed,
+            "color_flow_speed": self._color_flow_speed,
+        }
+
+    def _compile_presets(self, presets: dict) -> None:
+        """Compile stored presets of this strip."""
+        if not presets:
+            # Keep strips without presets free of a color manager at startup
+            return
+        manager = self._create_color_manager()
+        for name, state in presets.items():
+            try:
+                self._presets[name] = compile_preset(name, state, manager, self.protocol)
+            except (KeyError, TypeError, ValueError) as err:
+                _LOGGER.warning("Ignoring invalid preset %s of %s: %s", name, self._name, err)
+
+    async def async_save_preset(self, preset: str) -> None:
+        """Save the current state as a preset of this strip."""
+        state = self._preset_state()
+        store = await _async_get_preset_store(self.hass)
+        store.save(preset, self.unique_id, state)
+        self._compile_presets({preset: state})
+
+    async def async_activate_preset(self, preset: str) -> None:
+        """
+        Switch to a preset on the fleet-wide frame boundary.
+
+        All strips targeted by one call switch on the same frame; running
+        strips apply the compiled preset in their frame tick.
+        """
+        compiled = self._presets.get(preset)
+        if compiled is None:
+            raise HomeAssistantError(f"{self._name} has no preset {preset!r}")
+        self._staged_preset = compiled
+        self._staged_boundary = self.hass.data[DOMAIN]["fleet"].boundary(time.monotonic())
+        if not self._running:
+            self._apply_staged()
+            await self.async_turn_on()
+
+    async def async_delete_preset(self, preset: str) -> None:
+        """Delete this strip's entry of a preset."""
+        store = await _async_get_preset_store(self.hass)
+        if not store.delete(preset, self.unique_id):
+            raise HomeAssistantError(f"{self._name} has no preset {preset!r}")
+        self._presets.pop(preset, None)
+
+    @callback
+    def apply_parameters(
+        self,
+        amplitude: Optional[int] = None,
+        speed: Optional[int] = None,
+        color_flow_speed: Optional[int] = None,
+        brightness: Optional[int] = None,
+    ) -> None:
+        """
+        Apply wave, color flow and brightness changes in one step.
+
+        Derived animation state is recomputed and rendered frames are
+        invalidated once for the whole change. Parameters left as None keep
+        their value.
+        """
         if amplitude is not None:
-            self._coordinator.update_amplitude(amplitude)
             self._amplitude = amplitude
-            
         if speed is not None:
-            self._coordinator.update_speed(speed)
             self._speed = speed
             if speed != 0:
                 self._wave_steps = round((2 * math.pi / (speed / 100)) + 1)
             else:
                 self._wave_steps = 100
+        if color_flow_speed is not None:
+            self._color_flow_speed = color_flow_speed
+            if color_flow_speed != 0:
+                self._color_flow_steps = abs(round(100 / color_flow_speed))
+            else:
+                self._color_flow_steps = 100
+        if brightness is not None:
+            self._brightness = brightness
 
-        _LOGGER.debug("Set wave: amplitude=%s, speed=%s", self._amplitude, self._speed)
-        self.async_write_ha_state()
+        self.invalidate_frames()
+        if self.entity_id is not None:
+            self.async_write_ha_state()
 
-    async def async_set_color_flow(self, speed: int) -> None:
-        """Set color flow speed."""
-        self._coordinator.update_color_flow_speed(speed)
-        self._color_flow_speed = speed
-        if speed != 0:
-            self._color_flow_steps = abs(round(100 / speed))
+    async def async_push_frame(self, frame: str) -> None:
+        """Push a base64 encoded RGB frame (3 bytes per LED) to the strip."""
+        try:
+            data = base64.b64decode(frame, validate=True)
+        except (binascii.Error, ValueError) as err:
+            raise HomeAssistantError(f"Frame is not valid base64: {err}") from err
+        if not data or len(data) % 3:
+            raise HomeAssistantError("Frame must contain 3 bytes per LED")
+        self.push_stream_frame(data)
+
+    @callback
+    def push_stream_frame(self, frame: bytes) -> None:
+        """Queue a streamed frame; only the newest unsent frame is kept."""
+        if not self._is_on:
+            # Streaming does not turn the strip on
+            self._stream_slot.frames_dropped += 1
+            return
+        self._stream_slot.push(frame)
+
+    @property
+    def stream_stats(self) -> dict:
+        """Return ingest statistics for diagnostics."""
+        return self._stream_slot.as_dict()
+
+    async def _stream_loop(self) -> None:
+        """Send streamed frames as soon as they arrive, at most 60 per second."""
+        frame_size = self._num_leds * 3
+        next_send = 0.0
+        while True:
+            # Frames pushed while waiting out the interval replace each other
+            delay = next_send - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            frame, received_at = await self._stream_slot.wait()
+            if frame is None:
+                continue
+            now = time.monotonic()
+            next_send = now + STREAM_MIN_INTERVAL
+            try:
+                packet = self.protocol.encode_colors(
+                    memoryview(frame)[:frame_size], False
+                )
+                await self._send_frame(packet, now)
+            except Exception as err:
+                _LOGGER.error("Error sending streamed frame: %s", err)
+                continue
+            self._stream_slot.record_sent(received_at)
+
+    async def async_update_section(
+        self, index: int, section: "GoveeRazerSection", turn_on: bool = False
+    ) -> None:
+        """
+        Apply a section change together with all others in the same frame window.
+
+        Sections changed within one update interval (e.g. by a scene) are
+        written to the palette together, invalidate the rendered frames once
+        and write their states in one pass.
+
+        Args:
+            index: Section index
+            section: Section entity; its color is read when the batch is applied
+            turn_on: Turn the strip on if it is off
+        """
+        self._pending_sections[index] = section
+        self._pending_turn_on |= turn_on
+        if self._section_batch is None:
+            self._section_batch = self.hass.loop.create_future()
+            self._unsub_section_batch = async_call_later(
+                self.hass, self._update_interval, self._async_apply_section_batch
+            )
+        await asyncio.shield(self._section_batch)
+
+    async def _async_apply_section_batch(self, _now) -> None:
+        """Apply all section changes queued in this frame window."""
+        self._unsub_section_batch = None
+        sections, self._pending_sections = self._pending_sections, {}
+        turn_on, self._pending_turn_on = self._pending_turn_on, False
+        batch, self._section_batch = self._section_batch, None
+        try:
+            for index, section in sections.items():
+                self.color_manager.set_section_color(index, section.section_color)
+            self.invalidate_frames()
+            if turn_on and not self._is_on:
+                await self.async_turn_on()
+            for section in sections.values():
+                section.async_write_ha_state()
+        except Exception as err:
+            # The waiting sections raise it to their service calls
+            batch.set_exception(err)
         else:
-            self._color_flow_steps = 100
-        
-        _LOGGER.debug("Set color flow speed: %s", speed)
-        self.async_write_ha_state()
+            batch.set_result(None)
+
+    def invalidate_frames(self) -> None:
+        """Drop pre-rendered and cached frames after a parameter or palette change."""
+        self._hold_stale = True
+        self._key_frame = True
+        if self._render_stream is not None:
+            state = self._render_stream.invalidate()
+            if state is not None:
+                # Resume the animation at the first discarded frame
+                (
+                    self._wave_step,
+                    self._color_flow_step,
+                    self._rotation_offset,
+                    self._frame_index,
+                ) = state
+        if self._animation_cache is not None:
+            self._animation_cache.invalidate(self.unique_id)
+
+    def _advance_animation(self) -> tuple:
+        """Advance the wave and color flow by one frame.
+
+        Returns:
+            Tuple of (wave_step, rotation) for the frame; rotation is None
+            when color flow is off
+        """
+        rotation = None
+        if self._color_flow_speed != 0:
+            if self._color_flow_step == 0:
+                self._rotation_offset = (self._rotation_offset + 1) % self._num_sections
+            # Direction is handled by the sign of the rotation
+            rotation = (
+                self._rotation_offset
+                if self._color_flow_speed > 0
+                else -self._rotation_offset
+            )
+            self._color_flow_step = (self._color_flow_step + 1) % self._color_flow_steps
+
+        wave_step = self._wave_step
+        if self._load_level < LOAD_WAVE_FROZEN:
+            self._wave_step = (self._wave_step + 1) % self._wave_steps
+        return wave_step, rotation
+
+    def _fade_state(self) -> Optional[tuple]:
+        """Return (outgoing effect, weight 0-255) during a crossfade, else None."""
+        if self._fade_from is None:
+            return None
+        progress = (time.monotonic() - self._fade_start) / self._effect_transition
+        if progress >= 1.0 or self._fade_from == self._effect:
+            self._fade_from = None
+            return None
+        return self._fade_from, int(progress * 255)
+
+    def _next_render_job(self) -> tuple:
+        """Describe the next frame for a render worker.
+
+        Returns:
+            Tuple of (job, animation state before the job)
+        """
+        state = (
+            self._wave_step,
+            self._color_flow_step,
+            self._rotation_offset,
+            self._frame_index,
+        )
+        wave_step, rotation = self._advance_animation()
+        t = self._frame_index * self._update_interval
+        self._frame_index += 1
+        job = (
+            bytes(self.color_manager.palette),
+            self._effect,
+            t,
+            self._brightness,
+            self._amplitude,
+            self._speed,
+            wave_step,
+            rotation,
+            self._fade_state(),
+        )
+        return job, state
+
+    def _animation_cycle(self, effect) -> Optional[GoveeAnimationCycle]:
+        """Return the cached cycle for a periodic wave/flow animation.
+
+        Only static effects are periodic; the frame then depends on the wave
+        step (when the wave is on) and the color flow rotation (when flow is on).
+        """
+        if self._animation_cache is None or effect.animated:
+            return None
+        frame_count = 1
+        if self._amplitude != 0:
+            frame_count *= abs(self._wave_steps)
+        if self._color_flow_speed != 0:
+            frame_count *= self._num_sections
+        signature = (
+            self._effect,
+            bytes(self.color_manager.palette),
+            self._brightness,
+            self._amplitude,
+            self._speed,
+            self._color_flow_speed != 0,
+        )
+        return self._animation_cache.cycle(self.unique_id, signature, frame_count)
+
+    def _render_inline(self, effect, t: float) -> bytes:
+        """Render and encode the next frame on the event loop."""
+        wave_step, rotation = self._advance_animation()
+        fade = self._fade_state()
+        if self._recorder is None:
+            return self._render_packet(effect, t, wave_step, rotation, fade)
+
+        start = time.perf_counter()
+        packet = self._render_packet(effect, t, wave_step, rotation, fade)
+        self._recorder.record(
+            time.monotonic(),
+            time.perf_counter() - start,
+            self._effect,
+            t,
+            self._brightness,
+            self._amplitude,
+            self._speed,
+            wave_step,
+            rotation,
+            self.color_manager.palette,
+            packet,
+            fade,
+        )
+        return packet
+
+    def _render_packet(
+        self,
+        effect,
+        t: float,
+        wave_step: int,
+        rotation: Optional[int],
+        fade: Optional[tuple] = None,
+    ) -> bytes:
+        """Return the packet for a frame, from the caches when possible."""
+        # Crossfade frames are rendered live and never cached
+        if fade is not None:
+            render_frame(
+                self.color_manager,
+                self._effect,
+                t,
+                self._brightness,
+                self._amplitude,
+                self._speed,
+                wave_step,
+                rotation,
+                fade,
+            )
+            self._static_frame_key = None
+            self._static_packet = None
+            return self.protocol.encode_frame(effect.gradient)
 
-    def _calculate_brightness_wave(self, led_index: int) -> int:
-        """Calculate brightness for a specific LED based on wave parameters."""
-        if self._amplitude == 0:
-            return self._brightness
+        # Static effect without wave or flow: reuse the last packet until
+        # the palette, effect or brightness changes
+        frame_key = None
+        if rotation is None and not effect.animated and self._amplitude == 0:
+            self.color_manager.render(self._effect)
+            frame_key = (
+                self._effect,
+                self.color_manager.frame_version,
+                self._brightness,
+            )
+            if frame_key == self._static_frame_key:
+                return self._static_packet
+
+        # Periodic animation: replay the cached cycle
+        cycle = None
+        if frame_key is None:
+            cycle = self._animation_cycle(effect)
+            state = (wave_step if self._amplitude != 0 else 0, rotation)
+            if cycle is not None:
+                packet = cycle.get(state)
+                if packet is not None:
+                    return packet
 
-        phase = (2 * math.pi * led_index) / (self._num_leds - 1)
-        wave_offset = self._amplitude * math.sin(phase + self._wave_step * (self._speed / 100))
-        brightness = self._brightness + wave_offset
-        return max(0, min(255, int(brightness)))
+        # Renders into the protocol's packet buffer (see _update_loop)
+        render_frame(
+            self.color_manager,
+            self._effect,
+            t,
+            self._brightness,
+            self._amplitude,
+            self._speed,
+            wave_step,
+            rotation,
+        )
+        packet = self.protocol.encode_frame(effect.gradient)
+        if cycle is not None:
+            self._animation_cache.put(self.unique_id, state, packet)
+        self._static_frame_key = frame_key
+        self._static_packet = packet if frame_key is not None else None
+        return packet
 
     async def _update_loop(self) -> None:
         """Main update loop for sending LED data."""
         self._running = True
-
-        rotation_offset = 0
+        self._rotation_offset = 0
+        self._frame_index = 0
+        self._fade_from = None
+        self._key_frame = True
 
         # Enable protocol
-        await self.hass.async_add_executor_job(self._protocol.send_enable, True)
+        await self.hass.async_add_executor_job(self.protocol.send_enable, True)
+        if self._keepalive is not None:
+            self._keepalive.start(self.protocol)
+        self._last_packet = None
+        self._static_frame_key = None
+        self._static_packet = None
+        effect_start = time.monotonic()
+        last_tick = effect_start
+        next_tick = effect_start
 
-        while self._running:
-            try:
-                if self._is_on:
-                    # Apply color flow rotation if enabled
-                    if self._color_flow_speed != 0:
-                        # Calculate rotation offset as a floating point for smooth rotation
-                        # Each step advances by (speed/100) through the color array
-                        if self._color_flow_step == 0: 
-                            rotation_offset = (rotation_offset + 1) % self._num_sections
-#                        rotation_offset = (self._color_flow_step * abs(self._color_flow_speed) / 100.0) % self._num_sections
-                        
-                        # Rotate the section colors
-                        rotated_colors = []
-                        for i in range(self._num_sections):
-                            # Calculate the floating point position in the original color array
-                            if self._color_flow_speed > 0:
-                                # Forward rotation
-                                pos = (i - rotation_offset) % self._num_sections
+        # Render straight into the payload area of the LED data packet
+        self.color_manager.output = self.protocol.frame_buffer(self._num_leds)
+
+        if self._render_backend == RENDER_BACKEND_PROCESS:
+            pool = self.hass.data[DOMAIN].get("render_pool")
+            if pool is None:
+                from .render_pool import GoveeRenderPool
+
+                pool = self.hass.data[DOMAIN]["render_pool"] = GoveeRenderPool(
+                    RENDER_POOL_WORKERS, RENDER_QUEUE_DEPTH
+                )
+            self._render_stream = pool.create_stream(
+                self._num_leds, self._num_sections, self._geometry_args, self._blend_mode
+            )
+            self._render_stream.start(self._next_render_job)
+
+        self._stream_task = self.hass.async_create_background_task(
+            self._stream_loop(), f"{DOMAIN}_stream_{self._host}"
+        )
+
+        try:
+            while self._running:
+                try:
+                    now = time.monotonic()
+                    profile = self._profile
+                    if profile is not None:
+                        profile.add(self._name, "interval", now - last_tick)
+                    last_tick = now
+
+                    if (
+                        self._staged_parameters or self._staged_preset is not None
+                    ) and now >= self._staged_boundary:
+                        self._apply_staged()
+
+                    # Streamed frames take over; effects resume once they stop
+                    streaming = now - self._stream_slot.last_push < STREAM_HOLD
+                    if self._is_on and not streaming:
+                        effect = self.color_manager.get_effect(self._effect)
+                        render_start = time.perf_counter()
+
+                        if (
+                            self._load_level >= LOAD_STATIC
+                            and self._last_packet is not None
+                            and not self._hold_stale
+                            and self._fade_from is None
+                        ):
+                            # Shedding load: hold the last frame
+                            packet = self._last_packet
+                        elif self._render_stream is not None:
+                            output = self._render_stream.pop_frame()
+                            if output is not None:
+                                if profile is None:
+                                    packet = self.protocol.encode_colors(
+                                        output, effect.gradient
+                                    )
+                                else:
+                                    packet = profile.call(
+                                        self._name,
+                                        "render",
+                                        self.protocol.encode_colors,
+                                        output,
+                                        effect.gradient,
+                                    )
                             else:
-                                # Backward rotation
-                                pos = (i + rotation_offset) % self._num_sections
-                            
-                            # Get the two colors to interpolate between
-                            base_index = int(pos) % self._num_sections
-                            next_index = (base_index + 1) % self._num_sections
-                            
-                            # Interpolation factor (fractional part of position)
-                            interp_factor = pos - int(pos)
-                            
-                            base_color = self._color_manager.section_colors[base_index]
-                            next_color = self._color_manager.section_colors[next_index]
-                            
-                            # Interpolate between colors
-                            r = int(base_color[0] * (1 - interp_factor) + next_color[0] * interp_factor)
-                            g = int(base_color[1] * (1 - interp_factor) + next_color[1] * interp_factor)
-                            b = int(base_color[2] * (1 - interp_factor) + next_color[2] * interp_factor)
-                            
-                            rotated_colors.append([r, g, b])
-                        
-                        # Temporarily update color manager with rotated colors
-                        original_colors = self._color_manager.section_colors.copy()
-                        self._color_manager.section_colors = rotated_colors
-                        
-                        # Generate effect colors with rotated sections
-                        base_colors = self._color_manager.generate_effect_colors(self._effect)
-                        
-                        # Restore original colors
-                        self._color_manager.section_colors = original_colors
-                        
-                        # Update color flow step (always increment, direction handled in calculation)
-                        self._color_flow_step = (self._color_flow_step + 1) % self._color_flow_steps
-                    else:
-                        # No color flow, use static colors
-                        base_colors = self._color_manager.generate_effect_colors(self._effect)
-                    
-                    # Apply brightness wave
-                    final_colors = []
-                    for i, (r, g, b) in enumerate(base_colors):
-                        led_brightness = self._calculate_brightness_wave(i)
-                        scale = led_brightness / 255.0
-                        final_colors.append(
-                            (int(r * scale), int(g * scale), int(b * scale))
-                        )
-
-                    # Send to device
-                    await self.hass.async_add_executor_job(
-                        self._protocol.send_colors,
-                        final_colors,
-                        self._num_leds,
-                        self._effect == EFFECT_STRETCHED,
-                    )
-
-                    # Update wave step
-                    self._wave_step = (self._wave_step + 1) % self._wave_steps
-
-                await asyncio.sleep(self._update_interval)
+                                # Worker lagging behind: repeat the last frame
+                                packet = self._last_packet
+                        elif profile is None:
+                            packet = self._render_inline(effect, now - effect_start)
+                        else:
+                            packet = profile.call(
+                                self._name,
+                                "render",
+                                self._render_inline,
+                                effect,
+                                now - effect_start,
+                            )
 
-            except asyncio.CancelledError:
-                break
-            except Exception as err:
-                _LOGGER.error("Error in update loop: %s", err)
-                await asyncio.sleep(1)
+                        if packet is not None:
+                            if packet is not self._last_packet:
+                                self._hold_stale = False
+                            # Only frames after a change and static frames are
+                            # repeated; the animation stream itself is not
+                            key_frame = self._key_frame or packet is self._static_packet
+                            self._key_frame = False
+                            send_start = time.perf_counter()
+                            await self._send_frame(packet, now, key_frame)
+                            send_end = time.perf_counter()
+                            if profile is not None:
+                                profile.add(self._name, "send", send_end - send_start)
+                            if self._governor is not None:
+                                self._governor.record(
+                                    send_start - render_start, send_end - send_start
+                                )
+
+                        if self._recorder is not None:
+                            await self._async_flush_recording()
+
+                    # Pace against a deadline so the frame work does not
+                    # stretch the period
+                    interval = self._update_interval
+                    if self._load_level >= LOAD_REDUCED_FPS:
+                        interval *= GOVERNOR_FPS_DIVISOR
+                    next_tick += interval
+                    delay = next_tick - time.monotonic()
+                    if delay < 0:
+                        # Fell behind; skip the missed ticks instead of bursting
+                        next_tick = time.monotonic()
+                        delay = 0
+                    await asyncio.sleep(delay)
+
+                except asyncio.CancelledError:
+                    break
+                except Exception as err:
+                    _LOGGER.error("Error in update loop: %s", err)
+                    await asyncio.sleep(1)
+        finally:
+            if self._stream_task is not None:
+                self._stream_task.cancel()
+                self._stream_task = None
+            if self._render_stream is not None:
+                stream, self._render_stream = self._render_stream, None
+                await stream.async_close()
 
         self._running = False
 
+    async def _send_frame(
+        self, packet: bytes, now: float, key_frame: bool = False
+    ) -> None:
+        """Send an encoded frame, handling keep-alive and link redundancy."""
+        # Keep-alive; on an idle tick the enable replaces the repeated frame
+        idle = packet == self._last_packet
+        send_frame = True
+        if self._keepalive is not None and self._keepalive.poll(
+            self.protocol, now, idle
+        ):
+            await self.hass.async_add_executor_job(
+                self.protocol.send_enable, True
+            )
+            send_frame = not idle
+
+        # Send to device, repeating key frames on lossy links
+        if send_frame:
+            repeat = 1
+            if key_frame and self._link is not None and not idle:
+                repeat = self._link.redundancy
+            await self.hass.async_add_executor_job(
+                self.protocol.send_packet, packet, repeat
+            )
+        self._last_packet = packet
+
+    async def async_start_recording(self, filename: Optional[str] = None) -> None:
+        """Start recording rendered frames for offline replay."""
+        if self._render_backend != RENDER_BACKEND_INLINE:
+            raise HomeAssistantError("Recording requires the inline render backend")
+        if self._recorder is not None:
+            await self.async_stop_recording()
+
+        if not filename:
+            filename = f"{self._host.replace('.', '_')}_{time.strftime('%Y%m%d_%H%M%S')}"
+        # Recordings always go to the recordings directory
+        filename = os.path.basename(filename)
+        if not filename.endswith(RECORDING_EXTENSION):
+            filename += RECORDING_EXTENSION
+        directory = self.hass.config.path(RECORDINGS_DIR)
+        recorder = GoveeFrameRecorder(
+            os.path.join(directory, filename),
+            self._num_leds,
+            self._num_sections,
+            RECORDING_MAX_BYTES,
+            self._blend_mode,
+            self._geometry_args,
+        )
+
+        def _open() -> None:
+            os.makedirs(directory, exist_ok=True)
+            recorder.open()
+
+        try:
+            await self.hass.async_add_executor_job(_open)
+        except OSError as err:
+            raise HomeAssistantError(f"Could not create recording: {err}") from err
+        self._recorder = recorder
+        _LOGGER.info("Recording %s to %s", self._name, recorder.path)
+
+    async def async_stop_recording(self) -> None:
+        """Stop recording and close the file."""
+        recorder, self._recorder = self._recorder, None
+        if recorder is None:
+            return
+        await self.hass.async_add_executor_job(recorder.close)
+        _LOGGER.info(
+            "Recorded %d frames of %s to %s", recorder.frames, self._name, recorder.path
+        )
+
+    async def _async_flush_recording(self) -> None:
+        """Write buffered records, stopping at the size cap."""
+        if self._recorder.full:
+            _LOGGER.warning("Recording of %s reached its size limit", self._name)
+            await self.async_stop_recording()
+        elif self._recorder.pending >= RECORDING_FLUSH_BYTES:
+            await self.hass.async_add_executor_job(self._recorder.flush)
+
+    async def async_profile(
+        self,
+        duration: float = DEFAULT_PROFILE_DURATION,
+        memory: bool = True,
+        filename: Optional[str] = None,
+    ) -> None:
+        """
+        Profile this strip's frame loop for a bounded window.
+
+        Returns once the report is written. Strips profiled together share
+        one session and report; a call while a session runs joins it.
+        """
+        session, done = _async_get_profile(self.hass, duration, memory, filename)
+        session.strips.add(self)
+        self._profile = session
+        await asyncio.shield(done)
+
+    @property
+    def load_level(self) -> int:
+        """Return the degradation level set by the load governor."""
+        return self._load_level
+
+    @callback
+    def set_load_level(self, level: int) -> None:
+        """Apply a degradation level (LOAD_NORMAL to LOAD_STATIC)."""
+        self._load_level = level
+
+    @property
+    def preset_stats(self) -> dict:
+        """Return compiled preset names for diagnostics, split by kind."""
+        return {
+            "static": sorted(n for n, p in self._presets.items() if p.packet is not None),
+            "animated": sorted(n for n, p in self._presets.items() if p.packet is None),
+        }
+
+    @property
+    def recording_stats(self) -> Optional[dict]:
+        """Return recording statistics for diagnostics."""
+        return None if self._recorder is None else self._recorder.as_dict()
+
     async def _start_update_loop(self) -> None:
         """Start the update loop."""
         if self._update_task is None or self._update_task.done():
@@ -366,11 +1488,48 @@ class GoveeRazerStrip(LightEntity):
 
     async def async_will_remove_from_hass(self) -> None:
         """Clean up when entity is removed."""
+        if self._unsub_restore_start is not None:
+            self._unsub_restore_start()
+            self._unsub_restore_start = None
+        if self._unsub_section_batch is not None:
+            # Release waiting sections; their changes die with the strip
+            self._unsub_section_batch()
+            self._unsub_section_batch = None
+            self._pending_sections = {}
+            batch, self._section_batch = self._section_batch, None
+            if batch is not None and not batch.done():
+                batch.set_result(None)
+        monitor = self.hass.data[DOMAIN].get("link_monitor")
+        if monitor is not None:
+            monitor.unregister(self._address)
+        self._link = None
+        fleet = self.hass.data[DOMAIN].get("fleet")
+        if fleet is not None:
+            fleet.unregister(self.unique_id)
+        if self._governor is not None:
+            self._governor.unregister(self)
+            self._governor = None
+        if self._ingest_transport is not None:
+            self._ingest_transport.close()
+            self._ingest_transport = None
+        if self._receiver_target is not None:
+            receivers = self.hass.data[DOMAIN].get("receivers", {})
+            receiver = receivers.get(self._receiver_protocol)
+            if receiver is not None:
+                receiver.unregister(self._receiver_target)
+                if not receiver.has_targets:
+                    receiver.close()
+                    receivers.pop(self._receiver_protocol)
+            self._receiver_target = None
         await self._stop_update_loop()
-        await self.hass.async_add_executor_job(self._protocol.close)
+        await self.async_stop_recording()
+        if self._animation_cache is not None:
+            self._animation_cache.invalidate(self.unique_id)
+        if self._protocol is not None:
+            await self.hass.async_add_executor_job(self._protocol.close)
 
 
-class GoveeRazerSection(LightEntity):
+class GoveeRazerSection(LightEntity, RestoreEntity):
     """Representation of a single section of the LED strip."""
 
     def __init__(
@@ -391,6 +1550,45 @@ class GoveeRazerSection(LightEntity):
         # State
         self._rgb_color = (255, 255, 255)
         self._brightness = 255
+        self._active = True
+
+    async def async_added_to_hass(self) -> None:
+        """Restore the section palette without starting the strip."""
+        await super().async_added_to_hass()
+
+        last_extra = await self.async_get_last_extra_data()
+        if last_extra is None:
+            return
+        data = last_extra.as_dict()
+        self._rgb_color = tuple(data.get("rgb_color", self._rgb_color))
+        self._brightness = data.get("brightness", self._brightness)
+        self._active = data.get("active", True)
+        self._strip.restore_section_color(self._section_index, self.section_color)
+
+    @property
+    def extra_restore_state_data(self) -> RestoredExtraData:
+        """Return section state to persist across restarts."""
+        return RestoredExtraData(self.preset_state)
+
+    @property
+    def section_color(self) -> tuple:
+        """Return the color this section contributes to the strip palette."""
+        return section_color(self._rgb_color, self._brightness, self._active)
+
+    @property
+    def preset_state(self) -> dict:
+        """Return the section state stored in presets."""
+        return {
+            "rgb_color": list(self._rgb_color),
+            "brightness": self._brightness,
+            "active": self._active,
+        }
+
+    def load_preset_state(self, state: dict) -> None:
+        """Take over the section state of a preset; the strip updates the palette."""
+        self._rgb_color = tuple(state["rgb_color"])
+        self._brightness = state["brightness"]
+        self._active = state["active"]
 
     @property
     def name(self) -> str:
@@ -435,24 +1633,18 @@ class GoveeRazerSection(LightEntity):
         if ATTR_BRIGHTNESS in kwargs:
             self._brightness = kwargs[ATTR_BRIGHTNESS]
 
-        # Apply brightness to RGB
-        scale = self._brightness / 255.0
-        adjusted_rgb = tuple(int(c * scale) for c in self._rgb_color)
-        
-        # Update color manager
-        self._strip._color_manager.set_section_color(self._section_index, adjusted_rgb)
-
-        # Turn on the strip if it's off
-        if not self._strip.is_on:
-            await self._strip.async_turn_on()
-
-        self.async_write_ha_state()
+        # Applied with the other sections changed in this frame window,
+        # turning on the strip if it's off
+        self._active = True
+        await self._strip.async_update_section(
+            self._section_index, self, turn_on=True
+        )
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the section."""
         # Set section to black
-        self._strip._color_manager.set_section_color(self._section_index, (0, 0, 0))
-        self.async_write_ha_state()
+        self._active = False
+        await self._strip.async_update_section(self._section_index, self)
 
     @property
     def device_info(self):
@@ -461,5 +1653,5 @@ class GoveeRazerSection(LightEntity):
             "identifiers": {(DOMAIN, self._strip._host)},
             "name": self._strip.name,
             "manufacturer": "Govee",
-            "model": "Razer LED Strip",
+            "model": self._strip._model,
         }
@@ -82,14 +82,8 @@ class GoveeWaveAmplitude(NumberEntity):
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the value via coordinator."""
-        self._value = int(value)
+        # The coordinator writes this entity's state and updates the strip
         self._coordinator.update_amplitude(int(value))
-        
-        # Also call the strip's async_set_wave to trigger the update
-        if self._coordinator.strip_entity:
-            await self._coordinator.strip_entity.async_set_wave(amplitude=int(value))
-        
-        self.async_write_ha_state()
 
     @property
     def device_info(self):
@@ -144,14 +138,8 @@ class GoveeWaveSpeed(NumberEntity):
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the value via coordinator."""
-        self._value = int(value)
+        # The coordinator writes this entity's state and updates the strip
         self._coordinator.update_speed(int(value))
-        
-        # Also call the strip's async_set_wave to trigger the update
-        if self._coordinator.strip_entity:
-            await self._coordinator.strip_entity.async_set_wave(speed=int(value))
-        
-        self.async_write_ha_state()
 
     @property
     def device_info(self):
@@ -206,14 +194,8 @@ class GoveeColorFlowSpeed(NumberEntity):
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the value via coordinator."""
-        self._value = int(value)
+        # The coordinator writes this entity's state and updates the strip
         self._coordinator.update_color_flow_speed(int(value))
-        
-        # Call the strip's async_set_color_flow
-        if self._coordinator.strip_entity:
-            await self._coordinator.strip_entity.async_set_color_flow(int(value))
-        
-        self.async_write_ha_state()
 
     @property
     def device_info(self):
@@ -0,0 +1,143 @@
+"""Named scene presets, stored per strip and compiled ahead of time.
+
+A preset captures a strip's section colors, effect, brightness and wave and
+color flow parameters. Saving a preset on several strips at once (one
+service call) stores one entry per strip under the same name, so the preset
+covers the whole group.
+
+Each strip compiles its presets when it loads or saves them: the section
+palette is resolved, and for static scenes (no animation, wave or color
+flow) the frame and the ready-to-send packet are rendered too. Activating a
+preset only copies the compiled state in, so a group switches on one frame.
+"""
+import logging
+from typing import Optional
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import PRESET_SAVE_DELAY, PRESET_STORAGE_KEY, PRESET_STORAGE_VERSION
+from .govee_protocol import GoveeColorManager, GoveeProtocol
+from .renderer import render_frame
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def section_color(rgb: tuple, brightness: int, active: bool) -> tuple:
+    """Return a section's palette color: its color scaled by its brightness."""
+    if not active:
+        return (0, 0, 0)
+    scale = brightness / 255.0
+    return tuple(int(c * scale) for c in rgb)
+
+
+class GoveeCompiledPreset:
+    """A preset resolved for one strip, ready to activate."""
+
+    __slots__ = (
+        "name",
+        "sections",
+        "palette",
+        "effect",
+        "brightness",
+        "amplitude",
+        "speed",
+        "color_flow_speed",
+        "frame",
+        "packet",
+    )
+
+    def __init__(self, name: str, state: dict, palette: bytes):
+        """Initialize the preset from its stored state."""
+        self.name = name
+        self.sections = state["sections"]
+        self.palette = palette
+        self.effect = state["effect"]
+        self.brightness = state["brightness"]
+        self.amplitude = state["amplitude"]
+        self.speed = state["speed"]
+        self.color_flow_speed = state["color_flow_speed"]
+        # Static scenes only: effect frame and encoded packet
+        self.frame: Optional[bytes] = None
+        self.packet: Optional[bytes] = None
+
+
+def compile_preset(
+    name: str, state: dict, manager: GoveeColorManager, protocol: GoveeProtocol
+) -> GoveeCompiledPreset:
+    """
+    Compile a stored preset for a strip.
+
+    Args:
+        name: Preset name
+        state: Stored preset state of the strip
+        manager: Scratch color manager with the strip's LED count, sections
+            and geometry; its buffers are overwritten
+        protocol: The strip's protocol, used to encode the packet
+    """
+    palette = bytearray(manager.num_sections * 3)
+    for index, section in enumerate(state["sections"][:manager.num_sections]):
+        palette[index * 3:index * 3 + 3] = bytes(
+            section_color(section["rgb_color"], section["brightness"], section["active"])
+        )
+    preset = GoveeCompiledPreset(name, state, bytes(palette))
+
+    effect = manager.get_effect(preset.effect)
+    if not effect.animated and preset.amplitude == 0 and preset.color_flow_speed == 0:
+        manager.palette[:] = palette
+        output = render_frame(
+            manager, preset.effect, 0.0, preset.brightness, 0, preset.speed, 0
+        )
+        preset.frame = bytes(manager.frame)
+        preset.packet = protocol.encode_colors(bytes(output), effect.gradient)
+    return preset
+
+
+class GoveePresetStore:
+    """Presets of all strips, persisted in an HA Store.
+
+    Stored as {preset name: {strip unique id: state}}.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        """Initialize the store."""
+        self._store = Store(hass, PRESET_STORAGE_VERSION, PRESET_STORAGE_KEY)
+        self._presets: dict = {}
+
+    async def async_load(self) -> None:
+        """Load presets from storage."""
+        data = await self._store.async_load()
+        if data:
+            self._presets = data.get("presets", {})
+        _LOGGER.debug("Loaded %d presets", len(self._presets))
+
+    def for_strip(self, strip_id: str) -> dict:
+        """Return {preset name: state} of the presets saved for a strip."""
+        return {
+            name: strips[strip_id]
+            for name, strips in self._presets.items()
+            if strip_id in strips
+        }
+
+    def save(self, name: str, strip_id: str, state: dict) -> None:
+        """Save a strip's state under a preset name."""
+        self._presets.setdefault(name, {})[strip_id] = state
+        self._async_schedule_save()
+
+    def delete(self, name: str, strip_id: str) -> bool:
+        """Delete a strip's entry of a preset; returns false if there was none."""
+        strips = self._presets.get(name)
+        if strips is None or strips.pop(strip_id, None) is None:
+            return False
+        if not strips:
+            del self._presets[name]
+        self._async_schedule_save()
+        return True
+
+    def _async_schedule_save(self) -> None:
+        """Schedule a delayed write of the presets."""
+        self._store.async_delay_save(self._data_to_save, PRESET_SAVE_DELAY)
+
+    def _data_to_save(self) -> dict:
+        """Return the data to persist."""
+        return {"presets": self._presets}
@@ -0,0 +1,169 @@
+"""On-demand profiling of the live render loop.
+
+A profile session runs for a bounded window. Strips attached to it time each
+stage of their frame tick (render and encode, send, tick interval) and run
+the render and encode stages under one shared cProfile profiler. With memory
+enabled, tracemalloc traces allocations for the window and the report lists
+the lines of this integration still holding memory at its end.
+
+Strips only check whether a session is attached, so there is no cost while
+no profile is running.
+"""
+import cProfile
+import io
+import os
+import pstats
+import time
+import tracemalloc
+from typing import Optional
+
+# Stack depth kept by tracemalloc while a session traces memory
+TRACEMALLOC_FRAMES = 5
+
+_INTEGRATION_FILES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "*")
+
+
+class GoveeProfileStage:
+    """Timing statistics of one stage of one strip."""
+
+    __slots__ = ("calls", "total", "max")
+
+    def __init__(self):
+        """Initialize empty statistics."""
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        """Add one measurement."""
+        self.calls += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+
+class GoveeProfileSession:
+    """One profiling window shared by all attached strips."""
+
+    def __init__(self, path: str, duration: float, memory: bool = True):
+        """
+        Initialize the session; start() begins profiling.
+
+        Args:
+            path: Report path without extension; the session writes
+                ``path.txt`` (summary) and ``path.prof`` (pstats data)
+            duration: Window length in seconds
+            memory: Trace allocations with tracemalloc during the window
+        """
+        self.path = path
+        self.duration = duration
+        self.memory = memory
+        self.strips: set = set()
+        self._profiler = cProfile.Profile()
+        self._stages: dict = {}
+        self._started_tracing = False
+        self._start_time = 0.0
+        self._start = 0.0
+        self._elapsed = 0.0
+
+    def start(self) -> None:
+        """
+        Start the window.
+
+        Raises:
+            ValueError: If the profiler cannot be enabled, e.g. because
+                another profiler is active (Python 3.12+)
+        """
+        # Fail now rather than on every frame of the window
+        self._profiler.enable()
+        self._profiler.disable()
+        self._start_time = time.time()
+        self._start = time.monotonic()
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+            self._started_tracing = True
+
+    def add(self, strip: str, stage: str, seconds: float) -> None:
+        """Record a stage measurement for a strip."""
+        key = (strip, stage)
+        stats = self._stages.get(key)
+        if stats is None:
+            stats = self._stages[key] = GoveeProfileStage()
+        stats.add(seconds)
+
+    def call(self, strip: str, stage: str, func, *args):
+        """Run func under the profiler and record its time as a stage."""
+        start = time.perf_counter()
+        self._profiler.enable()
+        try:
+            return func(*args)
+        finally:
+            self._profiler.disable()
+            self.add(strip, stage, time.perf_counter() - start)
+
+    def finish(self) -> None:
+        """
+        Stop profiling and write the report (blocking).
+
+        Strips must be detached before, as the profiler is no longer safe to
+        enable once the report is written.
+        """
+        self._elapsed = time.monotonic() - self._start
+        snapshot = None
+        traced = None
+        if self.memory and tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot().filter_traces(
+                (tracemalloc.Filter(True, _INTEGRATION_FILES),)
+            )
+            traced = tracemalloc.get_traced_memory()
+            if self._started_tracing:
+                tracemalloc.stop()
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._profiler.create_stats()
+        if self._profiler.stats:
+            self._profiler.dump_stats(self.path + ".prof")
+        with open(self.path + ".txt", "w", encoding="utf-8") as file:
+            file.write(self._report(snapshot, traced))
+
+    def _report(self, snapshot, traced: Optional[tuple]) -> str:
+        """Return the text report."""
+        out = io.StringIO()
+        out.write("Govee Razer LED profile\n")
+        out.write(
+            f"started {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self._start_time))}"
+            f"  window {self._elapsed:.1f} s  strips {len(self.strips)}\n\n"
+        )
+
+        out.write("Stages (us)\n")
+        out.write(
+            f"{'strip':<24} {'stage':<9} {'calls':>7} {'mean':>9} {'max':>9} {'total ms':>10}\n"
+        )
+        for (strip, stage), stats in sorted(self._stages.items()):
+            out.write(
+                f"{strip[:24]:<24} {stage:<9} {stats.calls:>7}"
+                f" {stats.total / stats.calls * 1e6:>9.1f} {stats.max * 1e6:>9.1f}"
+                f" {stats.total * 1e3:>10.2f}\n"
+            )
+        out.write(
+            "\nrender covers render and encode on the event loop; send includes\n"
+            "the executor queue; interval is the time between frame ticks.\n"
+        )
+
+        out.write("\ncProfile, render and encode by cumulative time\n")
+        if self._profiler.stats:
+            stats = pstats.Stats(self._profiler, stream=out)
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(40)
+        else:
+            out.write("no frames rendered\n")
+
+        if snapshot is not None:
+            current, peak = traced
+            out.write(
+                f"\nMemory, traced during the window: current {current / 1024:.1f} KiB"
+                f"  peak {peak / 1024:.1f} KiB\n"
+            )
+            out.write("Largest allocations in this integration still alive at the end\n")
+            for stat in snapshot.statistics("lineno")[:20]:
+                out.write(f"{stat}\n")
+        return out.getvalue()
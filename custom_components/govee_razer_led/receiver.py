@@ -0,0 +1,299 @@
+"""E1.31 (sACN) and DDP receiver driving strips from lighting software.
+
+One receiver per protocol listens for packets and maps channel ranges onto
+strips. Frames are coalesced: only the newest frame per strip is forwarded
+on each receiver tick.
+"""
+import asyncio
+import logging
+import socket
+import struct
+import time
+from typing import Callable, Optional
+
+_LOGGER = logging.getLogger(__name__)
+
+PROTOCOL_E131 = "e131"
+PROTOCOL_DDP = "ddp"
+
+E131_PORT = 5568
+DDP_PORT = 4048
+
+E131_ACN_ID = b"ASC-E1.17\x00\x00\x00"
+E131_VECTOR_ROOT_DATA = 0x00000004
+E131_VECTOR_FRAMING_DATA = 0x00000002
+E131_OPTION_PREVIEW = 0x80
+E131_OPTION_TERMINATED = 0x40
+E131_HEADER_SIZE = 126
+
+DDP_FLAG_VERSION = 0x40
+DDP_FLAG_TIMECODE = 0x10
+DDP_FLAG_PUSH = 0x01
+DDP_HEADER_SIZE = 10
+
+
+def parse_e131(data: bytes) -> Optional[tuple]:
+    """
+    Parse an E1.31 data packet.
+
+    Returns:
+        Tuple of (universe, sequence, dmx_data) or None if not a usable
+        DMX data packet (wrong vectors, preview, terminated, non-zero start code)
+    """
+    if len(data) < E131_HEADER_SIZE or data[4:16] != E131_ACN_ID:
+        return None
+    if struct.unpack_from("!I", data, 18)[0] != E131_VECTOR_ROOT_DATA:
+        return None
+    if struct.unpack_from("!I", data, 40)[0] != E131_VECTOR_FRAMING_DATA:
+        return None
+    options = data[112]
+    if options & (E131_OPTION_PREVIEW | E131_OPTION_TERMINATED):
+        return None
+    sequence = data[111]
+    universe = struct.unpack_from("!H", data, 113)[0]
+    count = struct.unpack_from("!H", data, 123)[0]
+    # Property value count includes the DMX start code
+    if data[125] != 0x00 or count < 1:
+        return None
+    return universe, sequence, data[126:125 + count]
+
+
+def build_e131(universe: int, sequence: int, dmx_data: bytes, source: str = "govee") -> bytes:
+    """Build an E1.31 data packet (used by tools and benchmarks)."""
+    count = len(dmx_data) + 1
+    packet = bytearray(E131_HEADER_SIZE + len(dmx_data))
+    struct.pack_into("!HH12s", packet, 0, 0x0010, 0x0000, E131_ACN_ID)
+    struct.pack_into("!HI", packet, 16, 0x7000 | (len(packet) - 16), E131_VECTOR_ROOT_DATA)
+    struct.pack_into("!HI", packet, 38, 0x7000 | (len(packet) - 38), E131_VECTOR_FRAMING_DATA)
+    packet[44:44 + 64] = source.encode("utf-8")[:63].ljust(64, b"\x00")
+    packet[108] = 100  # Priority
+    packet[111] = sequence & 0xFF
+    struct.pack_into("!H", packet, 113, universe)
+    struct.pack_into("!HBBHHH", packet, 115, 0x7000 | (len(packet) - 115), 0x02, 0xA1, 0, 1, count)
+    packet[125] = 0x00
+    packet[126:] = dmx_data
+    return bytes(packet)
+
+
+def parse_ddp(data: bytes) -> Optional[tuple]:
+    """
+    Parse a DDP data packet.
+
+    Returns:
+        Tuple of (offset, payload, push) or None if not a DDP v1 packet
+    """
+    if len(data) < DDP_HEADER_SIZE or data[0] & 0xC0 != DDP_FLAG_VERSION:
+        return None
+    flags = data[0]
+    header = DDP_HEADER_SIZE + (4 if flags & DDP_FLAG_TIMECODE else 0)
+    offset, length = struct.unpack_from("!IH", data, 4)
+    payload = data[header:header + length]
+    return offset, payload, bool(flags & DDP_FLAG_PUSH)
+
+
+def build_ddp(offset: int, payload: bytes, sequence: int = 0, push: bool = True) -> bytes:
+    """Build a DDP RGB data packet (used by tools and benchmarks)."""
+    flags = DDP_FLAG_VERSION | (DDP_FLAG_PUSH if push else 0)
+    header = struct.pack(
+        "!BBBBIH", flags, sequence & 0x0F, 0x0B, 0x01, offset, len(payload)
+    )
+    return header + payload
+
+
+class GoveeReceiverTarget:
+    """A channel range mapped onto one strip."""
+
+    __slots__ = ("universe", "start", "length", "callback", "pending")
+
+    def __init__(self, universe: int, start: int, length: int, callback: Callable[[bytes], None]):
+        """Initialize the target; start is a 0-based channel offset."""
+        self.universe = universe
+        self.start = start
+        self.length = length
+        self.callback = callback
+        self.pending: Optional[bytes] = None
+
+
+class _ReceiverProtocol(asyncio.DatagramProtocol):
+    """Pass datagrams to the receiver."""
+
+    def __init__(self, receiver: "GoveeLightingReceiver"):
+        """Initialize the protocol."""
+        self._receiver = receiver
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        """Handle a datagram."""
+        self._receiver.handle_packet(data)
+
+
+class GoveeLightingReceiver:
+    """Listen for E1.31 or DDP packets and forward coalesced frames to strips."""
+
+    def __init__(self, protocol: str, tick: float, port: Optional[int] = None):
+        """Initialize the receiver."""
+        self.protocol = protocol
+        self.port = port or (E131_PORT if protocol == PROTOCOL_E131 else DDP_PORT)
+        self._tick = tick
+        self._targets: list = []
+        self._sequences: dict = {}
+        # Sized to the highest channel any target maps, not to the packets
+        self._ddp_buffer = bytearray()
+        self._socket: Optional[socket.socket] = None
+        self._start: Optional[asyncio.Task] = None
+        self._transport: Optional[asyncio.DatagramTransport] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self.packets = 0
+        self.frames_forwarded = 0
+        self.frames_coalesced = 0
+
+    async def async_start(self) -> bool:
+        """Bind the listener and start the flush tick.
+
+        Strips set up at the same time share one start; all of them get its
+        result.
+        """
+        if self._start is None:
+            self._start = asyncio.get_running_loop().create_task(self._async_bind())
+        return await asyncio.shield(self._start)
+
+    async def _async_bind(self) -> bool:
+        """Bind the listener and start the flush tick."""
+        loop = asyncio.get_running_loop()
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            sock.bind(("", self.port))
+            sock.setblocking(False)
+            self._transport, _ = await loop.create_datagram_endpoint(
+                lambda: _ReceiverProtocol(self), sock=sock
+            )
+        except OSError as err:
+            sock.close()
+            _LOGGER.error("Could not start %s receiver on port %s: %s", self.protocol, self.port, err)
+            return False
+        self._socket = sock
+        if self.protocol == PROTOCOL_E131:
+            for universe in {target.universe for target in self._targets}:
+                self._join_universe(universe)
+        self._flush_task = loop.create_task(self._flush_loop())
+        _LOGGER.debug("%s receiver listening on port %s", self.protocol, self.port)
+        return True
+
+    def close(self) -> None:
+        """Stop the receiver."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+        self._socket = None
+
+    @property
+    def has_targets(self) -> bool:
+        """Return true if any strip is mapped."""
+        return bool(self._targets)
+
+    def register(self, universe: int, start: int, length: int, callback: Callable[[bytes], None]) -> GoveeReceiverTarget:
+        """Map a channel range onto a strip."""
+        target = GoveeReceiverTarget(universe, start, length, callback)
+        self._targets.append(target)
+        self._resize_ddp_buffer()
+        if self.protocol == PROTOCOL_E131 and self._socket is not None:
+            self._join_universe(universe)
+        return target
+
+    def unregister(self, target: GoveeReceiverTarget) -> None:
+        """Remove a mapping."""
+        if target in self._targets:
+            self._targets.remove(target)
+            self._resize_ddp_buffer()
+
+    def _resize_ddp_buffer(self) -> None:
+        """Size the DDP frame buffer to the end of the highest mapped range."""
+        if self.protocol != PROTOCOL_DDP:
+            return
+        end = max((target.start + target.length for target in self._targets), default=0)
+        if end > len(self._ddp_buffer):
+            self._ddp_buffer.extend(bytes(end - len(self._ddp_buffer)))
+        else:
+            del self._ddp_buffer[end:]
+
+    def _join_universe(self, universe: int) -> None:
+        """Join the multicast group of an E1.31 universe."""
+        group = f"239.255.{universe >> 8}.{universe & 0xFF}"
+        membership = struct.pack("4s4s", socket.inet_aton(group), socket.inet_aton("0.0.0.0"))
+        try:
+            self._socket.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, membership)
+        except OSError as err:
+            # Already joined, or no multicast route; unicast still works
+            _LOGGER.debug("Could not join %s: %s", group, err)
+
+    def handle_packet(self, data: bytes) -> None:
+        """Parse a packet and stage frames for the mapped strips."""
+        self.packets += 1
+        if self.protocol == PROTOCOL_E131:
+            parsed = parse_e131(data)
+            if parsed is None:
+                return
+            universe, sequence, channels = parsed
+            last = self._sequences.get(universe)
+            # E1.31 out-of-order rule: drop packets up to 20 sequences old
+            if last is not None and -20 < ((sequence - last + 128) % 256) - 128 <= 0:
+                return
+            self._sequences[universe] = sequence
+        else:
+            parsed = parse_ddp(data)
+            if parsed is None:
+                return
+            offset, payload, push = parsed
+            # Channels past the mapped ranges are clipped, never buffered
+            end = min(offset + len(payload), len(self._ddp_buffer))
+            if offset < end:
+                self._ddp_buffer[offset:end] = payload[:end - offset]
+            if not push:
+                # Wait for the rest of the frame
+                return
+            universe, channels = None, self._ddp_buffer
+
+        for target in self._targets:
+            if universe is not None and target.universe != universe:
+                continue
+            frame = bytes(channels[target.start:target.start + target.length])
+            if len(frame) < 3:
+                continue
+            if target.pending is not None:
+                self.frames_coalesced += 1
+            target.pending = frame[: len(frame) - len(frame) % 3]
+
+    def flush(self) -> None:
+        """Forward the newest staged frame of each strip."""
+        for target in self._targets:
+            frame, target.pending = target.pending, None
+            if frame is not None:
+                target.callback(frame)
+                self.frames_forwarded += 1
+
+    async def _flush_loop(self) -> None:
+        """Flush staged frames once per tick."""
+        next_tick = time.monotonic()
+        while True:
+            self.flush()
+            next_tick += self._tick
+            delay = next_tick - time.monotonic()
+            if delay < 0:
+                # Fell behind; resynchronise instead of bursting
+                next_tick = time.monotonic()
+                delay = 0
+            await asyncio.sleep(delay)
+
+    def as_dict(self) -> dict:
+        """Return receiver statistics for diagnostics."""
+        return {
+            "protocol": self.protocol,
+            "port": self.port,
+            "targets": len(self._targets),
+            "packets": self.packets,
+            "frames_forwarded": self.frames_forwarded,
+            "frames_coalesced": self.frames_coalesced,
+        }
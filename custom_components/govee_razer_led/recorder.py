@@ -0,0 +1,286 @@
+"""Frame recorder for deterministic replay of what a strip sent.
+
+A recording is an append-only binary file: a fixed header followed by one
+record per rendered frame. Each record holds the render inputs (timestamp,
+effect, time, brightness, wave and color flow state, crossfade state,
+section palette), the time the live path spent producing the frame and the
+encoded packet, so a recording can be re-rendered offline and compared byte
+for byte.
+
+File layout (little endian)::
+
+    header:  magic "GVRZREC1", version u16, num_leds u16, num_sections u16,
+             settings_len u16, settings (utf-8 JSON object)
+    record:  size u32, timestamp f64, t f64, render_us f32, brightness u8,
+             amplitude u8, speed i16, wave_step i16, rotation i16,
+             effect_len u8, packet_len u16, fade_weight u8, fade_len u8,
+             effect (utf-8), fade effect (utf-8),
+             palette (num_sections * 3), packet
+
+``size`` counts the bytes following it, so readers can skip records.
+``fade_len`` is 0 outside of crossfades. The settings hold the strip's
+render settings that are not part of each record: ``blend_mode`` and
+``geometry``, the get_geometry() arguments of the strip's layout.
+
+Older versions are still read: version 2 headers have no settings (sRGB
+blending on a straight strip), and version 1 records also end their header at ``packet_len``
+and have no fade effect.
+"""
+import json
+import struct
+import threading
+from typing import Iterator, Optional
+
+from .const import BLEND_SRGB
+
+MAGIC = b"GVRZREC1"
+VERSION = 3
+
+HEADER = struct.Struct("<8sHHH")
+SETTINGS_LEN = struct.Struct("<H")
+RECORD = struct.Struct("<IddfBBhhhBHBB")
+RECORD_V1 = struct.Struct("<IddfBBhhhBH")
+
+# Rotation value stored when the color flow is off
+NO_ROTATION = -0x8000
+
+
+class GoveeFrameRecord:
+    """One decoded frame record."""
+
+    __slots__ = (
+        "timestamp",
+        "t",
+        "render_us",
+        "brightness",
+        "amplitude",
+        "speed",
+        "wave_step",
+        "rotation",
+        "effect",
+        "fade",
+        "palette",
+        "packet",
+    )
+
+    def __init__(
+        self, fields: tuple, effect: str, fade: Optional[tuple], palette: bytes, packet
+    ):
+        """Initialize the record from its unpacked header fields."""
+        (
+            self.timestamp,
+            self.t,
+            self.render_us,
+            self.brightness,
+            self.amplitude,
+            self.speed,
+            self.wave_step,
+            rotation,
+        ) = fields
+        self.rotation: Optional[int] = None if rotation == NO_ROTATION else rotation
+        self.effect = effect
+        # (outgoing effect, weight) during a crossfade
+        self.fade = fade
+        self.palette = palette
+        self.packet = packet
+
+
+class GoveeFrameRecorder:
+    """Append frame records to a recording file.
+
+    Records are buffered in memory and written with flush(), which is
+    blocking and meant to run in an executor. record() and flush() may run on
+    different threads.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        num_leds: int,
+        num_sections: int,
+        max_bytes: int,
+        blend_mode: str = BLEND_SRGB,
+        geometry: tuple = (),
+    ):
+        """Initialize the recorder; open() creates the file."""
+        self.path = path
+        self._num_leds = num_leds
+        self._num_sections = num_sections
+        self._max_bytes = max_bytes
+        # _lock guards the buffer and is only held to swap it, so record()
+        # never waits for the disk; _write_lock keeps writes in order
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        settings = json.dumps(
+            {"blend_mode": blend_mode, "geometry": geometry}
+        ).encode("utf-8")
+        self._buffer = bytearray(HEADER.pack(MAGIC, VERSION, num_leds, num_sections))
+        self._buffer += SETTINGS_LEN.pack(len(settings))
+        self._buffer += settings
+        self._file = None
+        self._start: Optional[float] = None
+        self.frames = 0
+        self.nbytes = len(self._buffer)
+
+    @property
+    def pending(self) -> int:
+        """Return the number of buffered bytes not yet written."""
+        return len(self._buffer)
+
+    @property
+    def full(self) -> bool:
+        """Return true once the recording reached its size cap."""
+        return self.nbytes >= self._max_bytes
+
+    def open(self) -> None:
+        """Create the recording file (blocking)."""
+        self._file = open(self.path, "wb")
+
+    def record(
+        self,
+        now: float,
+        render_time: float,
+        effect: str,
+        t: float,
+        brightness: int,
+        amplitude: int,
+        speed: int,
+        wave_step: int,
+        rotation: Optional[int],
+        palette: bytes,
+        packet: bytes,
+        fade: Optional[tuple] = None,
+    ) -> None:
+        """Buffer one frame record."""
+        if self.full:
+            return
+        if self._start is None:
+            self._start = now
+        name = effect.encode("utf-8")
+        fade_name = b""
+        fade_weight = 0
+        if fade is not None:
+            fade_name = fade[0].encode("utf-8")
+            fade_weight = fade[1]
+        name += fade_name
+        header = RECORD.pack(
+            RECORD.size - 4 + len(name) + self._num_sections * 3 + len(packet),
+            now - self._start,
+            t,
+            render_time * 1e6,
+            brightness,
+            amplitude,
+            speed,
+            wave_step,
+            NO_ROTATION if rotation is None else rotation,
+            len(name) - len(fade_name),
+            len(packet),
+            fade_weight,
+            len(fade_name),
+        )
+        with self._lock:
+            self._buffer += header
+            self._buffer += name
+            self._buffer += palette
+            self._buffer += packet
+            self.nbytes += len(header) + len(name) + self._num_sections * 3 + len(packet)
+        self.frames += 1
+
+    def flush(self) -> None:
+        """Write buffered records to the file (blocking)."""
+        with self._write_lock:
+            with self._lock:
+                data, self._buffer = self._buffer, bytearray()
+            if data and self._file is not None:
+                self._file.write(data)
+                self._file.flush()
+
+    def close(self) -> None:
+        """Write remaining records and close the file (blocking)."""
+        self.flush()
+        with self._write_lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def as_dict(self) -> dict:
+        """Return recording statistics for diagnostics."""
+        return {"path": self.path, "frames": self.frames, "bytes": self.nbytes}
+
+
+def _parse_header(data) -> tuple:
+    """Return (version, num_leds, num_sections, settings, first record offset)."""
+    if len(data) < HEADER.size:
+        raise ValueError("Recording is truncated")
+    magic, version, num_leds, num_sections = HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError("Not a Govee Razer LED recording")
+    if version not in (1, 2, VERSION):
+        raise ValueError(f"Unsupported recording version {version}")
+    settings = {"blend_mode": BLEND_SRGB, "geometry": ()}
+    offset = HEADER.size
+    if version >= 3:
+        if len(data) < offset + SETTINGS_LEN.size:
+            raise ValueError("Recording is truncated")
+        (length,) = SETTINGS_LEN.unpack_from(data, offset)
+        offset += SETTINGS_LEN.size
+        if len(data) < offset + length:
+            raise ValueError("Recording is truncated")
+        settings.update(json.loads(bytes(data[offset:offset + length])))
+        offset += length
+    # JSON turns the segment runs into lists; get_geometry() needs tuples
+    geometry = list(settings["geometry"])
+    if len(geometry) > 4:
+        geometry[4] = tuple(tuple(run) for run in geometry[4])
+    settings["geometry"] = tuple(geometry)
+    return version, num_leds, num_sections, settings, offset
+
+
+def read_header(data) -> tuple:
+    """
+    Validate a recording and return its header.
+
+    Returns:
+        Tuple of (num_leds, num_sections, settings); settings holds the
+        ``blend_mode`` and the ``geometry`` arguments, () for a straight strip
+
+    Raises:
+        ValueError: If the data is not a supported recording
+    """
+    return _parse_header(data)[1:4]
+
+
+def iter_records(data) -> Iterator[GoveeFrameRecord]:
+    """
+    Iterate over the records of a recording without copying packets.
+
+    Args:
+        data: Recording contents, e.g. an mmap; packets are memoryview
+            slices of it
+
+    Yields:
+        Decoded records; a truncated final record is ignored
+    """
+    version, _, num_sections, _, offset = _parse_header(data)
+    record = RECORD_V1 if version == 1 else RECORD
+    view = memoryview(data)
+    end = len(data)
+    while offset + record.size <= end:
+        fields = record.unpack_from(data, offset)
+        size, effect_len, packet_len = fields[0], fields[9], fields[10]
+        next_offset = offset + 4 + size
+        if next_offset > end:
+            break
+        pos = offset + record.size
+        effect = bytes(view[pos:pos + effect_len]).decode("utf-8")
+        pos += effect_len
+        fade = None
+        if record is RECORD and fields[12]:
+            fade = (bytes(view[pos:pos + fields[12]]).decode("utf-8"), fields[11])
+            pos += fields[12]
+        palette = bytes(view[pos:pos + num_sections * 3])
+        pos += num_sections * 3
+        yield GoveeFrameRecord(
+            fields[1:9], effect, fade, palette, view[pos:pos + packet_len]
+        )
+        offset = next_offset
@@ -0,0 +1,245 @@
+"""Process pool render backend for CPU-heavy effects.
+
+Frames are rendered in worker processes and handed back through a shared
+memory ring buffer per strip, so only a tiny acknowledgement is pickled per
+frame. Each strip keeps a bounded queue of pre-rendered frames; the event
+loop only has to encode and send them.
+"""
+import asyncio
+import collections
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Callable, Optional
+
+from .const import BLEND_SRGB
+from .geometry import get_geometry
+from .govee_protocol import GoveeColorManager
+from .renderer import render_frame
+
+_LOGGER = logging.getLogger(__name__)
+
+# Worker process state: shared memory attachment and color manager per strip
+_WORKER_STRIPS: dict = {}
+
+
+def _attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing block owned (and unlinked) by the main process."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 always tracks; workers share the main process's
+        # resource tracker, so this only repeats the owner's registration
+        return shared_memory.SharedMemory(name=name)
+
+
+def _render_job(
+    shm_name: str,
+    slot: int,
+    num_leds: int,
+    num_sections: int,
+    geometry: tuple,
+    blend_mode: str,
+    job: tuple,
+) -> None:
+    """Render one frame into a shared memory slot (runs in a worker process)."""
+    state = _WORKER_STRIPS.get(shm_name)
+    if state is None:
+        state = _WORKER_STRIPS[shm_name] = (
+            _attach_shared_memory(shm_name),
+            GoveeColorManager(
+                num_leds,
+                num_sections,
+                get_geometry(*geometry) if geometry else None,
+                blend_mode,
+            ),
+        )
+    shm, manager = state
+
+    palette, effect, t, brightness, amplitude, speed, wave_step, rotation, fade = job
+    manager.palette[:] = palette
+    output = render_frame(
+        manager, effect, t, brightness, amplitude, speed, wave_step, rotation, fade
+    )
+
+    frame_size = num_leds * 3
+    offset = slot * frame_size
+    shm.buf[offset:offset + frame_size] = output
+
+
+def _release_job(shm_name: str) -> None:
+    """Drop a strip's worker state (runs in a worker process)."""
+    state = _WORKER_STRIPS.pop(shm_name, None)
+    if state is not None:
+        state[0].close()
+
+
+class GoveeRenderStream:
+    """Bounded queue of frames pre-rendered by a worker for one strip."""
+
+    def __init__(
+        self,
+        executor: ProcessPoolExecutor,
+        num_leds: int,
+        num_sections: int,
+        depth: int,
+        geometry: tuple = (),
+        blend_mode: str = BLEND_SRGB,
+    ):
+        """Initialize the stream and its shared memory ring buffer.
+
+        geometry holds the get_geometry() arguments of the strip; workers
+        build the geometry themselves, as it is too large to send per frame.
+        """
+        self._executor = executor
+        self._num_leds = num_leds
+        self._num_sections = num_sections
+        self._geometry = geometry
+        self._blend_mode = blend_mode
+        self._frame_size = num_leds * 3
+        self._shm = shared_memory.SharedMemory(create=True, size=depth * self._frame_size)
+        self._free = list(range(depth))
+        self._ready: collections.deque = collections.deque()
+        # Animation state before each queued or rendering job, by slot
+        self._states: dict = {}
+        self._rendering: Optional[int] = None
+        self._generation = 0
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._job_source: Optional[Callable[[], tuple]] = None
+
+    def start(self, job_source: Callable[[], tuple]) -> None:
+        """Start pre-rendering frames described by job_source().
+
+        job_source() returns the job and the caller's animation state from
+        before the job, which invalidate() hands back when it discards it.
+        """
+        self._job_source = job_source
+        self._task = asyncio.get_running_loop().create_task(self._produce())
+
+    async def _produce(self) -> None:
+        """Keep the frame queue filled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            if not self._free:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            slot = self._free.pop()
+            generation = self._generation
+            job, self._states[slot] = self._job_source()
+            self._rendering = slot
+            try:
+                await loop.run_in_executor(
+                    self._executor,
+                    _render_job,
+                    self._shm.name,
+                    slot,
+                    self._num_leds,
+                    self._num_sections,
+                    self._geometry,
+                    self._blend_mode,
+                    job,
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as err:
+                _LOGGER.error("Render worker failed: %s", err)
+                self._states.pop(slot, None)
+                self._free.append(slot)
+                await asyncio.sleep(1)
+                continue
+            finally:
+                self._rendering = None
+
+            if generation != self._generation:
+                # Parameters changed while rendering; drop the stale frame
+                self._states.pop(slot, None)
+                self._free.append(slot)
+            else:
+                self._ready.append(slot)
+
+    def pop_frame(self) -> Optional[bytes]:
+        """Return the next pre-rendered frame (3 bytes per LED), or None."""
+        if not self._ready:
+            return None
+        slot = self._ready.popleft()
+        self._states.pop(slot, None)
+        offset = slot * self._frame_size
+        frame = bytes(self._shm.buf[offset:offset + self._frame_size])
+        self._free.append(slot)
+        self._wakeup.set()
+        return frame
+
+    def invalidate(self) -> Any:
+        """Discard queued frames after a parameter or palette change.
+
+        Returns:
+            The animation state from before the oldest discarded job, to
+            resume the animation from, or None if nothing was discarded
+        """
+        self._generation += 1
+        discarded = list(self._ready)
+        if self._rendering is not None:
+            discarded.append(self._rendering)
+        states = [self._states.pop(slot, None) for slot in discarded]
+        self._free.extend(self._ready)
+        self._ready.clear()
+        self._wakeup.set()
+        return states[0] if states else None
+
+    async def async_close(self) -> None:
+        """Stop producing and free the shared memory."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                self._executor, _release_job, self._shm.name
+            )
+        except Exception as err:
+            _LOGGER.debug("Could not release worker state: %s", err)
+        self._shm.close()
+        self._shm.unlink()
+
+
+class GoveeRenderPool:
+    """Small pool of render worker processes shared by all strips."""
+
+    def __init__(self, workers: int, depth: int):
+        """Initialize the pool; worker processes start on first use."""
+        # Spawn, not fork: Home Assistant is multi-threaded
+        context = multiprocessing.get_context("spawn")
+        # One single-process executor per worker keeps each strip on the
+        # same process, so stateful effects (e.g. fire) stay continuous
+        self._executors = [
+            ProcessPoolExecutor(max_workers=1, mp_context=context)
+            for _ in range(workers)
+        ]
+        self._depth = depth
+        self._next = 0
+
+    def create_stream(
+        self,
+        num_leds: int,
+        num_sections: int,
+        geometry: tuple = (),
+        blend_mode: str = BLEND_SRGB,
+    ) -> GoveeRenderStream:
+        """Create a frame stream for a strip on the next worker."""
+        executor = self._executors[self._next % len(self._executors)]
+        self._next += 1
+        return GoveeRenderStream(
+            executor, num_leds, num_sections, self._depth, geometry, blend_mode
+        )
+
+    def shutdown(self) -> None:
+        """Stop all worker processes."""
+        for executor in self._executors:
+            executor.shutdown(wait=False, cancel_futures=True)
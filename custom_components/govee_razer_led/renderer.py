@@ -0,0 +1,171 @@
+"""Frame rendering pipeline for Govee Razer LED strips.
+
+Pure functions shared by the inline renderer on the event loop and the
+render worker processes: color flow rotation, effect rendering, crossfades
+between effects and the brightness wave.
+"""
+import functools
+import math
+from typing import Optional
+
+from .const import LAYOUT_STRIP
+from .geometry import GoveeGeometry, get_geometry, get_numpy
+from .govee_protocol import GoveeColorManager
+
+
+def rotate_palette(palette: bytes, rotation: int) -> bytes:
+    """
+    Rotate section colors for the color flow.
+
+    Args:
+        palette: Section colors, 3 bytes per section
+        rotation: Sections to shift by; negative rotates backwards
+
+    Returns:
+        Rotated copy of the palette
+    """
+    shift = rotation % (len(palette) // 3) * 3
+    if not shift:
+        return bytes(palette)
+    return bytes(palette[-shift:] + palette[:-shift])
+
+
+@functools.lru_cache(maxsize=256)
+def _scale_table(brightness: int) -> bytes:
+    """Return a translation table scaling every channel value by brightness."""
+    scale = brightness / 255.0
+    return bytes(int(value * scale) for value in range(256))
+
+
+@functools.lru_cache(maxsize=256)
+def _weight_table(weight: int) -> bytes:
+    """Return a translation table scaling every channel value by weight / 255."""
+    return bytes(value * weight // 255 for value in range(256))
+
+
+def crossfade(outgoing: bytes, incoming: bytes, weight: int) -> bytes:
+    """
+    Blend two frames of the same size.
+
+    Both frames are scaled with translation tables and added as big
+    integers. The two scaled values of a channel never sum past 255, so no
+    carry crosses into the neighboring channel.
+
+    Args:
+        outgoing: Frame faded out
+        incoming: Frame faded in
+        weight: Share of the incoming frame (0-255)
+
+    Returns:
+        Blended frame
+    """
+    total = int.from_bytes(
+        outgoing.translate(_weight_table(255 - weight)), "big"
+    ) + int.from_bytes(incoming.translate(_weight_table(weight)), "big")
+    return total.to_bytes(len(incoming), "big")
+
+
+def apply_wave(
+    frame: bytes,
+    output: bytearray,
+    brightness: int,
+    amplitude: int,
+    speed: int,
+    wave_step: int,
+    geometry: Optional[GoveeGeometry] = None,
+) -> bytearray:
+    """
+    Scale LED colors by the strip brightness and the brightness wave.
+
+    The wave travels along the physical x axis of the geometry; non-strip
+    geometries are scaled with numpy when it is installed.
+
+    Args:
+        frame: Effect frame, 3 bytes per LED
+        output: Buffer of the same size to write the scaled frame into
+        brightness: Base brightness (0-255)
+        amplitude: Wave amplitude (0-100), 0 disables the wave
+        speed: Wave speed (-100 to 100)
+        wave_step: Current wave step
+        geometry: LED positions; None for a straight strip
+
+    Returns:
+        The output buffer
+    """
+    if amplitude == 0:
+        output[:] = frame.translate(_scale_table(brightness))
+        return output
+
+    num_leds = len(frame) // 3
+    if geometry is None or geometry.num_leds != num_leds:
+        geometry = get_geometry(LAYOUT_STRIP, num_leds)
+    shift = wave_step * (speed / 100)
+    arrays = geometry.arrays
+    if arrays is not None:
+        np = get_numpy()
+        levels = (brightness + amplitude * np.sin(arrays["wave_phases"] + shift)).astype(
+            np.int64
+        )
+        scale = np.clip(levels, 0, 255) / 255.0
+        pixels = np.frombuffer(frame, dtype=np.uint8).reshape(-1, 3)
+        output[:] = (pixels * scale[:, None]).astype(np.uint8).tobytes()
+        return output
+
+    phases = geometry.wave_phases
+    for i in range(num_leds):
+        wave_offset = amplitude * math.sin(phases[i] + shift)
+        scale = max(0, min(255, int(brightness + wave_offset))) / 255.0
+        base = i * 3
+        output[base] = int(frame[base] * scale)
+        output[base + 1] = int(frame[base + 1] * scale)
+        output[base + 2] = int(frame[base + 2] * scale)
+    return output
+
+
+def render_frame(
+    manager: GoveeColorManager,
+    effect: str,
+    t: float,
+    brightness: int,
+    amplitude: int,
+    speed: int,
+    wave_step: int,
+    rotation: Optional[int] = None,
+    fade: Optional[tuple] = None,
+) -> bytearray:
+    """
+    Render one complete frame.
+
+    During a crossfade both effects are rendered once and blended before the
+    brightness wave; a static outgoing effect keeps its frame for the whole
+    fade.
+
+    Args:
+        manager: Color manager holding the section palette
+        effect: Effect name
+        t: Time in seconds since the effect started
+        brightness: Base brightness (0-255)
+        amplitude: Wave amplitude (0-100)
+        speed: Wave speed (-100 to 100)
+        wave_step: Current wave step
+        rotation: Color flow rotation in sections, or None when flow is off
+        fade: (outgoing effect, weight 0-255 of effect) during a crossfade,
+            or None
+
+    Returns:
+        The manager's output buffer (3 bytes per LED), valid until the
+        next render
+    """
+    palette = None
+    if rotation is not None:
+        palette = rotate_palette(manager.palette, rotation)
+    if fade is None:
+        frame = manager.render(effect, t, palette)
+    else:
+        previous, weight = fade
+        # Before render(), which may overwrite the outgoing static frame
+        outgoing = manager.render_outgoing(previous, t, palette)
+        frame = crossfade(outgoing, manager.render(effect, t, palette), weight)
+    return apply_wave(
+        frame, manager.output, brightness, amplitude, speed, wave_step, manager.geometry
+    )
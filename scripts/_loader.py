@@ -0,0 +1,22 @@
+"""Import integration modules for offline tools without Home Assistant.
+
+Registers ``govee_razer_led`` as a bare package so its pure-Python modules
+(``const``, ``effects``, ``govee_protocol``, ...) can be imported without
+running the integration's ``__init__``, which needs Home Assistant.
+"""
+import importlib
+import sys
+import types
+from pathlib import Path
+
+PACKAGE_NAME = "govee_razer_led"
+PACKAGE_DIR = Path(__file__).resolve().parent.parent / "custom_components" / PACKAGE_NAME
+
+
+def load(module: str):
+    """Import and return govee_razer_led.<module>."""
+    if PACKAGE_NAME not in sys.modules:
+        package = types.ModuleType(PACKAGE_NAME)
+        package.__path__ = [str(PACKAGE_DIR)]
+        sys.modules[PACKAGE_NAME] = package
+    return importlib.import_module(f"{PACKAGE_NAME}.{module}")
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""Benchmark every registered effect against its frame budget.
+
+Each effect declares ``frame_budget_us``, the maximum render time for one
+frame of 100 LEDs with 10 sections. Exits non-zero if any effect is over
+budget, so a new or changed effect cannot quietly regress frame time.
+
+Usage:
+    python scripts/bench_effects.py [--leds 100] [--sections 10] [--frames 2000]
+"""
+import argparse
+import sys
+import time
+
+from _loader import load
+
+
+def bench(effect_cls, num_leds: int, num_sections: int, frames: int) -> float:
+    """Return the mean render time of an effect in microseconds."""
+    effect = effect_cls()
+    frame = bytearray(num_leds * 3)
+    palette = bytes(
+        channel
+        for i in range(num_sections)
+        for channel in ((i * 53) % 256, (i * 97) % 256, (i * 151) % 256)
+    )
+    # Warm up caches and per-instance state
+    for i in range(10):
+        effect.render(frame, palette, num_leds, i * 0.05)
+
+    start = time.perf_counter()
+    for i in range(frames):
+        effect.render(frame, palette, num_leds, i * 0.05)
+    return (time.perf_counter() - start) / frames * 1e6
+
+
+def main() -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--leds", type=int, default=100)
+    parser.add_argument("--sections", type=int, default=10)
+    parser.add_argument("--frames", type=int, default=2000)
+    args = parser.parse_args()
+
+    effects = load("effects")
+    failed = False
+    print(f"{'effect':<12} {'kind':<9} {'us/frame':>9} {'budget':>8}")
+    for name, effect_cls in effects.EFFECT_REGISTRY.items():
+        mean = bench(effect_cls, args.leds, args.sections, args.frames)
+        kind = "animated" if effect_cls.animated else "static"
+        over = mean > effect_cls.frame_budget_us
+        failed |= over
+        print(
+            f"{name:<12} {kind:<9} {mean:>9.1f} {effect_cls.frame_budget_us:>8.0f}"
+            f"{'  OVER BUDGET' if over else ''}"
+        )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
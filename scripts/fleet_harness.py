@@ -0,0 +1,474 @@
+#!/usr/bin/env python3
+"""Measure the integration with a fleet of strips on one event loop.
+
+Sets up N config entries through the integration's ``async_setup_entry``,
+the way Home Assistant does, against a minimal stand-in for it: the shared
+device cache, link monitor and load governor are wired up as in production,
+and the light and number platforms are set up for each entry. It points
+every strip at its own
+loopback UDP sink, turns all strips on with the wave and color flow active
+and reports event loop lag, achieved fps per strip, executor queue depth,
+memory per strip and packets per second. Exits non-zero when the loop lag or
+frame rate misses the given limits, so it can gate performance work on
+``light.py`` and ``govee_protocol.py``.
+
+Needs Home Assistant installed (the entity base classes are imported), but
+no running instance. Strips use the addresses 127.0.0.2 and up, so the whole
+127.0.0.0/8 block must route to loopback (the default on Linux).
+
+The stand-in covers what setup and the frame loop use: ``hass.data``, the
+event loop, tasks, executor jobs, timers, storage and config entries.
+Entities are attached to the shared services with ``attach()``; restore,
+frame ingest, lighting receivers and presets need the real entity lifecycle
+and are not set up. Storage goes to a temporary config directory.
+
+Usage:
+    python scripts/fleet_harness.py [--strips 50] [--leds 100] [--duration 20]
+        [--effect stretched] [--backend inline] [--max-lag-ms 20] [--min-fps 0.9]
+"""
+import argparse
+import asyncio
+import base64
+import importlib
+import os
+import selectors
+import socket
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+import types
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "custom_components"))
+
+from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT  # noqa: E402
+from homeassistant.core import CoreState  # noqa: E402
+from homeassistant.helpers import entity_platform  # noqa: E402
+
+import govee_razer_led as integration  # noqa: E402
+from govee_razer_led import light  # noqa: E402
+from govee_razer_led.const import (  # noqa: E402
+    CONF_NUM_LEDS,
+    CONF_NUM_SECTIONS,
+    CONF_PRIORITY,
+    CONF_RENDER_BACKEND,
+    CONF_UPDATE_INTERVAL,
+    DOMAIN,
+    LOAD_LEVELS,
+    PRIORITIES,
+    RENDER_BACKENDS,
+)
+from govee_razer_led.govee_protocol import GoveeProtocol  # noqa: E402
+
+# Seconds between event loop lag samples
+LAG_SAMPLE_INTERVAL = 0.05
+# Seconds after turn-on traced for memory (first frames allocate the buffers)
+MEMORY_WINDOW = 0.5
+
+
+class StandInHass:
+    """The parts of HomeAssistant the light platform and frame loop use."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, config_dir: str, workers: int):
+        """Initialize the stand-in."""
+        self.loop = loop
+        self.data: dict = {}
+        self.config = types.SimpleNamespace(
+            config_dir=config_dir,
+            path=lambda *parts: os.path.join(config_dir, *parts),
+        )
+        self.state = CoreState.running
+        self.bus = StandInBus()
+        self.config_entries = StandInConfigEntries(self)
+        self.workers = workers
+        self._executor = ThreadPoolExecutor(workers, thread_name_prefix="executor")
+        self._tasks: set = set()
+        self.jobs_submitted = 0
+        self.jobs_done = 0
+
+    @property
+    def executor_queue(self) -> int:
+        """Return the number of executor jobs waiting for a worker."""
+        return max(self.jobs_submitted - self.jobs_done - self.workers, 0)
+
+    def async_add_executor_job(self, target, *args) -> asyncio.Future:
+        """Run a blocking function in the executor."""
+        self.jobs_submitted += 1
+        future = self.loop.run_in_executor(self._executor, target, *args)
+        future.add_done_callback(self._job_done)
+        return future
+
+    def _job_done(self, _future) -> None:
+        self.jobs_done += 1
+
+    def async_create_task(self, target, name=None, eager_start=True) -> asyncio.Task:
+        """Create a task, keeping a reference until it is done."""
+        task = self.loop.create_task(target, name=name)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def async_create_background_task(self, target, name, eager_start=True) -> asyncio.Task:
+        """Create a background task."""
+        return self.async_create_task(target, name)
+
+    def async_run_hass_job(self, job, *args):
+        """Run a job from a timer helper, scheduling coroutines as tasks."""
+        result = job.target(*args)
+        if asyncio.iscoroutine(result):
+            return self.async_create_task(result)
+        return None
+
+    def shutdown(self) -> None:
+        """Stop the executor."""
+        self._executor.shutdown(wait=True)
+
+
+class StandInBus:
+    """Event bus stand-in; listeners (e.g. storage's final write) never fire."""
+
+    def async_listen_once(self, event_type, listener):
+        """Ignore a listener and return its unsubscribe callback."""
+        return lambda: None
+
+
+class StandInPlatform:
+    """Entity platform stand-in; service registrations are ignored."""
+
+    def async_register_entity_service(self, name, schema, func) -> None:
+        """Ignore a service registration."""
+
+
+class StandInConfigEntry:
+    """The parts of a config entry the integration's setup uses."""
+
+    def __init__(self, entry_id: str, data: dict):
+        """Initialize the entry."""
+        self.entry_id = entry_id
+        self.title = data[CONF_NAME]
+        self.data = data
+        self.options: dict = {}
+        self._on_unload: list = []
+
+    def add_update_listener(self, listener):
+        """Ignore an options listener; options never change here."""
+        return lambda: None
+
+    def async_on_unload(self, func) -> None:
+        """Remember a callback to run on unload."""
+        self._on_unload.append(func)
+
+    def async_create_background_task(self, hass, target, name, eager_start=True):
+        """Create a background task bound to the entry."""
+        return hass.async_create_background_task(target, name)
+
+    def async_unloaded(self) -> None:
+        """Run the unload callbacks."""
+        while self._on_unload:
+            self._on_unload.pop()()
+
+
+class StandInConfigEntries:
+    """Config entries stand-in that sets platforms up in place of HA's."""
+
+    def __init__(self, hass: "StandInHass"):
+        """Initialize the stand-in."""
+        self._hass = hass
+        self._entries: list = []
+        self._entities: dict = {}
+
+    def add(self, entry: StandInConfigEntry) -> None:
+        """Add an entry; it is set up by the integration."""
+        self._entries.append(entry)
+
+    def async_entries(self, domain=None) -> list:
+        """Return all entries."""
+        return list(self._entries)
+
+    async def async_forward_entry_setups(self, entry, platforms) -> None:
+        """Set up the platforms of an entry and attach its entities."""
+        entity_platform.current_platform.set(StandInPlatform())
+        entities = self._entities.setdefault(entry.entry_id, [])
+        for platform in platforms:
+            module = importlib.import_module(f"{integration.__name__}.{platform}")
+            added: list = []
+            await module.async_setup_entry(
+                self._hass, entry, lambda new, update_before_add=False: added.extend(new)
+            )
+            for entity in added:
+                entity.async_write_ha_state = _no_state
+                if isinstance(entity, light.GoveeRazerStrip):
+                    # The shared services part of async_added_to_hass
+                    entity.attach()
+            entities.extend(added)
+
+    async def async_unload_platforms(self, entry, platforms) -> bool:
+        """Remove the entities of an entry."""
+        for entity in self._entities.pop(entry.entry_id, []):
+            if isinstance(entity, light.GoveeRazerStrip):
+                await entity.async_will_remove_from_hass()
+        return True
+
+
+class LoopbackSink:
+    """Count the packets sent to each strip, on a thread of its own.
+
+    Receiving happens off the measured event loop, so counting does not
+    add to its load.
+    """
+
+    def __init__(self, count: int):
+        """Bind one UDP socket per strip on 127.0.0.2 and up."""
+        self._selector = selectors.DefaultSelector()
+        self.addresses: list = []
+        self.frames = [0] * count
+        self.enables = [0] * count
+        for index in range(count):
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            sock.bind((f"127.0.0.{index + 2}", 0))
+            sock.setblocking(False)
+            self._selector.register(sock, selectors.EVENT_READ, index)
+            self.addresses.append(sock.getsockname())
+        self._prefix = len(GoveeProtocol.JSON_PREFIX)
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="sink", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        """Receive and classify packets until closed."""
+        prefix = self._prefix
+        while self._running:
+            for key, _ in self._selector.select(0.1):
+                sock, index = key.fileobj, key.data
+                while True:
+                    try:
+                        data = sock.recv(65536)
+                    except BlockingIOError:
+                        break
+                    # The command is the 4th byte of the base64 payload
+                    command = base64.b64decode(data[prefix:prefix + 8])[3]
+                    if command == GoveeProtocol.CMD_LED_DATA:
+                        self.frames[index] += 1
+                    elif command == GoveeProtocol.CMD_ENABLE:
+                        self.enables[index] += 1
+
+    def reset(self) -> None:
+        """Reset the counters."""
+        self.frames = [0] * len(self.frames)
+        self.enables = [0] * len(self.enables)
+
+    def close(self) -> None:
+        """Stop receiving and close the sockets."""
+        self._running = False
+        self._thread.join()
+        for key in list(self._selector.get_map().values()):
+            key.fileobj.close()
+        self._selector.close()
+
+
+class LagSampler:
+    """Sample event loop lag and executor queue depth."""
+
+    def __init__(self, hass: StandInHass):
+        """Initialize the sampler; start() begins sampling."""
+        self._hass = hass
+        self._handle = None
+        self._due = 0.0
+        self.lags: list = []
+        self.queue: list = []
+
+    def start(self) -> None:
+        """Start sampling."""
+        self._due = self._hass.loop.time() + LAG_SAMPLE_INTERVAL
+        self._handle = self._hass.loop.call_at(self._due, self._sample)
+
+    def reset(self) -> None:
+        """Drop the samples taken so far."""
+        self.lags = []
+        self.queue = []
+
+    def stop(self) -> None:
+        """Stop sampling."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def _sample(self) -> None:
+        loop = self._hass.loop
+        self.lags.append(max(loop.time() - self._due, 0.0))
+        self.queue.append(self._hass.executor_queue)
+        self._due = loop.time() + LAG_SAMPLE_INTERVAL
+        self._handle = loop.call_at(self._due, self._sample)
+
+
+def _no_state() -> None:
+    """Replace async_write_ha_state; the stand-in has no state machine."""
+
+
+async def _async_setup_fleet(hass: StandInHass, sink: LoopbackSink, args) -> list:
+    """Set up every entry through the integration; return the strips."""
+    await integration.async_setup(hass, {})
+
+    strips = []
+    for index, (host, port) in enumerate(sink.addresses):
+        priority = PRIORITIES[index % len(PRIORITIES)] if args.mixed_priority else "normal"
+        config = {
+            CONF_HOST: host,
+            CONF_NAME: f"Strip {index + 1}",
+            CONF_PORT: port,
+            CONF_NUM_LEDS: args.leds,
+            CONF_NUM_SECTIONS: args.sections,
+            CONF_UPDATE_INTERVAL: args.interval,
+            CONF_RENDER_BACKEND: args.backend,
+            CONF_PRIORITY: priority,
+        }
+        entry = StandInConfigEntry(f"harness_{index}", config)
+        hass.config_entries.add(entry)
+        await integration.async_setup_entry(hass, entry)
+        coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+        strip = coordinator.strip_entity
+
+        manager = strip.color_manager
+        for section in range(args.sections):
+            hue = (index * 7 + section * 53) % 256
+            manager.set_section_color(section, (hue, (hue * 3) % 256, 255 - hue))
+        coordinator.update_parameters(
+            amplitude=args.amplitude,
+            speed=args.speed,
+            color_flow_speed=args.color_flow_speed,
+        )
+        strips.append(strip)
+
+    if args.no_governor:
+        # Stopped governors keep every strip at the normal level
+        hass.data[DOMAIN]["governor"].async_stop()
+    return strips
+
+
+def _percentile(values: list, fraction: float) -> float:
+    """Return a percentile of sorted values."""
+    return values[min(int(len(values) * fraction), len(values) - 1)]
+
+
+async def run(args) -> int:
+    """Run the harness and print the report."""
+    loop = asyncio.get_running_loop()
+    config_dir = tempfile.mkdtemp(prefix="govee_harness_")
+    hass = StandInHass(loop, config_dir, args.executor_workers)
+    sink = LoopbackSink(args.strips)
+    sampler = LagSampler(hass)
+    strips: list = []
+    try:
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+        strips = await _async_setup_fleet(hass, sink, args)
+        for strip in strips:
+            await strip.async_turn_on(effect=args.effect)
+        await asyncio.sleep(MEMORY_WINDOW)
+        memory = (tracemalloc.get_traced_memory()[0] - baseline) / args.strips
+        tracemalloc.stop()
+
+        sampler.start()
+        await asyncio.sleep(args.warmup)
+        sampler.reset()
+        sink.reset()
+        start = time.monotonic()
+        await asyncio.sleep(args.duration)
+        elapsed = time.monotonic() - start
+        frames = list(sink.frames)
+        enables = sum(sink.enables)
+        lags = sorted(sampler.lags)
+        queue = list(sampler.queue)
+        governor = None if args.no_governor else hass.data[DOMAIN].get("governor")
+        governor_state = None if governor is None else governor.as_dict()
+    finally:
+        sampler.stop()
+        for strip in strips:
+            await strip.async_turn_off()
+        for entry in hass.config_entries.async_entries(DOMAIN):
+            await integration.async_unload_entry(hass, entry)
+            entry.async_unloaded()
+        hass.shutdown()
+        sink.close()
+
+    target = 1 / args.interval
+    fps = sorted(count / elapsed for count in frames)
+    lag_mean = statistics.mean(lags) * 1000
+    lag_p99 = _percentile(lags, 0.99) * 1000
+    print(
+        f"strips              {args.strips} ({args.leds} LEDs, {args.sections} sections,"
+        f" {args.effect}, {args.backend} backend)"
+    )
+    print(f"window              {elapsed:.1f} s after {args.warmup:.1f} s warm-up")
+    print(f"loop lag ms         mean {lag_mean:.2f}  p99 {lag_p99:.2f}  max {lags[-1] * 1000:.2f}")
+    print(
+        f"fps per strip       target {target:.1f}  mean {statistics.mean(fps):.1f}"
+        f"  min {fps[0]:.1f}  max {fps[-1]:.1f}"
+    )
+    print(f"executor queue      mean {statistics.mean(queue):.2f}  max {max(queue)}")
+    print(f"memory per strip    {memory / 1024:.1f} KiB")
+    print(
+        f"packets/s           {(sum(frames) + enables) / elapsed:.1f}"
+        f" (frames {sum(frames) / elapsed:.1f}, keep-alives {enables / elapsed:.1f})"
+    )
+    if governor_state is not None:
+        levels = {level: 0 for level in LOAD_LEVELS}
+        for strip_state in governor_state["strips"].values():
+            levels[strip_state["level"]] += 1
+        print(
+            f"governor            {len(governor_state['actions'])} actions, levels "
+            + ", ".join(f"{level} {count}" for level, count in levels.items() if count)
+        )
+    if args.verbose:
+        for strip, count in zip(strips, frames):
+            print(f"  {strip.name:<20} {count / elapsed:6.1f} fps")
+
+    failed = False
+    if lag_p99 > args.max_lag_ms:
+        print(f"FAIL: p99 loop lag {lag_p99:.2f} ms over {args.max_lag_ms} ms")
+        failed = True
+    if statistics.mean(fps) < args.min_fps * target:
+        print(f"FAIL: mean fps below {args.min_fps:.0%} of the target")
+        failed = True
+    return 1 if failed else 0
+
+
+def main() -> int:
+    """Parse arguments and run the harness."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--strips", type=int, default=50)
+    parser.add_argument("--leds", type=int, default=100)
+    parser.add_argument("--sections", type=int, default=5)
+    parser.add_argument("--interval", type=float, default=0.05)
+    parser.add_argument("--effect", default="stretched")
+    parser.add_argument("--backend", choices=RENDER_BACKENDS, default=RENDER_BACKENDS[0])
+    parser.add_argument("--amplitude", type=int, default=50)
+    parser.add_argument("--speed", type=int, default=30)
+    parser.add_argument("--color-flow-speed", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=20.0, help="measured seconds")
+    parser.add_argument("--warmup", type=float, default=2.0, help="seconds before measuring")
+    parser.add_argument("--executor-workers", type=int, default=8)
+    parser.add_argument(
+        "--mixed-priority", action="store_true", help="cycle strips through low/normal/high"
+    )
+    parser.add_argument("--no-governor", action="store_true", help="disable load shedding")
+    parser.add_argument("--max-lag-ms", type=float, default=20.0, help="p99 loop lag limit")
+    parser.add_argument(
+        "--min-fps", type=float, default=0.9, help="mean fps limit as a share of the target"
+    )
+    parser.add_argument("--verbose", action="store_true", help="print fps per strip")
+    args = parser.parse_args()
+    if not 1 <= args.strips <= 250:
+        parser.error("--strips must be between 1 and 250")
+    if not 1 <= args.leds <= 100:
+        # Same limit as the config flow; the packet holds the count in one byte
+        parser.error("--leds must be between 1 and 100")
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Send E1.31 or DDP test frames, or benchmark the lighting receiver.
+
+Without ``--bench`` it sends a moving rainbow to a host at a fixed frame rate,
+standing in for xLights/LedFx when testing the ``receiver`` option.
+
+With ``--bench`` it starts a receiver in-process on a loopback port, maps
+``--strips`` dummy strips onto it and floods it with packets, then reports
+packet throughput, how many frames were coalesced and the send-to-forward
+latency of the frames that reached a strip.
+
+Usage:
+    python scripts/lighting_packet_generator.py --protocol e131 --host 192.168.1.20
+    python scripts/lighting_packet_generator.py --protocol ddp --bench --strips 8
+"""
+import argparse
+import asyncio
+import colorsys
+import socket
+import statistics
+import sys
+import time
+
+from _loader import load
+
+
+def rainbow(num_leds: int, step: int) -> bytes:
+    """Return an RGB rainbow shifted by step."""
+    data = bytearray()
+    for i in range(num_leds):
+        r, g, b = colorsys.hsv_to_rgb(((i + step) % num_leds) / num_leds, 1.0, 1.0)
+        data += bytes((int(r * 255), int(g * 255), int(b * 255)))
+    return bytes(data)
+
+
+def build_packets(receiver, protocol: str, universe: int, payload: bytes, sequence: int) -> list:
+    """Return the packets carrying one frame."""
+    if protocol == receiver.PROTOCOL_E131:
+        return [receiver.build_e131(universe, sequence, payload)]
+    return [receiver.build_ddp(0, payload, sequence)]
+
+
+def send(args) -> int:
+    """Send frames to a host until interrupted."""
+    receiver = load("receiver")
+    port = args.port or (
+        receiver.E131_PORT if args.protocol == receiver.PROTOCOL_E131 else receiver.DDP_PORT
+    )
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    interval = 1 / args.fps
+    next_frame = time.monotonic()
+    step = 0
+    print(f"Sending {args.protocol} frames to {args.host}:{port} at {args.fps} fps")
+    try:
+        while args.frames == 0 or step < args.frames:
+            payload = rainbow(args.leds, step)
+            for packet in build_packets(receiver, args.protocol, args.universe, payload, step):
+                sock.sendto(packet, (args.host, port))
+            step += 1
+            next_frame += interval
+            time.sleep(max(0.0, next_frame - time.monotonic()))
+    except KeyboardInterrupt:
+        pass
+    print(f"Sent {step} frames")
+    return 0
+
+
+async def bench(args) -> int:
+    """Benchmark the receiver on loopback."""
+    receiver_mod = load("receiver")
+    port = args.port or 15568
+    receiver = receiver_mod.GoveeLightingReceiver(args.protocol, 1 / args.tick_rate, port)
+    if not await receiver.async_start():
+        return 1
+
+    sent_at: dict = {}
+    latencies: list = []
+    frame_size = args.leds * 3
+
+    def on_frame(frame: bytes) -> None:
+        # The first two bytes of every strip's range carry the frame number
+        sequence = int.from_bytes(frame[:2], "big")
+        if sequence in sent_at:
+            latencies.append(time.perf_counter() - sent_at[sequence])
+
+    for index in range(args.strips):
+        receiver.register(args.universe, index * frame_size, frame_size, on_frame)
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.setblocking(False)
+    payload_size = frame_size * args.strips
+    if args.protocol == receiver_mod.PROTOCOL_E131 and payload_size > 512:
+        print("E1.31 carries 512 channels per universe; reduce --leds or --strips")
+        return 1
+
+    start = time.perf_counter()
+    interval = 1 / args.fps if args.fps else 0
+    for sequence in range(args.frames):
+        payload = bytearray(payload_size)
+        for index in range(args.strips):
+            payload[index * frame_size:index * frame_size + 2] = (sequence & 0xFFFF).to_bytes(2, "big")
+        sent_at[sequence & 0xFFFF] = time.perf_counter()
+        for packet in build_packets(receiver_mod, args.protocol, args.universe, bytes(payload), sequence):
+            sock.sendto(packet, ("127.0.0.1", port))
+        # Yield so the receiver can read; with --fps 0 this floods the socket
+        await asyncio.sleep(interval)
+    await asyncio.sleep(3 / args.tick_rate)
+    elapsed = time.perf_counter() - start
+    receiver.close()
+    sock.close()
+
+    stats = receiver.as_dict()
+    print(f"protocol            {args.protocol}")
+    print(f"strips              {args.strips} x {args.leds} LEDs")
+    print(f"packets received    {stats['packets']} / {args.frames}")
+    print(f"packets/s           {stats['packets'] / elapsed:,.0f}")
+    print(f"frames forwarded    {stats['frames_forwarded']}")
+    print(f"frames coalesced    {stats['frames_coalesced']}")
+    if latencies:
+        latencies.sort()
+        print(f"latency mean        {statistics.mean(latencies) * 1000:.2f} ms")
+        print(f"latency p99         {latencies[int(len(latencies) * 0.99)] * 1000:.2f} ms")
+    return 0
+
+
+def main() -> int:
+    """Run the generator."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--protocol", choices=["e131", "ddp"], default="e131")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0, help="0 = protocol default")
+    parser.add_argument("--universe", type=int, default=1)
+    parser.add_argument("--leds", type=int, default=100)
+    parser.add_argument("--fps", type=float, default=40.0, help="0 = as fast as possible (bench)")
+    parser.add_argument("--frames", type=int, default=0, help="0 = until interrupted")
+    parser.add_argument("--bench", action="store_true", help="benchmark an in-process receiver")
+    parser.add_argument("--strips", type=int, default=1)
+    parser.add_argument("--tick-rate", type=float, default=60.0, help="receiver ticks per second")
+    args = parser.parse_args()
+
+    if args.bench:
+        if args.frames == 0:
+            args.frames = 5000
+        return asyncio.run(bench(args))
+    if args.fps <= 0:
+        parser.error("--fps must be positive when sending")
+    return send(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
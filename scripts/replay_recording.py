@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""Replay a frame recording through the renderer and encoder.
+
+Recordings are made with the ``govee_razer_led.start_recording`` service.
+Every recorded frame is re-rendered offline with ``renderer.render_frame`` and
+encoded with ``GoveeProtocol.encode_frame``; the packet must match the
+recorded one byte for byte. Render timings are compared with the live ones,
+and the recorded frame intervals show the update loop's jitter.
+
+Exits non-zero on any mismatch, or when ``--max-slowdown`` is given and the
+mean replay time exceeds the recorded mean by more than that factor.
+
+Stateful animated effects (e.g. fire) only replay identically when the
+recording started together with the effect.
+
+Usage:
+    python scripts/replay_recording.py office.gvrec [--max-slowdown 1.5]
+    python scripts/replay_recording.py --synthesize trace.gvrec --effect rainbow
+"""
+import argparse
+import math
+import mmap
+import statistics
+import sys
+import time
+
+from _loader import load
+
+
+def percentile(values: list, fraction: float) -> float:
+    """Return a percentile of sorted values."""
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def replay(args) -> int:
+    """Replay a recording and compare the output."""
+    recorder = load("recorder")
+    protocol_mod = load("govee_protocol")
+    geometry_mod = load("geometry")
+    renderer = load("renderer")
+
+    with open(args.recording, "rb") as file, mmap.mmap(
+        file.fileno(), 0, access=mmap.ACCESS_READ
+    ) as data:
+        num_leds, num_sections, settings = recorder.read_header(data)
+        geometry = None
+        if settings["geometry"]:
+            geometry = geometry_mod.get_geometry(*settings["geometry"])
+        manager = protocol_mod.GoveeColorManager(
+            num_leds, num_sections, geometry, settings["blend_mode"]
+        )
+        # The socket is created lazily, so nothing is sent
+        protocol = protocol_mod.GoveeProtocol("127.0.0.1")
+        manager.output = protocol.frame_buffer(num_leds)
+
+        frames = 0
+        mismatches = 0
+        recorded_us: list = []
+        replay_us: list = []
+        timestamps: list = []
+        for index, record in enumerate(recorder.iter_records(data)):
+            manager.palette[:] = record.palette
+            gradient = manager.get_effect(record.effect).gradient
+            start = time.perf_counter()
+            renderer.render_frame(
+                manager,
+                record.effect,
+                record.t,
+                record.brightness,
+                record.amplitude,
+                record.speed,
+                record.wave_step,
+                record.rotation,
+                record.fade,
+            )
+            packet = protocol.encode_frame(gradient)
+            replay_us.append((time.perf_counter() - start) * 1e6)
+            recorded_us.append(record.render_us)
+            timestamps.append(record.timestamp)
+            frames += 1
+
+            if record.packet != packet:
+                mismatches += 1
+                if mismatches <= args.show:
+                    expected = bytes(record.packet)
+                    offset = next(
+                        (i for i, (a, b) in enumerate(zip(expected, packet)) if a != b),
+                        min(len(expected), len(packet)),
+                    )
+                    print(
+                        f"frame {index} ({record.effect}, t={record.t:.3f}): "
+                        f"packet differs at byte {offset} "
+                        f"({len(expected)} recorded, {len(packet)} replayed)"
+                    )
+            del record
+
+    if not frames:
+        print("Recording contains no frames")
+        return 1
+
+    recorded_mean = statistics.mean(recorded_us)
+    replay_mean = statistics.mean(replay_us)
+    recorded_us.sort()
+    replay_us.sort()
+    print(
+        f"frames              {frames} ({num_leds} LEDs, {num_sections} sections,"
+        f" {manager.geometry.layout} layout, {settings['blend_mode']} blending)"
+    )
+    print(f"mismatches          {mismatches}")
+    print(f"recorded us/frame   mean {recorded_mean:.1f}  p99 {percentile(recorded_us, 0.99):.1f}")
+    print(f"replay us/frame     mean {replay_mean:.1f}  p99 {percentile(replay_us, 0.99):.1f}")
+    if frames > 1:
+        intervals = sorted(b - a for a, b in zip(timestamps, timestamps[1:]))
+        print(
+            f"frame interval ms   mean {statistics.mean(intervals) * 1000:.2f}"
+            f"  p99 {percentile(intervals, 0.99) * 1000:.2f}"
+            f"  max {intervals[-1] * 1000:.2f}"
+        )
+
+    failed = mismatches > 0
+    if args.max_slowdown and replay_mean > recorded_mean * args.max_slowdown:
+        print(f"replay is {replay_mean / recorded_mean:.2f}x slower than recorded")
+        failed = True
+    return 1 if failed else 0
+
+
+def synthesize(args) -> int:
+    """Write a recording by running the live render path offline."""
+    recorder_mod = load("recorder")
+    protocol_mod = load("govee_protocol")
+    geometry_mod = load("geometry")
+    renderer = load("renderer")
+
+    geometry_args = ()
+    if args.matrix_width:
+        geometry_args = ("matrix", args.leds, args.matrix_width, args.serpentine, ())
+    manager = protocol_mod.GoveeColorManager(
+        args.leds,
+        args.sections,
+        geometry_mod.get_geometry(*geometry_args) if geometry_args else None,
+        args.blend_mode,
+    )
+    for i in range(args.sections):
+        manager.set_section_color(i, ((i * 53) % 256, (i * 97) % 256, (i * 151) % 256))
+    protocol = protocol_mod.GoveeProtocol("127.0.0.1")
+    manager.output = protocol.frame_buffer(args.leds)
+    gradient = manager.get_effect(args.effect).gradient
+    recorder = recorder_mod.GoveeFrameRecorder(
+        args.synthesize,
+        args.leds,
+        args.sections,
+        1 << 30,
+        args.blend_mode,
+        geometry_args,
+    )
+    recorder.open()
+    wave_steps = round((2 * math.pi / (args.speed / 100)) + 1) if args.speed else 100
+    for index in range(args.frames):
+        t = index * 0.05
+        wave_step = index % wave_steps
+        rotation = (index // 10) % args.sections if args.color_flow else None
+        start = time.perf_counter()
+        renderer.render_frame(
+            manager, args.effect, t, 255, args.amplitude, args.speed, wave_step, rotation
+        )
+        packet = protocol.encode_frame(gradient)
+        recorder.record(
+            index * 0.05,
+            time.perf_counter() - start,
+            args.effect,
+            t,
+            255,
+            args.amplitude,
+            args.speed,
+            wave_step,
+            rotation,
+            manager.palette,
+            packet,
+        )
+    recorder.close()
+    print(f"Wrote {recorder.frames} frames ({recorder.nbytes} bytes) to {args.synthesize}")
+    return 0
+
+
+def main() -> int:
+    """Run the replay."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("recording", nargs="?", help="recording to replay")
+    parser.add_argument("--max-slowdown", type=float, default=0.0)
+    parser.add_argument("--show", type=int, default=10, help="mismatches to print")
+    parser.add_argument("--synthesize", metavar="PATH", help="write a synthetic recording")
+    parser.add_argument("--effect", default="stretched")
+    parser.add_argument("--leds", type=int, default=20)
+    parser.add_argument("--sections", type=int, default=5)
+    parser.add_argument("--frames", type=int, default=1000)
+    parser.add_argument("--amplitude", type=int, default=50)
+    parser.add_argument("--speed", type=int, default=30)
+    parser.add_argument("--color-flow", action="store_true")
+    parser.add_argument("--blend-mode", default="srgb", choices=("srgb", "linear", "oklab"))
+    parser.add_argument("--matrix-width", type=int, default=0, help="0 for a strip")
+    parser.add_argument("--serpentine", action="store_true")
+    args = parser.parse_args()
+
+    if args.synthesize:
+        return synthesize(args)
+    if not args.recording:
+        parser.error("a recording is required")
+    return replay(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())